@@ -1,18 +1,25 @@
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Imports: Core Flask Modules, CORS Handling, and Internal Pipeline Utilities
+#   MLflow and TensorFlow (via cnnClassifier.pipeline.prediction) are imported where
+#   they are first used, so importing app.py stays cheap: the gunicorn master and
+#   /livez never pay for TensorFlow.
 # ────────────────────────────────────────────────────────────────────────────────────────
-import os                                                                                 # Environment variable setup
-import mlflow
-import mlflow.keras
+import os                                                                                         # Environment variable setup
+import time
+import threading
 
-from mlflow.tracking                   import MlflowClient
-from pathlib                           import Path
-from flask                             import Flask, request, jsonify, render_template    # Flask app and API routing
-from flask_cors                        import CORS, cross_origin                          # Enable cross-origin requests
-from cnnClassifier.utils.common        import decodeImage                                 # Base64 image decoding utility
-from cnnClassifier.pipeline.prediction import PredictionPipeline                          # Prediction pipeline wrapper
+from pathlib                                   import Path
+from concurrent.futures                        import TimeoutError as FutureTimeoutError
+from flask                                     import Flask, request, jsonify, render_template, g, Response    # Flask app and API routing
+from flask_cors                                import CORS, cross_origin                          # Enable cross-origin requests
+from cnnClassifier.utils.common                import decode_base64_image, configure_tf_threading # Base64 decoding, CPU threads
+from cnnClassifier.components.micro_batcher    import MicroBatcher, QueueFullError, DeadlineExceededError  # Batching + admission control
+from cnnClassifier.components.prediction_cache import PredictionCache                             # Content-addressed result cache
+from cnnClassifier.components.model_watcher    import ModelWatcher                                # Hot model reload from the registry
+from cnnClassifier.components.model_cache      import ModelArtifactCache                          # Content-verified local model cache
+from cnnClassifier.components.serving_metrics  import ServingMetrics                              # Prometheus metrics for /metrics
+from cnnClassifier.config.configuration        import ConfigurationManager                        # Typed serving config
 
-from cnnClassifier.utils.common        import read_yaml                                   # Utility to load yaml
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Environment Locale Setup: Ensures UTF-8 Compatibility for Image and Log Handling
 # ────────────────────────────────────────────────────────────────────────────────────────
@@ -23,54 +30,218 @@ os.putenv('LC_ALL', 'en_US.UTF-8')
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Flask App Initialization and CORS Configuration
 # ────────────────────────────────────────────────────────────────────────────────────────
-app = Flask(__name__)
+app   = Flask(__name__)
 CORS(app)
 
+clApp = None                                                      # Set in __main__, or by the gunicorn hooks in gunicorn.conf.py
+
+# Per-process metrics; each gunicorn worker exposes its own series at /metrics, labelled with its pid
+metrics = ServingMetrics(queue_depth_fn=lambda: clApp.batcher.stats()["queue_depth"] if clApp and clApp.batcher else 0)
+
 
 # ────────────────────────────────────────────────────────────────────────────────────────
-# ClientApp Wrapper: Holds Filename and Prediction Pipeline Instance
+# ClientApp Wrapper: Holds Prediction Pipeline, Request Batcher and Prediction Cache
 # ────────────────────────────────────────────────────────────────────────────────────────
 class ClientApp:
-    def __init__(self):
-        self.filename = "inputImage.jpg"                          # Default filename for incoming image
+    def __init__(self, load: bool = True):
+        """
+        Args:
+            load (bool) : Load the model and start background threads right away.
+                          The gunicorn master passes False: it only stages the model
+                          before forking, and each worker loads/starts after the fork.
+        """
+        self.classifier    = None                                 # Set by load_model()
+        self.model_version = None                                 # Registry version behind the classifier
+        self.staged_model  = None                                 # (version, local path) from stage_model()
+        self.batcher       = None                                 # Created by start(), once per process
+        self.watcher       = None                                 # Registry poller, created by start()
+        self._swap_lock    = threading.Lock()                     # Guards classifier/model_version swaps
+        self.ready         = threading.Event()                    # Set once a warmed-up model is serving
         
         # get mlflow URI in secured way
         from dotenv import load_dotenv
         load_dotenv()
         mlflow_uri = os.environ.get("MLFLOW_TRACKING_URI")
 
-        # get registered_model_name parameter from config file
-        config                = read_yaml(Path("config/config.yaml"))
-        registered_model_name = config["mlflow"]["registered_model_name"]
+        # get registered_model_name, batching and cache parameters from config file
+        self.serving_config = ConfigurationManager().get_serving_config()
+        self.cache          = PredictionCache(
+                                                max_entries = self.serving_config.cache_max_entries,
+                                                ttl_seconds = self.serving_config.cache_ttl_seconds,
+                                                retry_on    = (QueueFullError, DeadlineExceededError)  # Per-request admission
+                                             )
+        self.model_cache    = ModelArtifactCache(self.serving_config.model_cache_dir)
+        self._threads_set   = False                               # Thread topology applied in this process
 
         # Set MLflow tracking URI
+        import mlflow
         mlflow.set_tracking_uri(mlflow_uri)
 
-        # Load model from MLflow registry
-        try:
-            # Get latest version in Production stage
-            client              = MlflowClient()
-            latest_version_info = client.get_latest_versions(registered_model_name, stages=["Production"])[0]
-            model_version       = latest_version_info.version
+        if load:
+            self.load_model()
+            self.start()
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Stage Model: Resolve the Production version to a verified local copy
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def stage_model(self):
+        """
+        Resolves the Production version with a cheap registry lookup and returns a
+        verified local copy from the model cache, downloading only on a cache miss.
+        When the registry is unreachable the newest cached version is used.
+        Only MLflow and filesystem work happens here (no TensorFlow runtime), so
+        the gunicorn master can run it before forking its workers.
+
+        Returns:
+            tuple : (model_version, local_model_path)
+        """
+        registered_model_name = self.serving_config.registered_model_name
+
+        model_version, local_path = self.model_cache.resolve(registered_model_name, stage="Production")
+        print(f"Staged model {registered_model_name} (version {model_version}) at {local_path}")
+
+        self.staged_model   = (model_version, local_path)
+        return self.staged_model
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Load Model: Build the prediction pipeline from the staged local copy
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def load_model(self):
+        registered_model_name = self.serving_config.registered_model_name
 
-            # Construct model URI with version
-            model_uri           = f"models:/{registered_model_name}/Production"
-            print(f"Loading model from MLflow registry ==> {model_uri} (version {model_version})")
+        # Load model from MLflow registry (via the local staged copy)
+        try:
+            model_version, local_path = self.staged_model or self.stage_model()
+            print(f"Loading model {registered_model_name} (version {model_version}) from {local_path}")
 
-            # Load model
-            model               = mlflow.keras.load_model(model_uri)
-            self.classifier     = PredictionPipeline(self.filename, model=model)
+            self.swap_classifier(self.build_classifier(local_path), model_version)
 
             # Confirm model loaded
             assert self.classifier.model is not None, "Model failed to load from MLflow"
             print(f"Model loaded successfully: {registered_model_name}, version: {model_version}, stage: Production")
         except Exception as e:
+            # Not ready; the watcher keeps polling and its first successful swap sets ready
             print(f"Failed to load model from MLflow registry: {e}")
-            self.classifier = None
+            self.classifier    = None
+            self.model_version = None
+            self.ready.clear()
+
+    def build_classifier(self, local_path: str) -> "PredictionPipeline":
+        """
+        Loads the model for the configured backend and warms it up. The Keras backend
+        loads the local MLflow model directory; a tflite_<variant> backend loads
+        tflite/model_<variant>.tflite from that same registry version, so the
+        served weights always match the resolved version.
+
+        Raises:
+            FileNotFoundError : The registry version has no such TFLite variant.
+        """
+        # Per-process thread topology, before TensorFlow is imported and runs its first op
+        if not self._threads_set:
+            configure_tf_threading(
+                                    self.serving_config.intra_op_threads,
+                                    self.serving_config.inter_op_threads,
+                                    self.serving_config.onednn_opts
+                                  )
+            self._threads_set = True
+
+        from cnnClassifier.pipeline.prediction import PredictionPipeline, TFLiteModel   # Pulls in TensorFlow
+
+        backend    = self.serving_config.backend
+        if backend == "keras":
+            import mlflow.keras
+            model  = mlflow.keras.load_model(local_path)
+        elif backend.startswith("tflite_"):
+            path   = Path(local_path) / "tflite" / f"model_{backend[len('tflite_'):]}.tflite"
+            if not path.is_file():
+                raise FileNotFoundError(f"Backend {backend} needs {path.name}, which this registry version does not "
+                                        f"contain; run the quantization stage before evaluation registers the model")
+            model  = TFLiteModel(path, num_threads=self.serving_config.intra_op_threads or None)
+        else:
+            raise ValueError(f"Unsupported serving backend: {backend}")
+
+        classifier = PredictionPipeline(model=model)
+
+        started    = time.perf_counter()
+        classifier.warmup(self.serving_config.warmup_batch_sizes)
+        print(f"Warm-up over batch sizes {self.serving_config.warmup_batch_sizes} took {time.perf_counter() - started:.2f}s")
+        return classifier
+
+    def swap_classifier(self, classifier: "PredictionPipeline", model_version):
+        """
+        Atomically makes `classifier` the active model. A batch already running
+        keeps the classifier it started with, so in-flight requests are not dropped.
+        Also marks the process ready, so a worker whose startup load failed
+        recovers on the watcher's first successful reload.
+        """
+        with self._swap_lock:
+            self.classifier    = classifier
+            self.model_version = model_version
 
+            # Cached predictions from any other version are now stale
+            self.cache.set_model_version(model_version)
+            metrics.model_version.replace(1, version=model_version, backend=self.serving_config.backend)
 
+            # Warm-up ran inside build_classifier, so traffic never hits a cold model
+            self.ready.set()
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Start: Per-process background threads (threads do not survive a fork)
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def start(self):
+        # Concurrent /predict calls share forward passes through the batcher
+        if self.batcher is None:
+            self.batcher = MicroBatcher(
+                                         predict_fn     = self._predict_batch,
+                                         max_batch_size = self.serving_config.max_batch_size,
+                                         max_wait_ms    = self.serving_config.max_wait_ms,
+                                         max_queue_size = self.serving_config.max_queue_size
+                                       )
+
+        # Follow new Production versions without a restart
+        if self.watcher is None and self.serving_config.reload_poll_seconds > 0:
+            self.watcher = ModelWatcher(self, poll_interval_s=self.serving_config.reload_poll_seconds)
+            self.watcher.start()
+
+    def _predict_batch(self, batch):
+        """Dispatches a batch to whichever classifier is current when the batch runs."""
+        started = time.perf_counter()
+        results = self.classifier.predict_batch(batch)
+        metrics.observe_batch(len(batch), time.perf_counter() - started)
+        return results
+
+    def predict(self, data: bytes, deadline: float = None):
+        """
+        Serves one encoded image through the cache, the batcher and the model.
+
+        Args:
+            data (bytes)     : Encoded image.
+            deadline (float) : Absolute `time.monotonic()` after which the result is useless.
+        """
+        def compute():
+            with metrics.stage_seconds.time(stage="image_decode"):
+                image = self.classifier.preprocess(data)          # Decode + resize
+            return self.batcher.predict(image, deadline=deadline)
+
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return self.cache.get_or_compute(data, compute, timeout=timeout)
 
 
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Request Hooks: Total request time, request and error counts per route
+# ────────────────────────────────────────────────────────────────────────────────────────
+@app.before_request
+def _start_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def _record_request(response):
+    started = g.pop("request_started", None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe_request(route, response.status_code, time.perf_counter() - started)
+    return response
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Route: Home Page - Serves Frontend UI from Jinja2 Template
 # ────────────────────────────────────────────────────────────────────────────────────────
@@ -79,12 +250,54 @@ class ClientApp:
 def home():
     return render_template('index.html')                          # Assumes templates/index.html exists
 
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Route: Liveness - The process is up and serving HTTP (no model checks)
+# ────────────────────────────────────────────────────────────────────────────────────────
+@app.route("/livez", methods=["GET"])
+def livez():
+    return jsonify({"alive": True})
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Route: Readiness - True only once a model is loaded and warmed up
+# ────────────────────────────────────────────────────────────────────────────────────────
+@app.route("/readyz", methods=["GET"])
+def readyz():
+    ready = clApp is not None and clApp.ready.is_set()
+    return jsonify({"ready": ready}), (200 if ready else 503)
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Route: To confirm Model Rediness
 # ────────────────────────────────────────────────────────────────────────────────────────
 @app.route("/health", methods=["GET"])
 def health():
-    return jsonify({"model_loaded": clApp.classifier.model is not None})
+    ready = clApp is not None and clApp.ready.is_set()
+    return jsonify({
+                        "model_loaded"  : clApp is not None and clApp.classifier is not None,
+                        "ready"         : ready,
+                        "model_version" : clApp.model_version if clApp is not None else None,
+                        "reload"        : clApp.watcher.stats() if clApp is not None and clApp.watcher else None
+                  }), (200 if ready else 503)
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Route: Prediction Cache Statistics (hits, misses, coalesced requests, evictions)
+# ────────────────────────────────────────────────────────────────────────────────────────
+@app.route("/cache/stats", methods=["GET"])
+def cacheStats():
+    return jsonify(clApp.cache.stats())
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Route: Prometheus Metrics - Stage latencies, request/error counts, batch sizes, queue depth
+# ────────────────────────────────────────────────────────────────────────────────────────
+@app.route("/metrics", methods=["GET"])
+def metricsRoute():
+    return Response(metrics.render(), content_type=ServingMetrics.CONTENT_TYPE)
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Route: Inference Queue Statistics (depth, batch sizes, rejected and expired requests)
+# ────────────────────────────────────────────────────────────────────────────────────────
+@app.route("/queue/stats", methods=["GET"])
+def queueStats():
+    return jsonify(clApp.batcher.stats() if clApp and clApp.batcher else {})
 
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Route: Training Trigger - Executes Full Pipeline via main.py
@@ -103,14 +316,105 @@ def trainRoute():
 @app.route("/predict", methods=['POST'])
 @cross_origin()
 def predictRoute():
+    deadline, rejected = _admit()                                 # Before any decode or hashing work
+    if rejected:
+        return rejected
+
     image = request.json['image']                                 # Expect base64-encoded image in JSON
-    decodeImage(image, clApp.filename)                            # Decode and save image to disk
-    result = clApp.classifier.predict()                           # Run prediction pipeline
+    try:
+        with metrics.stage_seconds.time(stage="base64_decode"):
+            data = decode_base64_image(image)                     # Decode in memory, no disk round-trip
+    except ValueError as e:
+        return jsonify({"error": f"Invalid image: {e}"}), 400
+    return _predict_bytes(data, deadline)
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Route: Binary Prediction API - Raw image/jpeg, image/png body or multipart upload
+# ────────────────────────────────────────────────────────────────────────────────────────
+RAW_IMAGE_MIMETYPES = {"image/jpeg", "image/jpg", "image/png", "application/octet-stream"}
+
+@app.route("/predict/binary", methods=['POST'])
+@cross_origin()
+def predictBinaryRoute():
+    deadline, rejected = _admit()                                 # Before reading the upload
+    if rejected:
+        return rejected
+
+    if request.mimetype == "multipart/form-data":
+        upload = request.files.get("image") or next(iter(request.files.values()), None)
+        if upload is None:
+            return jsonify({"error": "Multipart upload must contain an image file field"}), 400
+        data   = upload.read()                                    # Uploaded file, no base64 step
+    elif request.mimetype in RAW_IMAGE_MIMETYPES:
+        data   = request.get_data(cache=False)                    # Raw request body, no base64 step
+    else:
+        return jsonify({"error": f"Unsupported content type: {request.mimetype}"}), 415
+
+    if not data:
+        return jsonify({"error": "Empty image payload"}), 400
+    return _predict_bytes(data, deadline)
+
+
+DEADLINE_HEADER = "X-Request-Deadline-Ms"                         # Client's latency budget for this request
+
+def _request_deadline():
+    """Absolute monotonic deadline from the header (or config default), counted from request start."""
+    budget_ms = request.headers.get(DEADLINE_HEADER, type=float) or clApp.serving_config.default_deadline_ms
+    if not budget_ms or budget_ms <= 0:
+        return None
+    elapsed_s = time.perf_counter() - g.get("request_started", time.perf_counter())
+    return time.monotonic() + budget_ms / 1000.0 - elapsed_s
+
+
+def _reject(status: int, reason: str, message: str, retry_after_s: int):
+    metrics.rejections.inc(reason=reason)
+    response = jsonify({"error": message})
+    response.headers["Retry-After"] = str(retry_after_s)
+    return response, status
+
+
+def _admit():
+    """
+    Readiness and batcher admission for a request arriving now, checked before its
+    payload is read, decoded or hashed, so an overloaded server sheds it cheaply.
+    This also turns away requests the cache could have answered.
+
+    Returns:
+        tuple : (deadline, None) if admitted, else (None, error response).
+    """
+    if clApp is None or not clApp.ready.is_set():
+        return None, (jsonify({"error": "Model is not ready"}), 503)
+
+    deadline = _request_deadline()
+    try:
+        clApp.batcher.admit(deadline)
+    except QueueFullError as e:
+        return None, _reject(429, "queue_full", str(e), e.retry_after_s)
+    except DeadlineExceededError as e:
+        return None, _reject(503, "deadline", str(e), e.retry_after_s)
+    return deadline, None
+
+
+def _predict_bytes(data: bytes, deadline: float = None):
+    """Shared backend of /predict and /predict/binary: encoded image bytes -> JSON result."""
+    try:
+        result = clApp.predict(data, deadline=deadline)           # Cached, coalesced and batched inference
+    except QueueFullError as e:
+        return _reject(429, "queue_full", str(e), e.retry_after_s)
+    except DeadlineExceededError as e:
+        return _reject(503, "deadline", str(e), e.retry_after_s)
+    except FutureTimeoutError:
+        return _reject(503, "deadline", "Request deadline passed while waiting on an identical request",
+                       clApp.batcher.retry_after_s())
+    except ValueError as e:
+        return jsonify({"error": f"Invalid image: {e}"}), 400
     return jsonify(result)                                        # Return result as JSON response
 
 
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Entry Point: Launch Flask App on Port 8080 (AWS-Compatible Host Binding)
+# Development server only; production uses pre-forked workers: gunicorn -c gunicorn.conf.py app:app
 # ────────────────────────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     clApp = ClientApp()                                           # Instantiate prediction wrapper
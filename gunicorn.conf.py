@@ -0,0 +1,57 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Gunicorn Configuration: Pre-forked multi-process serving for app.py
+#   Usage: gunicorn -c gunicorn.conf.py app:app
+# ────────────────────────────────────────────────────────────────────────────────────────
+import gc
+import os
+
+from cnnClassifier.config.configuration import ConfigurationManager   # Typed serving config
+
+serving_config = ConfigurationManager().get_serving_config()
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Server Socket and Worker Topology
+# ────────────────────────────────────────────────────────────────────────────────────────
+bind           = serving_config.bind
+workers        = int(os.environ.get("WEB_CONCURRENCY", serving_config.workers))
+threads        = serving_config.threads                 # Threads per worker feed one shared micro-batcher
+worker_class   = "gthread"
+preload_app    = serving_config.preload_model           # Import app.py (and TensorFlow) once in the master
+timeout        = 120                                    # Model load in a fresh worker can take a while
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Master Hook: Resolve and download the model once, before any worker is forked
+# ────────────────────────────────────────────────────────────────────────────────────────
+def when_ready(server):
+    if not preload_app:
+        return
+
+    import app as serving_app
+
+    serving_app.clApp = serving_app.ClientApp(load=False)
+    try:
+        serving_app.clApp.stage_model()                 # Registry lookup + artifact download, no TF runtime
+    except Exception as e:
+        server.log.warning(f"Model staging in master failed, workers will stage on their own: {e}")
+
+    # Keep the imported modules and master heap out of the garbage collector so
+    # workers do not touch (and copy) those pages after fork.
+    gc.freeze()
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Worker Hook: Load the staged model and start per-process threads after fork
+# ────────────────────────────────────────────────────────────────────────────────────────
+def post_worker_init(worker):
+    import app as serving_app
+
+    # TensorFlow's runtime is not fork-safe once initialised, so the model is
+    # only ever loaded inside the worker, from the local copy staged above.
+    # With a tflite_* backend every worker memory-maps that same file, so the
+    # weights sit once in the page cache instead of once per worker (keras).
+    if serving_app.clApp is None:
+        serving_app.clApp = serving_app.ClientApp(load=False)
+
+    serving_app.clApp.load_model()
+    serving_app.clApp.start()
@@ -1,11 +1,24 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# CPU Thread Topology: Applied once, before the stage imports below load TensorFlow
+# (oneDNN is only read at import time)
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier.constants    import PARAMS_FILE_PATH
+from cnnClassifier.utils.common import read_yaml, configure_tf_threading
+
+params = read_yaml(PARAMS_FILE_PATH)
+configure_tf_threading(int(params.INTRA_OP_THREADS), int(params.INTER_OP_THREADS), bool(params.ONEDNN_OPTS))
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Imports: Logger and Stage-Specific Pipeline Classes
 # ────────────────────────────────────────────────────────────────────────────────────────
 from cnnClassifier                                      import logger  # Centralized logger instance
 from cnnClassifier.pipeline.stage_01_data_ingestion     import DataIngestionTrainingPipeline
+from cnnClassifier.pipeline.stage_01b_data_sharding     import DataShardingPipeline
 from cnnClassifier.pipeline.stage_02_prepare_base_model import PrepareBaseModelTrainingPipeline
 from cnnClassifier.pipeline.stage_03_model_trainer      import ModelTrainingPipeline
+from cnnClassifier.pipeline.stage_03b_model_distillation import ModelDistillationPipeline
 from cnnClassifier.pipeline.stage_04_model_evaluation   import EvaluationPipeline
+from cnnClassifier.pipeline.stage_05_model_quantization import ModelQuantizationPipeline
 
 # ────────────────────────────────────────────────────────────────────────────────────────
 # STAGE 01: Data Ingestion
@@ -21,6 +34,22 @@ except Exception as e:
     logger.exception(e)  # Logs full traceback for debugging
     raise e              # Propagates error for upstream visibility
 
+# ────────────────────────────────────────────────────────────────────────────────────────
+# STAGE 01b: Data Sharding (decode / resize once into memory-mappable shards)
+#   Only the "shards" input pipeline reads them
+# ────────────────────────────────────────────────────────────────────────────────────────
+STAGE_NAME = "STAGE 01b: Data Sharding    "
+if params.INPUT_PIPELINE == "shards":
+    try:
+        logger.info("\n" + "*" * 90)
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} started   <<<<<<")
+        data_sharding = DataShardingPipeline()
+        data_sharding.main()
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} completed <<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # STAGE 02: Prepare Base Model
 # ────────────────────────────────────────────────────────────────────────────────────────
@@ -50,6 +79,36 @@ except Exception as e:
     logger.exception(e)
     raise e
 
+# ────────────────────────────────────────────────────────────────────────────────────────
+# STAGE 03b: Model Distillation (small student from the trained model, own MLflow registration)
+#   Opt-in with DISTILL
+# ────────────────────────────────────────────────────────────────────────────────────────
+STAGE_NAME = "STAGE 03b: Model Distillation"
+if params.DISTILL:
+    try:
+        logger.info("\n" + "*" * 90)
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} started   <<<<<<")
+        model_distillation = ModelDistillationPipeline()
+        model_distillation.main()
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} completed <<<<<<")
+    except Exception as e:
+        logger.exception(e)
+        raise e
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# STAGE 05: Model Quantization (TFLite export; runs before evaluation, which registers the variants)
+# ────────────────────────────────────────────────────────────────────────────────────────
+STAGE_NAME = "STAGE 05: Model Quantization"
+try:
+    logger.info("\n" + "*" * 90)
+    logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} started   <<<<<<")
+    model_quantization = ModelQuantizationPipeline()
+    model_quantization.main()
+    logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} completed <<<<<<")
+except Exception as e:
+    logger.exception(e)
+    raise e
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # STAGE 04: Model Evaluation
 # ────────────────────────────────────────────────────────────────────────────────────────
@@ -63,4 +122,4 @@ try:
     logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} completed <<<<<<")
 except Exception as e:
     logger.exception(e)
-    raise e
\ No newline at end of file
+    raise e
@@ -0,0 +1,117 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Backbone Comparison: Params, FLOPs, CPU latency and accuracy per registered backbone
+#
+#   python scripts/backbone_comparison.py                            # every backbone, training data
+#   python scripts/backbone_comparison.py --backbones vgg16 mobilenet_v2 efficientnet_b0
+#   python scripts/backbone_comparison.py --steps 200 --weights imagenet
+#
+# Every backbone gets the same classification head (HEAD_TYPE), the same
+# batches and the same number of head-training steps (backbone frozen), and is
+# then scored on the validation split. Reported per backbone: total / trainable
+# parameters, forward FLOPs per image (multiply and add counted separately), CPU
+# latency at batch 1 and at --batch-size, and validation accuracy. Pick one and
+# set it as prepare_base_model.base_model_type in config.yaml.
+# ────────────────────────────────────────────────────────────────────────────────────────
+import time
+import json
+import argparse
+import statistics
+
+from   pathlib import Path
+
+import numpy      as np
+import tensorflow as tf
+
+from tensorflow.python.framework.convert_to_constants import convert_variables_to_constants_v2_as_graph
+
+from cnnClassifier.config.configuration          import ConfigurationManager
+from cnnClassifier.components.prepare_base_model import PrepareBaseModel
+from cnnClassifier.components.input_pipeline     import DirectoryDataset
+from cnnClassifier.components.backbones          import BACKBONES, build_backbone
+
+
+def flops_per_image(model: tf.keras.Model, image_size: list) -> int:
+    forward  = tf.function(lambda x: model(x, training=False))
+    concrete = forward.get_concrete_function(tf.TensorSpec([1, *image_size], tf.float32))
+    _, graph_def = convert_variables_to_constants_v2_as_graph(concrete)
+    with tf.Graph().as_default() as graph:
+        tf.graph_util.import_graph_def(graph_def, name="")
+        options = tf.compat.v1.profiler.ProfileOptionBuilder(tf.compat.v1.profiler.ProfileOptionBuilder.float_operation()).with_empty_output().build()
+        return tf.compat.v1.profiler.profile(graph, options=options).total_float_ops
+
+
+def latency_ms(model: tf.keras.Model, image_size: list, batch_size: int, repeats: int) -> float:
+    forward = tf.function(lambda x: model(x, training=False))
+    batch   = tf.constant(np.random.default_rng(0).random([batch_size, *image_size], dtype=np.float32))
+    for _ in range(3):
+        forward(batch).numpy()                                    # Trace + warm up
+    times   = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        forward(batch).numpy()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000.0
+
+
+def run_backbone(name: str, data: DirectoryDataset, size: list, params, args) -> dict:
+    model = PrepareBaseModel._prepare_full_model(
+                                                    model         = build_backbone(name, size, weights=args.weights),
+                                                    classes       = len(data.class_names),
+                                                    freeze_all    = True,
+                                                    freeze_till   = params.FREEZE_TILL,
+                                                    learning_rate = args.learning_rate,
+                                                    head_type     = str(params.HEAD_TYPE),
+                                                    head_units    = int(params.HEAD_UNITS),
+                                                    head_rank     = int(params.HEAD_RANK)
+                                                 )
+    tf.keras.utils.set_random_seed(42)
+    model.fit(data.dataset("training", shuffle=True), epochs=1, steps_per_epoch=args.steps, verbose=0)
+    _, accuracy = model.evaluate(data.dataset("validation", shuffle=False, repeat=False), verbose=0)
+
+    return {
+                "backbone"          : name,
+                "params"            : int(model.count_params()),
+                "trainable_params"  : int(sum(np.prod(w.shape) for w in model.trainable_weights)),
+                "gflops_per_image"  : flops_per_image(model, size) / 1e9,
+                "latency_ms_b1"     : latency_ms(model, size, 1, args.latency_repeats),
+                "latency_ms_batch"  : latency_ms(model, size, args.batch_size, args.latency_repeats),
+                "val_accuracy"      : float(accuracy)
+           }
+
+
+def main():
+    training = ConfigurationManager().get_training_config()
+    params   = ConfigurationManager().params
+
+    parser = argparse.ArgumentParser(description="Compare the registered backbones on this host.")
+    parser.add_argument("--backbones",       nargs="*", default=list(BACKBONES), choices=list(BACKBONES))
+    parser.add_argument("--data",            default=str(training.training_data), help="One sub-directory per class")
+    parser.add_argument("--image-size",      type=int,   default=int(params.IMAGE_SIZE[0]))
+    parser.add_argument("--batch-size",      type=int,   default=int(params.BATCH_SIZE))
+    parser.add_argument("--steps",           type=int,   default=50,  help="Head-training steps per backbone")
+    parser.add_argument("--latency-repeats", type=int,   default=20)
+    parser.add_argument("--learning-rate",   type=float, default=float(params.LEARNING_RATE_HEAD))
+    parser.add_argument("--weights",         default=params.WEIGHTS, help="Backbone weights: imagenet or none")
+    parser.add_argument("--output",          default="artifacts/backbone_comparison.json")
+    args   = parser.parse_args()
+
+    size   = [args.image_size, args.image_size, 3]
+    data   = DirectoryDataset(args.data, size, args.batch_size, validation_split=0.20, cache="memory")
+
+    results = []
+    for name in args.backbones:
+        result = run_backbone(name, data, size, params, args)
+        results.append(result)
+        print(f"{name:20} params {result['params'] / 1e6:6.1f} M   {result['gflops_per_image']:7.2f} GFLOPs   "
+              f"b1 {result['latency_ms_b1']:7.1f} ms   b{args.batch_size} {result['latency_ms_batch']:8.1f} ms   "
+              f"val acc {result['val_accuracy']:.3f}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"image_size": size, "batch_size": args.batch_size, "steps": args.steps, "weights": str(args.weights), "results": results}, f, indent=4)
+    print(f"Saved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Head Comparison: Size, latency and head-training cost per HEAD_TYPE
+#
+#   python scripts/head_comparison.py                                # every head, configured backbone
+#   python scripts/head_comparison.py --heads flatten_dense gap low_rank --backbone mobilenet_v2
+#   python scripts/head_comparison.py --epochs 20 --weights imagenet
+#
+# All heads sit on the same backbone instance. Backbone features of the training and
+# validation split are computed once; each head is then trained on them for the same
+# number of epochs (the FREEZE_ALL head phase with the feature cache) and scored on
+# the validation features. Reported per head: head / total parameters, .h5 file
+# size, CPU latency of the full model at batch 1 and at --batch-size, median
+# head-training step time and validation accuracy. Set the choice as HEAD_TYPE in
+# params.yaml.
+# ────────────────────────────────────────────────────────────────────────────────────────
+import time
+import json
+import argparse
+import tempfile
+import statistics
+
+from   pathlib import Path
+
+import numpy      as np
+import tensorflow as tf
+
+from cnnClassifier.config.configuration          import ConfigurationManager
+from cnnClassifier.components.prepare_base_model import PrepareBaseModel
+from cnnClassifier.components.input_pipeline     import DirectoryDataset
+from cnnClassifier.components.backbones          import BACKBONES, build_backbone, get_backbone
+
+
+class StepTimer(tf.keras.callbacks.Callback):
+    def on_train_begin(self, logs=None):
+        self.times = []
+
+    def on_train_batch_begin(self, batch, logs=None):
+        self.started = time.perf_counter()
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.times.append(time.perf_counter() - self.started)
+
+
+def features(backbone: tf.keras.Model, data: DirectoryDataset, subset: str):
+    images, labels = [], []
+    for x, y in data.dataset(subset, shuffle=False, repeat=False):
+        images.append(backbone(x, training=False).numpy())
+        labels.append(y.numpy())
+    return np.concatenate(images), np.concatenate(labels)
+
+
+def latency_ms(model: tf.keras.Model, batch_size: int, repeats: int) -> float:
+    forward = tf.function(lambda x: model(x, training=False))
+    batch   = tf.constant(np.random.default_rng(0).random([batch_size, *model.input_shape[1:]], dtype=np.float32))
+    for _ in range(3):
+        forward(batch).numpy()                                    # Trace + warm up
+    times   = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        forward(batch).numpy()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000.0
+
+
+def run_head(head_type: str, backbone: tf.keras.Model, cut_layer: str, train, valid, classes: int, params, args) -> dict:
+    tf.keras.utils.set_random_seed(42)
+    model = PrepareBaseModel._prepare_full_model(
+                                                    model         = backbone,
+                                                    classes       = classes,
+                                                    freeze_all    = True,
+                                                    freeze_till   = params.FREEZE_TILL,
+                                                    learning_rate = args.learning_rate,
+                                                    head_type     = head_type,
+                                                    head_units    = int(params.HEAD_UNITS),
+                                                    head_rank     = int(params.HEAD_RANK)
+                                                 )
+
+    # Head-only model on the cached features, as in Training.train_head_on_features
+    cut     = model.get_layer(cut_layer)
+    inputs  = tf.keras.Input(shape=cut.output.shape[1:])
+    x       = inputs
+    for layer in model.layers[model.layers.index(cut) + 1:]:
+        x   = layer(x)
+    head    = tf.keras.Model(inputs, x)
+    head.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=args.learning_rate), loss="categorical_crossentropy", metrics=["accuracy"])
+
+    timer   = StepTimer()
+    head.fit(*train, batch_size=args.batch_size, epochs=args.epochs, callbacks=[timer], verbose=0)
+    _, accuracy = head.evaluate(*valid, batch_size=args.batch_size, verbose=0)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        path = Path(scratch) / "model.h5"
+        model.save(path)
+        size = path.stat().st_size
+
+    return {
+                "head_type"          : head_type,
+                "head_params"        : int(head.count_params()),
+                "total_params"       : int(model.count_params()),
+                "h5_mb"              : size / 2**20,
+                "latency_ms_b1"      : latency_ms(model, 1, args.latency_repeats),
+                "latency_ms_batch"   : latency_ms(model, args.batch_size, args.latency_repeats),
+                "head_train_step_ms" : statistics.median(timer.times[1:] or timer.times) * 1000.0,
+                "val_accuracy"       : float(accuracy)
+           }
+
+
+def main():
+    manager  = ConfigurationManager()
+    training = manager.get_training_config()
+    params   = manager.params
+
+    parser = argparse.ArgumentParser(description="Compare classification head types on this host.")
+    parser.add_argument("--heads",           nargs="*", default=list(PrepareBaseModel.HEAD_TYPES), choices=PrepareBaseModel.HEAD_TYPES)
+    parser.add_argument("--backbone",        default=manager.get_prepare_base_model_config().base_model_type, choices=list(BACKBONES))
+    parser.add_argument("--data",            default=str(training.training_data), help="One sub-directory per class")
+    parser.add_argument("--image-size",      type=int,   default=int(params.IMAGE_SIZE[0]))
+    parser.add_argument("--batch-size",      type=int,   default=int(params.BATCH_SIZE))
+    parser.add_argument("--epochs",          type=int,   default=int(params.EPOCHS_HEAD), help="Head-training epochs per head")
+    parser.add_argument("--latency-repeats", type=int,   default=20)
+    parser.add_argument("--learning-rate",   type=float, default=float(params.LEARNING_RATE_HEAD))
+    parser.add_argument("--weights",         default=params.WEIGHTS, help="Backbone weights: imagenet or none")
+    parser.add_argument("--output",          default="artifacts/head_comparison.json")
+    args   = parser.parse_args()
+
+    size     = [args.image_size, args.image_size, 3]
+    data     = DirectoryDataset(args.data, size, args.batch_size, validation_split=0.20)
+    backbone = build_backbone(args.backbone, size, weights=args.weights)
+    train    = features(backbone, data, "training")
+    valid    = features(backbone, data, "validation")
+
+    results = []
+    for head_type in args.heads:
+        result = run_head(head_type, backbone, get_backbone(args.backbone).cut_layer, train, valid, len(data.class_names), params, args)
+        results.append(result)
+        print(f"{head_type:14} head {result['head_params'] / 1e6:7.3f} M params   h5 {result['h5_mb']:7.1f} MB   "
+              f"b1 {result['latency_ms_b1']:7.1f} ms   b{args.batch_size} {result['latency_ms_batch']:8.1f} ms   "
+              f"train step {result['head_train_step_ms']:6.2f} ms   val acc {result['val_accuracy']:.3f}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"backbone": args.backbone, "image_size": size, "batch_size": args.batch_size, "epochs": args.epochs,
+                   "weights": str(args.weights), "results": results}, f, indent=4)
+    print(f"Saved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Import-Time Benchmark: Tracks cold-start cost of the package and entry points
+#
+#   python scripts/import_time_benchmark.py                     # check budgets, exit 1 on regression
+#   python scripts/import_time_benchmark.py --output report.json
+#   python scripts/import_time_benchmark.py --budget-scale 2.0  # slower machine / CI runner
+#
+# Every module is imported in a fresh interpreter, several times, and the median
+# wall time is compared against its budget. Modules listed under "forbidden" must
+# not be loaded as a side effect of the import; that check is machine-independent
+# and catches a heavy dependency creeping back into a module-level import.
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+from   pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY     = ["tensorflow", "mlflow", "matplotlib", "seaborn", "sklearn"]
+
+BUDGETS   = {
+                "cnnClassifier"                                    : {"seconds": 0.3,  "forbidden": HEAVY + ["numpy", "joblib"]},
+                "cnnClassifier.config.configuration"               : {"seconds": 0.5,  "forbidden": HEAVY + ["numpy", "joblib"]},
+                "cnnClassifier.pipeline.stage_01_data_ingestion"   : {"seconds": 1.5,  "forbidden": HEAVY},
+                "app"                                              : {"seconds": 1.0,  "forbidden": HEAVY},
+                "cnnClassifier.components.model_evaluation_mlflow" : {"seconds": 8.0,  "forbidden": ["mlflow", "matplotlib", "seaborn", "sklearn"]},
+            }
+
+PROBE     = """
+import sys, json, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str, forbidden: list, repeats: int) -> dict:
+    env               = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT / "src"), str(REPO_ROOT), env.get("PYTHONPATH")]))
+
+    timings, loaded   = [], set()
+    for _ in range(repeats):
+        process = subprocess.run(
+                                    [sys.executable, "-c", PROBE.format(module=module, forbidden=forbidden)],
+                                    cwd=REPO_ROOT, env=env, capture_output=True, text=True
+                                )
+        if process.returncode != 0:
+            return {"error": process.stderr.strip().splitlines()[-1]}
+        result  = json.loads(process.stdout.strip().splitlines()[-1])  # Last line; logging may print before it
+        timings.append(result["seconds"])
+        loaded.update(result["loaded"])
+
+    return {"median_s": statistics.median(timings), "min_s": min(timings), "forbidden_loaded": sorted(loaded)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark with regression budgets.")
+    parser.add_argument("--repeats",      type=int,   default=5)
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every time budget")
+    parser.add_argument("--modules",      nargs="*",  default=list(BUDGETS), help="Subset of modules to measure")
+    parser.add_argument("--output",       default=None, help="Write the results as JSON")
+    args   = parser.parse_args()
+
+    report, failures = {}, []
+    for module in args.modules:
+        budget         = BUDGETS.get(module, {"seconds": float("inf"), "forbidden": []})
+        result         = measure(module, budget["forbidden"], args.repeats)
+        report[module] = result
+        if "error" in result:
+            failures.append(f"{module}: import failed ({result['error']})")
+            print(f"ERROR  {module}: {result['error']}")
+            continue
+
+        result["budget_s"] = budget["seconds"] * args.budget_scale
+        status = "ok"
+        if result["median_s"] > result["budget_s"]:
+            status = "SLOW"
+            failures.append(f"{module}: {result['median_s']:.3f}s > budget {result['budget_s']:.3f}s")
+        if result["forbidden_loaded"]:
+            status = "HEAVY"
+            failures.append(f"{module}: imports {', '.join(result['forbidden_loaded'])} at module level")
+        print(f"{status:5}  {result['median_s']:7.3f}s  (budget {result['budget_s']:.3f}s)  {module}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+    if failures:
+        print("\nImport-time regressions:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
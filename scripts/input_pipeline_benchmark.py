@@ -0,0 +1,70 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Input Pipeline Benchmark: images/sec of ImageDataGenerator vs tf.data for Training
+#
+#   python scripts/input_pipeline_benchmark.py                 # both modes, training subset
+#   python scripts/input_pipeline_benchmark.py --batches 100 --no-augment
+#
+# Uses the training config (data path, image size, batch size, augmentation, cache)
+# and builds the inputs exactly as Training.train_valid_generator does. Only the
+# input side is timed; no model runs. For tf_data, the first pass fills the cache
+# and later passes read from it, so both numbers are reported.
+# ────────────────────────────────────────────────────────────────────────────────────────
+import json
+import time
+import argparse
+import dataclasses
+
+from   pathlib import Path
+
+from cnnClassifier.config.configuration     import ConfigurationManager
+from cnnClassifier.components.model_trainer import Training
+
+
+def images_per_second(iterator, batches: int) -> float:
+    started, images = time.perf_counter(), 0
+    for _ in range(batches):
+        batch, _ = next(iterator)
+        images  += len(batch)
+    return images / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Training input pipelines.")
+    parser.add_argument("--batches",    type=int, default=50, help="Batches timed per measurement")
+    parser.add_argument("--modes",      nargs="*", default=["generator", "tf_data"])
+    parser.add_argument("--no-augment", action="store_true", help="Time without augmentation")
+    parser.add_argument("--output",     default="artifacts/training/input_pipeline_benchmark.json")
+    args   = parser.parse_args()
+
+    base_config = ConfigurationManager().get_training_config()
+    report      = {"batch_size": base_config.params_batch_size, "batches": args.batches}
+
+    for mode in args.modes:
+        config   = dataclasses.replace(
+                                        base_config,
+                                        params_input_pipeline  = mode,
+                                        params_is_augmentation = base_config.params_is_augmentation and not args.no_augment
+                                      )
+        training = Training(config=config)
+        training.train_valid_generator()
+
+        iterator = iter(training.train_generator)
+        next(iterator)                                            # Exclude start-up (thread pools, tracing)
+        first    = images_per_second(iterator, args.batches)
+        second   = images_per_second(iterator, args.batches)
+        report[mode] = {"images_per_s_first": first, "images_per_s_steady": second}
+        print(f"{mode:10}  {first:8.1f} img/s (first batches)   {second:8.1f} img/s (steady)")
+
+    if "generator" in report and "tf_data" in report:
+        report["speedup_steady"] = report["tf_data"]["images_per_s_steady"] / report["generator"]["images_per_s_steady"]
+        print(f"tf_data speed-up: {report['speedup_steady']:.2f}x")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Saved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
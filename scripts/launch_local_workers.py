@@ -0,0 +1,80 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Launch Local Workers: Multi-worker training with every worker on this host
+#
+#   python scripts/launch_local_workers.py --workers 2             # stage 03, DISTRIBUTION multi_worker
+#   python scripts/launch_local_workers.py --workers 2 -- python my_training.py
+#
+# Each worker is its own process with its own TF_CONFIG (one free localhost port per
+# worker; worker 0 is the chief), so this exercises the same code path as a real
+# cluster. Output lines are prefixed with the worker index. Exits non-zero if any
+# worker fails; the remaining workers are then stopped.
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import subprocess
+
+from   pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+STAGE_03  = REPO_ROOT / "src" / "cnnClassifier" / "pipeline" / "stage_03_model_trainer.py"
+
+
+def free_ports(count: int) -> list:
+    sockets = [socket.socket() for _ in range(count)]
+    for s in sockets:
+        s.bind(("localhost", 0))
+    ports   = [s.getsockname()[1] for s in sockets]
+    for s in sockets:
+        s.close()
+    return ports
+
+
+def stream(index: int, process: subprocess.Popen):
+    for line in process.stdout:
+        sys.stdout.write(f"[worker {index}] {line}")
+        sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run N local multi-worker training processes.")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("command",   nargs=argparse.REMAINDER, help="Command per worker (default: stage 03)")
+    args   = parser.parse_args()
+
+    command = [c for c in args.command if c != "--"] or [sys.executable, str(STAGE_03)]
+    workers = [f"localhost:{port}" for port in free_ports(args.workers)]
+
+    processes = []
+    for index in range(args.workers):
+        env = dict(os.environ)
+        env["TF_CONFIG"]             = json.dumps({"cluster": {"worker": workers}, "task": {"type": "worker", "index": index}})
+        env["TRAINING_DISTRIBUTION"] = "multi_worker"             # Overrides DISTRIBUTION in params.yaml
+        env["PYTHONPATH"]            = os.pathsep.join(filter(None, [str(REPO_ROOT / "src"), env.get("PYTHONPATH")]))
+        processes.append(subprocess.Popen(command, cwd=REPO_ROOT, env=env, text=True,
+                                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT))
+        threading.Thread(target=stream, args=(index, processes[-1]), daemon=True).start()
+    print(f"Started {args.workers} workers: {', '.join(workers)}", flush=True)
+
+    # Wait for all; the first failure stops the rest (they would block in collectives)
+    failed = None
+    while any(p.poll() is None for p in processes):
+        for index, p in enumerate(processes):
+            if p.poll() not in (None, 0) and failed is None:
+                failed = index
+                for other in processes:
+                    if other.poll() is None:
+                        other.terminate()
+        time.sleep(0.5)
+
+    codes = [p.wait() for p in processes]
+    print(f"Exit codes: {codes}", flush=True)
+    sys.exit(0 if all(code == 0 for code in codes) else 1)
+
+
+if __name__ == "__main__":
+    main()
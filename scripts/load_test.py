@@ -0,0 +1,308 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Load Test: Replays prediction requests against a local app.py and reports latency
+#
+#   Closed loop (fixed concurrency):
+#       python scripts/load_test.py --concurrency 8 --duration 30
+#   Open loop (fixed arrival rate, latency measured from the scheduled send time):
+#       python scripts/load_test.py --rate 50 --duration 30 --endpoint binary
+#   Replay recorded payloads ({"image": "<base64>"} or {"path": "<image file>"} per line):
+#       python scripts/load_test.py --requests-file recorded.jsonl --concurrency 4
+#   Start app.py for the run and stop it afterwards:
+#       python scripts/load_test.py --start-server --concurrency 8
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import sys
+import json
+import math
+import time
+import random
+import base64
+import argparse
+import datetime
+import threading
+import subprocess
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from   io                 import BytesIO
+from   pathlib            import Path
+from   concurrent.futures import ThreadPoolExecutor
+
+LOCAL_HOSTS = {"127.0.0.1", "localhost", "::1", "0.0.0.0"}
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Payloads: Recorded JSONL, an image directory, or synthetic images
+# ────────────────────────────────────────────────────────────────────────────────────────
+def load_payloads(args) -> list:
+    """Returns the encoded image bytes to send; requests cycle through this list."""
+    if args.requests_file:
+        payloads = []
+        with open(args.requests_file) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "image" in record:
+                    payloads.append(base64.b64decode(record["image"]))
+                elif "path" in record:
+                    payloads.append(Path(record["path"]).read_bytes())
+        return payloads
+
+    if args.images_dir:
+        suffixes = {".jpg", ".jpeg", ".png"}
+        files    = sorted(p for p in Path(args.images_dir).rglob("*") if p.suffix.lower() in suffixes)
+        return [p.read_bytes() for p in files[:args.unique]]
+
+    from PIL import Image
+    import numpy as np
+
+    rng      = np.random.default_rng(args.seed)
+    payloads = []
+    for _ in range(args.unique):
+        pixels = rng.integers(0, 256, size=(args.image_size, args.image_size, 3), dtype=np.uint8)
+        buffer = BytesIO()
+        Image.fromarray(pixels).save(buffer, format="JPEG", quality=90)
+        payloads.append(buffer.getvalue())
+    return payloads
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# HTTP: One request per call, stdlib only so the harness has no extra dependencies
+# ────────────────────────────────────────────────────────────────────────────────────────
+def build_request(url: str, endpoint: str, payload: bytes) -> urllib.request.Request:
+    if endpoint == "binary":
+        return urllib.request.Request(f"{url}/predict/binary", data=payload,
+                                      headers={"Content-Type": "image/jpeg"}, method="POST")
+    body = json.dumps({"image": base64.b64encode(payload).decode("ascii")}).encode("utf-8")
+    return urllib.request.Request(f"{url}/predict", data=body,
+                                  headers={"Content-Type": "application/json"}, method="POST")
+
+
+def send(url: str, endpoint: str, payload: bytes, timeout: float) -> int:
+    try:
+        with urllib.request.urlopen(build_request(url, endpoint, payload), timeout=timeout) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except Exception:
+        return 0                                                  # Connection error or timeout
+
+
+def get_json(url: str, timeout: float = 5.0):
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return json.loads(response.read())
+    except Exception:
+        return None
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Load Generators
+# ────────────────────────────────────────────────────────────────────────────────────────
+class Recorder:
+    def __init__(self):
+        self.samples = []                                         # (latency_s, status)
+        self._lock   = threading.Lock()
+
+    def add(self, latency_s: float, status: int):
+        with self._lock:
+            self.samples.append((latency_s, status))
+
+
+def run_closed_loop(args, payloads: list, deadline: float, recorder: Recorder):
+    """`concurrency` workers, each sending its next request as soon as the last one returns."""
+    counter = iter(range(sys.maxsize))
+    lock    = threading.Lock()
+
+    def worker():
+        while time.perf_counter() < deadline:
+            with lock:
+                index = next(counter)
+            if args.num_requests and index >= args.num_requests:
+                return
+            started = time.perf_counter()
+            status  = send(args.url, args.endpoint, payloads[index % len(payloads)], args.timeout)
+            recorder.add(time.perf_counter() - started, status)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_open_loop(args, payloads: list, deadline: float, recorder: Recorder):
+    """
+    Sends requests on a fixed schedule (or Poisson arrivals with --poisson) regardless
+    of how fast responses come back. Latency is measured from the scheduled send
+    time so a backed-up server is not hidden by a slowed-down client.
+    """
+    rng       = random.Random(args.seed)
+    scheduled = time.perf_counter()
+    index     = 0
+
+    def fire(intended: float, payload: bytes):
+        status = send(args.url, args.endpoint, payload, args.timeout)
+        recorder.add(time.perf_counter() - intended, status)
+
+    with ThreadPoolExecutor(max_workers=args.max_in_flight) as pool:
+        while scheduled < deadline and not (args.num_requests and index >= args.num_requests):
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, scheduled, payloads[index % len(payloads)])
+            index     += 1
+            scheduled += rng.expovariate(args.rate) if args.poisson else 1.0 / args.rate
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Report
+# ────────────────────────────────────────────────────────────────────────────────────────
+def percentile(sorted_values: list, q: float) -> float:
+    """Nearest-rank percentile of an already sorted list: the ceil(q/100 * n)-th smallest value."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(q * len(sorted_values) / 100.0) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples: list, elapsed_s: float) -> dict:
+    ok        = sorted(latency for latency, status in samples if status == 200)
+    statuses  = {}
+    for _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    to_ms     = lambda value: None if value is None else round(value * 1000.0, 3)
+    return {
+                "requests"         : len(samples),
+                "successes"        : len(ok),
+                "errors"           : len(samples) - len(ok),
+                "status_counts"    : statuses,
+                "elapsed_s"        : round(elapsed_s, 3),
+                "throughput_rps"   : round(len(ok) / elapsed_s, 3) if elapsed_s > 0 else 0.0,
+                "latency_ms"       : {
+                                        "mean" : to_ms(sum(ok) / len(ok)) if ok else None,
+                                        "p50"  : to_ms(percentile(ok, 50)),
+                                        "p95"  : to_ms(percentile(ok, 95)),
+                                        "p99"  : to_ms(percentile(ok, 99)),
+                                        "max"  : to_ms(ok[-1]) if ok else None
+                                     }
+           }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Server: Optionally start app.py locally and wait until /readyz says it is ready
+# ────────────────────────────────────────────────────────────────────────────────────────
+def start_server(args):
+    process  = subprocess.Popen([sys.executable, "app.py"])
+    deadline = time.monotonic() + args.startup_timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"app.py exited with code {process.returncode} before becoming ready")
+        ready = get_json(f"{args.url}/readyz", timeout=2.0)
+        if ready and ready.get("ready"):
+            return process
+        time.sleep(1.0)
+    process.terminate()
+    raise RuntimeError(f"app.py was not ready after {args.startup_timeout}s")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline load generator for the prediction service.")
+    parser.add_argument("--url",             default="http://127.0.0.1:8080", help="Service base URL (localhost only)")
+    parser.add_argument("--endpoint",        choices=["json", "binary"], default="json",
+                                             help="json: POST /predict with base64; binary: POST /predict/binary")
+    mode   = parser.add_mutually_exclusive_group()
+    mode.add_argument("--concurrency",       type=int,   default=None, help="Closed loop: concurrent clients")
+    mode.add_argument("--rate",              type=float, default=None, help="Open loop: requests per second")
+    parser.add_argument("--poisson",         action="store_true", help="Open loop: exponential inter-arrival times")
+    parser.add_argument("--max-in-flight",   type=int,   default=256, help="Open loop: cap on outstanding requests")
+    parser.add_argument("--duration",        type=float, default=30.0, help="Measured run length in seconds")
+    parser.add_argument("--num-requests",    type=int,   default=0,    help="Stop after this many requests (0 = no limit)")
+    parser.add_argument("--warmup",          type=float, default=5.0,  help="Unmeasured warm-up seconds before the run")
+    parser.add_argument("--timeout",         type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--requests-file",   default=None, help="JSONL of recorded requests")
+    parser.add_argument("--images-dir",      default=None, help="Directory of images to send")
+    parser.add_argument("--unique",          type=int,   default=64,  help="Distinct synthetic/directory images")
+    parser.add_argument("--image-size",      type=int,   default=224, help="Synthetic image side length")
+    parser.add_argument("--seed",            type=int,   default=42)
+    parser.add_argument("--start-server",    action="store_true", help="Launch app.py for the run")
+    parser.add_argument("--startup-timeout", type=float, default=300.0)
+    parser.add_argument("--output",          default=None, help="Result JSON path (default: artifacts/load_tests/<timestamp>.json)")
+    args   = parser.parse_args()
+
+    if args.concurrency is None and args.rate is None:
+        args.concurrency = 1
+    if urllib.parse.urlparse(args.url).hostname not in LOCAL_HOSTS:
+        parser.error(f"--url must point at localhost, got {args.url}")
+    return args
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Entry Point
+# ────────────────────────────────────────────────────────────────────────────────────────
+def main():
+    args     = parse_args()
+    payloads = load_payloads(args)
+    if not payloads:
+        raise SystemExit("No request payloads found")
+
+    server   = start_server(args) if args.start_server else None
+    try:
+        runner = run_closed_loop if args.concurrency else run_open_loop
+
+        if args.warmup > 0:
+            runner(args, payloads, time.perf_counter() + args.warmup, Recorder())
+
+        health   = get_json(f"{args.url}/health") or {}
+        recorder = Recorder()
+        started  = time.perf_counter()
+        runner(args, payloads, started + args.duration, recorder)
+        elapsed  = time.perf_counter() - started
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    result = {
+                "timestamp"      : datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "git_commit"     : git_commit(),
+                "model_version"  : health.get("model_version"),
+                "config"         : {
+                                        "url"            : args.url,
+                                        "endpoint"       : args.endpoint,
+                                        "mode"           : "closed_loop" if args.concurrency else "open_loop",
+                                        "concurrency"    : args.concurrency,
+                                        "rate"           : args.rate,
+                                        "poisson"        : args.poisson,
+                                        "duration_s"     : args.duration,
+                                        "warmup_s"       : args.warmup,
+                                        "payloads"       : len(payloads),
+                                        "source"         : args.requests_file or args.images_dir or "synthetic"
+                                   },
+                **summarize(recorder.samples, elapsed)
+             }
+
+    output = Path(args.output or f"artifacts/load_tests/{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(output.parent, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=4)
+
+    latency = result["latency_ms"]
+    print(f"{result['successes']}/{result['requests']} ok, {result['throughput_rps']} req/s, "
+          f"p50 {latency['p50']} ms, p95 {latency['p95']} ms, p99 {latency['p99']} ms")
+    print(f"Saved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Precision Benchmark: Step time and accuracy per JIT_COMPILE / MIXED_PRECISION mode
+#
+#   python scripts/precision_benchmark.py                           # all four modes, training data
+#   python scripts/precision_benchmark.py --steps 100 --weights imagenet
+#   python scripts/precision_benchmark.py --modes float32 mixed_bfloat16+xla
+#
+# Every mode starts from the same initial weights, sees the same batches and trains
+# the same number of steps (head phase: backbone frozen per FREEZE_ALL), then is
+# scored on the validation split. Reported per mode: first-step time (tracing and
+# XLA compilation), median train step time, median predict time per batch and
+# validation accuracy. Pick the fastest mode whose accuracy holds up and set it in
+# params.yaml (JIT_COMPILE, MIXED_PRECISION).
+# ────────────────────────────────────────────────────────────────────────────────────────
+import time
+import json
+import argparse
+import statistics
+
+from   pathlib import Path
+
+import tensorflow as tf
+
+from cnnClassifier.config.configuration          import ConfigurationManager
+from cnnClassifier.components.prepare_base_model import PrepareBaseModel
+from cnnClassifier.components.input_pipeline     import DirectoryDataset
+from cnnClassifier.utils.common                  import apply_precision_policy
+from cnnClassifier.components.backbones          import BACKBONES, build_backbone
+
+MODES = ("float32", "float32+xla", "mixed_bfloat16", "mixed_bfloat16+xla")
+
+
+class StepTimer(tf.keras.callbacks.Callback):
+    def on_train_batch_begin(self, batch, logs=None):
+        self.started = time.perf_counter()
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.times.append(time.perf_counter() - self.started)
+
+    def on_train_begin(self, logs=None):
+        self.times = []
+
+
+def run_mode(mode: str, model: tf.keras.Model, initial: list, data: DirectoryDataset, args) -> dict:
+    policy, _, xla = mode.partition("+")
+    model.set_weights(initial)                                    # Same starting point for every mode
+    model = apply_precision_policy(model, policy)
+    model.compile(
+                    optimizer   = tf.keras.optimizers.Adam(learning_rate=args.learning_rate),
+                    loss        = "categorical_crossentropy",
+                    metrics     = ["accuracy"],
+                    jit_compile = bool(xla)
+                 )
+
+    timer = StepTimer()
+    model.fit(data.dataset("training", shuffle=True), epochs=1, steps_per_epoch=args.steps, callbacks=[timer], verbose=0)
+    _, accuracy = model.evaluate(data.dataset("validation", shuffle=False, repeat=False), verbose=0)
+
+    images, _ = next(iter(data.dataset("validation", shuffle=False)))
+    forward   = tf.function(lambda x: model(x, training=False), jit_compile=bool(xla))
+    forward(images)                                               # Trace / compile
+    predict   = []
+    for _ in range(args.predict_repeats):
+        started = time.perf_counter()
+        forward(images).numpy()
+        predict.append(time.perf_counter() - started)
+
+    return {
+                "mode"                : mode,
+                "first_step_s"        : timer.times[0],
+                "train_step_ms_p50"   : statistics.median(timer.times[1:]) * 1000.0,
+                "predict_batch_ms_p50": statistics.median(predict) * 1000.0,
+                "val_accuracy"        : float(accuracy)
+           }
+
+
+def main():
+    training = ConfigurationManager().get_training_config()
+    params   = ConfigurationManager().params
+    backbone = ConfigurationManager().get_prepare_base_model_config().base_model_type
+
+    parser = argparse.ArgumentParser(description="Compare XLA / mixed-precision modes on this host.")
+    parser.add_argument("--modes",           nargs="*", default=list(MODES), choices=MODES)
+    parser.add_argument("--backbone",        default=backbone, choices=list(BACKBONES))
+    parser.add_argument("--data",            default=str(training.training_data), help="One sub-directory per class")
+    parser.add_argument("--image-size",      type=int,   default=int(params.IMAGE_SIZE[0]))
+    parser.add_argument("--batch-size",      type=int,   default=int(params.BATCH_SIZE))
+    parser.add_argument("--steps",           type=int,   default=30,  help="Train steps per mode")
+    parser.add_argument("--predict-repeats", type=int,   default=20)
+    parser.add_argument("--learning-rate",   type=float, default=float(params.LEARNING_RATE_HEAD))
+    parser.add_argument("--weights",         default=params.WEIGHTS, help="Backbone weights: imagenet or none")
+    parser.add_argument("--output",          default="artifacts/precision_benchmark.json")
+    args   = parser.parse_args()
+
+    size   = [args.image_size, args.image_size, 3]
+    data   = DirectoryDataset(args.data, size, args.batch_size, validation_split=0.20, cache="memory")
+    model  = PrepareBaseModel._prepare_full_model(
+                                                    model         = build_backbone(args.backbone, size, weights=args.weights),
+                                                    classes       = len(data.class_names),
+                                                    freeze_all    = params.FREEZE_ALL,
+                                                    freeze_till   = params.FREEZE_TILL,
+                                                    learning_rate = args.learning_rate
+                                                 )
+    initial = model.get_weights()
+
+    results = []
+    for mode in args.modes:
+        result = run_mode(mode, model, initial, data, args)
+        results.append(result)
+        print(f"{mode:20} first step {result['first_step_s']:6.1f} s   train {result['train_step_ms_p50']:8.1f} ms/step   "
+              f"predict {result['predict_batch_ms_p50']:8.1f} ms/batch   val acc {result['val_accuracy']:.3f}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"backbone": args.backbone, "image_size": size, "batch_size": args.batch_size, "steps": args.steps, "results": results}, f, indent=4)
+    print(f"Saved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
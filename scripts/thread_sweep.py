@@ -0,0 +1,166 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Thread Sweep: Finds the intra-op / inter-op / oneDNN setting that serves best on this host
+#
+#   python scripts/thread_sweep.py --workers 2                    # as many processes as gunicorn workers
+#   python scripts/thread_sweep.py --workers 1 --batch-size 32    # single-stream (training-like) load
+#   python scripts/thread_sweep.py --model artifacts/training/model.h5 --objective latency
+#
+# For each candidate setting, `--workers` processes run forward passes side by side,
+# the way gunicorn workers share the host. The best setting by aggregate throughput
+# (or by p95 latency) is printed as a config.yaml / params.yaml snippet.
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import subprocess
+
+from   pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Child: One worker process measuring one setting
+# ────────────────────────────────────────────────────────────────────────────────────────
+def run_child(args):
+    # oneDNN is read when TensorFlow loads, so it is set before the import
+    os.environ["TF_ENABLE_ONEDNN_OPTS"] = "1" if args.onednn else "0"
+    os.environ["TF_CPP_MIN_LOG_LEVEL"]  = "2"
+
+    import numpy      as np
+    import tensorflow as tf
+
+    tf.config.threading.set_intra_op_parallelism_threads(args.intra)
+    tf.config.threading.set_inter_op_parallelism_threads(args.inter)
+
+    if args.model:
+        model = tf.keras.models.load_model(args.model, compile=False)
+    else:
+        model = tf.keras.applications.VGG16(weights=None, include_top=False, input_shape=(args.image_size, args.image_size, 3))
+
+    shape   = [args.batch_size] + list(model.input_shape[1:])
+    batch   = tf.constant(np.random.default_rng(0).random(shape, dtype=np.float32))
+    forward = tf.function(lambda x: model(x, training=False))
+    for _ in range(3):
+        forward(batch)                                            # Trace + warm up before the shared start
+
+    print("READY", flush=True)                                    # All workers start measuring together
+    if sys.stdin.readline().strip() != "GO":
+        return                                                    # Another worker failed; nothing to measure
+
+    timings  = []
+    deadline = time.perf_counter() + args.seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        forward(batch).numpy()
+        timings.append(time.perf_counter() - started)
+
+    print(json.dumps({"timings": timings, "batch_size": args.batch_size}))
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Parent: Sweep candidate settings, `--workers` concurrent children each
+# ────────────────────────────────────────────────────────────────────────────────────────
+def usable_cores() -> int:
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+
+
+def candidates(args) -> list:
+    cores  = usable_cores()
+    intra  = sorted({n for n in (1, 2, 4, 8, 16, 32, cores // args.workers, cores) if 1 <= n <= cores} | {0})
+    inter  = [1, 2, 0]
+    onednn = [True, False] if args.sweep_onednn else [True]
+    return [{"intra": a, "inter": b, "onednn": c} for a, b, c in itertools.product(intra, inter, onednn)]
+
+
+def measure(args, setting: dict) -> dict:
+    command   = [
+                    sys.executable, __file__, "--child",
+                    "--intra", str(setting["intra"]), "--inter", str(setting["inter"]),
+                    "--batch-size", str(args.batch_size), "--image-size", str(args.image_size),
+                    "--seconds", str(args.seconds)
+                ] + (["--onednn"] if setting["onednn"] else []) + (["--model", args.model] if args.model else [])
+
+    processes = [subprocess.Popen(command, cwd=REPO_ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL, text=True)
+                 for _ in range(args.workers)]
+
+    # Release every worker at once, after all of them have loaded and warmed up
+    ready     = all(process.stdout.readline().strip() == "READY" for process in processes)
+    results   = []
+    for process in processes:
+        output, _ = process.communicate("GO\n" if ready else "")
+        if ready and process.returncode == 0:
+            results.append(json.loads(output.strip().splitlines()[-1]))
+    if len(results) != args.workers:
+        return {**setting, "error": "a worker failed to start or exited with an error"}
+
+    timings   = sorted(t for result in results for t in result["timings"])
+    images    = sum(len(result["timings"]) for result in results) * args.batch_size
+    return {
+                **setting,
+                "images_per_s"   : images / args.seconds,
+                "p50_ms"         : timings[len(timings) // 2] * 1000.0,
+                "p95_ms"         : timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000.0,
+                "forward_passes" : len(timings)
+           }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep TensorFlow CPU thread settings for this host.")
+    parser.add_argument("--workers",      type=int,   default=1,    help="Processes running side by side (gunicorn workers)")
+    parser.add_argument("--batch-size",   type=int,   default=1,    help="Images per forward pass")
+    parser.add_argument("--image-size",   type=int,   default=224)
+    parser.add_argument("--model",        default=None, help="Keras model file; default: VGG16 backbone, random weights")
+    parser.add_argument("--seconds",      type=float, default=10.0, help="Measured time per setting")
+    parser.add_argument("--objective",    choices=["throughput", "latency"], default="throughput")
+    parser.add_argument("--sweep-onednn", action="store_true", help="Also try TF_ENABLE_ONEDNN_OPTS=0")
+    parser.add_argument("--output",       default="artifacts/thread_sweep.json")
+
+    # Child-only arguments
+    parser.add_argument("--child",        action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--intra",        type=int,   default=0,  help=argparse.SUPPRESS)
+    parser.add_argument("--inter",        type=int,   default=0,  help=argparse.SUPPRESS)
+    parser.add_argument("--onednn",       action="store_true",    help=argparse.SUPPRESS)
+    args   = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    print(f"Host: {usable_cores()} usable cores, {args.workers} worker(s), batch size {args.batch_size}")
+    results = []
+    for setting in candidates(args):
+        result = measure(args, setting)
+        results.append(result)
+        if "error" in result:
+            print(f"  intra={setting['intra']:<3} inter={setting['inter']:<2} oneDNN={setting['onednn']!s:5}  {result['error']}")
+        else:
+            print(f"  intra={setting['intra']:<3} inter={setting['inter']:<2} oneDNN={setting['onednn']!s:5}  "
+                  f"{result['images_per_s']:8.1f} img/s   p50 {result['p50_ms']:7.1f} ms   p95 {result['p95_ms']:7.1f} ms")
+
+    valid = [r for r in results if "error" not in r]
+    if not valid:
+        raise SystemExit("Every setting failed")
+    best  = (max(valid, key=lambda r: r["images_per_s"]) if args.objective == "throughput"
+             else min(valid, key=lambda r: r["p95_ms"]))
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"cores": usable_cores(), "workers": args.workers, "batch_size": args.batch_size,
+                   "objective": args.objective, "best": best, "results": results}, f, indent=4)
+
+    print(f"\nBest by {args.objective}: intra={best['intra']} inter={best['inter']} oneDNN={best['onednn']}")
+    print("config.yaml (serving):")
+    print(f"  intra_op_threads        : {best['intra']}\n  inter_op_threads        : {best['inter']}\n  onednn_opts             : {best['onednn']}")
+    print("params.yaml (training / evaluation):")
+    print(f"INTRA_OP_THREADS   : {best['intra']}\nINTER_OP_THREADS   : {best['inter']}\nONEDNN_OPTS        : {best['onednn']}")
+    print(f"Saved results to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import numpy      as np
+import tensorflow as tf
+
+from   dataclasses import dataclass, field
+from   typing      import Callable
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Backbone Entry: Keras application + its input preprocessing + its fine-tune cut layer
+# ────────────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class Backbone:
+    name                       : str       # base_model_type in config.yaml
+    application                : Callable  # tf.keras.applications constructor
+    preprocessing              : str       # caffe | tf | raw (see `preprocessing_layer`)
+    cut_layer                  : str       # Last backbone layer: head / feature-cache / fine-tune boundary
+    kwargs                     : dict = field(default_factory=dict)  # Extra application arguments
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Registry: Selectable through prepare_base_model.base_model_type
+# ────────────────────────────────────────────────────────────────────────────────────────
+BACKBONES = {
+    backbone.name: backbone for backbone in (
+        Backbone("vgg16",              tf.keras.applications.VGG16,            "caffe", "block5_pool"),
+        Backbone("resnet50",           tf.keras.applications.ResNet50,         "caffe", "conv5_block3_out"),
+        Backbone("mobilenet_v2",       tf.keras.applications.MobileNetV2,      "tf",    "out_relu"),
+        Backbone("mobilenet_v3_small", tf.keras.applications.MobileNetV3Small, "tf",    "backbone_output", {"include_preprocessing": False}),
+        Backbone("mobilenet_v3_large", tf.keras.applications.MobileNetV3Large, "tf",    "backbone_output", {"include_preprocessing": False}),
+        Backbone("efficientnet_b0",    tf.keras.applications.EfficientNetB0,   "raw",   "top_activation"),
+    )
+}
+
+CAFFE_MEAN_BGR = [103.939, 116.779, 123.68]                           # ImageNet channel means (caffe-style weights)
+
+
+def get_backbone(name: str) -> Backbone:
+    """Registry entry for `name` (case-insensitive)."""
+    try:
+        return BACKBONES[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported base model type: {name}; expected one of {sorted(BACKBONES)}")
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Preprocessing: Maps the pipeline's [0, 1] RGB input to what the weights were trained on
+# ────────────────────────────────────────────────────────────────────────────────────────
+def preprocessing_layer(mode: str) -> tf.keras.layers.Layer:
+    """
+    Every input pipeline (ImageDataGenerator, tf.data, shards, serving) feeds RGB in
+    [0, 1]. The model starts with this layer, so the conversion travels with it.
+
+    - caffe : x * 255, RGB -> BGR, minus the ImageNet mean (VGG16, ResNet50); a fixed 1x1 convolution
+    - tf    : x * 2 - 1 (MobileNetV2 / V3)
+    - raw   : x * 255 (EfficientNet normalizes internally)
+    """
+    if mode == "caffe":
+        return tf.keras.layers.Conv2D(3, 1, name="preprocessing", trainable=False)
+    if mode == "tf":
+        return tf.keras.layers.Rescaling(2.0, offset=-1.0, name="preprocessing")
+    if mode == "raw":
+        return tf.keras.layers.Rescaling(255.0, name="preprocessing")
+    raise ValueError(f"Unsupported preprocessing mode: {mode}")
+
+
+def _caffe_weights() -> list:
+    kernel = np.zeros((1, 1, 3, 3), dtype=np.float32)
+    for bgr in range(3):
+        kernel[0, 0, 2 - bgr, bgr] = 255.0                            # Output channel `bgr` reads input channel `2 - bgr`
+    return [kernel, -np.asarray(CAFFE_MEAN_BGR, dtype=np.float32)]
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Build: Preprocessing + application as one flat functional model
+# ────────────────────────────────────────────────────────────────────────────────────────
+def build_backbone(name: str, input_shape: list, weights: str = "imagenet", include_top: bool = False) -> tf.keras.Model:
+    """
+    Builds the backbone with its preprocessing layer in front. The layers are flat
+    (not a nested model), so freezing by position and `get_layer(cut_layer)` work
+    the same for every backbone. If the application has no stable name for its
+    last layer, an identity layer named `cut_layer` is appended.
+
+    Args:
+        name (str)          : Registry key (base_model_type).
+        input_shape (list)  : [height, width, channels].
+        weights (str)       : 'imagenet', a weights file, or None.
+        include_top (bool)  : Keep the application's own classifier.
+
+    Returns:
+        tf.keras.Model      : Input in [0, 1] -> backbone features.
+    """
+    backbone   = get_backbone(name)
+    weights    = None if weights is None or str(weights).lower() == "none" else weights
+
+    inputs     = tf.keras.Input(shape=tuple(input_shape), name="image")
+    preprocess = preprocessing_layer(backbone.preprocessing)
+    model      = backbone.application(input_tensor=preprocess(inputs), weights=None, include_top=include_top, **backbone.kwargs)
+
+    if not include_top and backbone.cut_layer not in [layer.name for layer in model.layers]:
+        outputs = tf.keras.layers.Activation("linear", name=backbone.cut_layer)(model.output)
+        model   = tf.keras.Model(inputs=inputs, outputs=outputs, name=model.name)
+
+    # Pretrained weights load by layer order, which the weighted caffe layer would shift:
+    # load them into a plain build of the application and copy them across
+    own = _caffe_weights() if backbone.preprocessing == "caffe" else []
+    if weights:
+        reference = backbone.application(input_shape=tuple(input_shape), weights=weights, include_top=include_top, **backbone.kwargs)
+        model.set_weights(own + reference.get_weights())
+    elif own:
+        preprocess.set_weights(own)
+    return model
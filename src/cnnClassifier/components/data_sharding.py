@@ -0,0 +1,111 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+
+from   pathlib import Path
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier                           import logger             # Centralized logger instance
+from cnnClassifier.entity.config_entity      import DataShardingConfig # Typed config object
+from cnnClassifier.components.input_pipeline import DirectoryDataset   # Listing, split and decode
+from cnnClassifier.components.input_pipeline import VALIDATION_SPLIT   # Same split as training
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# DataSharding Class: Writes decoded, resized images as memory-mappable uint8 shards
+# ────────────────────────────────────────────────────────────────────────────────────────
+class DataSharding:
+    def __init__(self, config: DataShardingConfig):
+        """
+        Initialize with structured config containing source / output paths and shard settings.
+
+        Args:
+            config (DataShardingConfig): Configuration entity for the sharding stage.
+        """
+        self.config = config
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Sources: Subset name -> (DirectoryDataset, subset of that listing)
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _sources(self) -> dict:
+        kwargs = dict(image_size=self.config.params_image_size, batch_size=1)
+        train  = DirectoryDataset(self.config.training_data, validation_split=VALIDATION_SPLIT, **kwargs)
+        test   = DirectoryDataset(self.config.test_data, **kwargs)
+        return {"training": (train, "training"), "validation": (train, "validation"), "test": (test, "training")}
+
+    def _fingerprint(self, sources: dict) -> str:
+        digest = hashlib.sha1()
+        for data in {id(data): data for data, _ in sources.values()}.values():
+            digest.update(data.fingerprint().encode("utf-8"))
+        digest.update(f"{self.config.params_image_size}|{self.config.params_shard_size}".encode("utf-8"))
+        return digest.hexdigest()
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Write Shards: <subset>/shard_<n>_{images,labels}.npy + manifest.json
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def write_shards(self):
+        """
+        Decodes and resizes every image once and writes the uint8 tensors and labels
+        in shards of at most SHARD_SIZE images. Skipped when the manifest already
+        matches the source files, image size and shard size.
+        """
+        sources     = self._sources()
+        fingerprint = self._fingerprint(sources)
+        manifest    = Path(self.config.manifest_path)
+
+        if manifest.exists():
+            with open(manifest) as f:
+                if json.load(f).get("fingerprint") == fingerprint:
+                    logger.info(f"Shards in {self.config.root_dir} are up to date")
+                    return
+
+        # Write into a staging directory; the manifest is moved in last
+        root    = Path(self.config.root_dir)
+        staging = root.with_name(root.name + ".tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+
+        class_names = sources["training"][0].class_names
+        content     = {
+                        "fingerprint" : fingerprint,
+                        "image_size"  : list(self.config.params_image_size),
+                        "class_names" : class_names,
+                        "subsets"     : {}
+                      }
+        for name, (data, subset) in sources.items():
+            if data.class_names != class_names:
+                raise ValueError(f"Classes of {data.directory} differ from the training set: {data.class_names}")
+            content["subsets"][name] = self._write_subset(staging, name, data, subset)
+
+        with open(staging / Path(self.config.manifest_path).name, "w") as f:
+            json.dump(content, f, indent=4)
+
+        shutil.rmtree(root, ignore_errors=True)
+        os.replace(staging, root)
+        logger.info(f"Shards and manifest written to {root}")
+
+    def _write_subset(self, directory: Path, name: str, data: DirectoryDataset, subset: str) -> dict:
+        samples       = data.samples(subset)
+        shard_size    = self.config.params_shard_size
+        height, width = data.image_size
+        (directory / name).mkdir()
+
+        shards, iterator = [], data.decoded(subset).as_numpy_iterator()
+        for index, start in enumerate(range(0, samples, shard_size)):
+            count  = min(shard_size, samples - start)
+            prefix = f"{name}/shard_{index:05d}"
+            images = np.lib.format.open_memmap(directory / f"{prefix}_images.npy", mode="w+", dtype=np.uint8, shape=(count, height, width, 3))
+            labels = np.lib.format.open_memmap(directory / f"{prefix}_labels.npy", mode="w+", dtype=np.int32, shape=(count,))
+            for row in range(count):
+                images[row], labels[row] = next(iterator)
+            images.flush()
+            labels.flush()
+            shards.append({"images": f"{prefix}_images.npy", "labels": f"{prefix}_labels.npy", "count": count})
+
+        logger.info(f"{name}: {samples} images in {len(shards)} shard(s)")
+        return {"samples": samples, "shards": shards}
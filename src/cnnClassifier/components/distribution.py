@@ -0,0 +1,84 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import json
+import tensorflow as tf
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier import logger                 # Centralized logger instance
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Distribution Class: tf.distribute strategy plus this process's place in the cluster
+# ────────────────────────────────────────────────────────────────────────────────────────
+class Distribution:
+    MODES = ("none", "mirrored", "multi_worker")
+
+    def __init__(self, mode: str = "none", workers: list = (), task_index: int = 0, mirrored_replicas: int = 1):
+        """
+        Builds the strategy for `mode`. Must run before TensorFlow executes its
+        first op (collective ops and logical devices are configured at start-up).
+
+        - none         : default strategy, one replica.
+        - mirrored     : MirroredStrategy over `mirrored_replicas` logical CPU devices
+                         of this process (e.g. one per socket).
+        - multi_worker : MultiWorkerMirroredStrategy with ring all-reduce. Cluster
+                         membership comes from TF_CONFIG; if it is not set, from
+                         `workers` (host:port of every worker) and `task_index`
+                         (TRAINING_TASK_INDEX overrides it).
+
+        Args:
+            mode (str)              : 'none', 'mirrored' or 'multi_worker'.
+            workers (list)          : Cluster worker addresses when TF_CONFIG is not set.
+            task_index (int)        : Index of this process in `workers`.
+            mirrored_replicas (int) : Logical CPU devices for 'mirrored'.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported DISTRIBUTION: {mode}; expected one of {self.MODES}")
+
+        self.mode         = mode
+        self.num_workers  = 1
+        self.worker_index = 0
+        self.is_chief     = True
+
+        try:
+            if mode == "mirrored":
+                cpu           = tf.config.list_physical_devices("CPU")[0]
+                tf.config.set_logical_device_configuration(cpu, [tf.config.LogicalDeviceConfiguration()] * max(1, mirrored_replicas))
+                self.strategy = tf.distribute.MirroredStrategy(devices=[d.name for d in tf.config.list_logical_devices("CPU")])
+
+            elif mode == "multi_worker":
+                tf_config         = self._tf_config(list(workers), task_index)
+                cluster, task     = tf_config["cluster"], tf_config["task"]
+                self.num_workers  = sum(len(cluster.get(role, [])) for role in ("chief", "worker"))
+                self.worker_index = task["index"] + (len(cluster.get("chief", [])) if task["type"] == "worker" else 0)
+                self.is_chief     = task["type"] == "chief" or (task["type"] == "worker" and task["index"] == 0 and "chief" not in cluster)
+                self.strategy     = tf.distribute.MultiWorkerMirroredStrategy(
+                                        communication_options=tf.distribute.experimental.CommunicationOptions(
+                                            implementation=tf.distribute.experimental.CommunicationImplementation.RING))
+
+            else:
+                self.strategy = tf.distribute.get_strategy()
+        except RuntimeError as e:
+            raise RuntimeError(f"DISTRIBUTION {mode} must be set up before TensorFlow runs its first op; "
+                               f"run the training stage in its own process (stage_03_model_trainer.py): {e}") from e
+
+        self.replicas     = self.strategy.num_replicas_in_sync
+        logger.info(f"Distribution: {mode}, {self.replicas} replica(s), worker {self.worker_index + 1}/{self.num_workers}"
+                    f"{' (chief)' if self.is_chief else ''}")
+
+    @staticmethod
+    def _tf_config(workers: list, task_index: int) -> dict:
+        """TF_CONFIG from the environment, or built from the configured worker list."""
+        if os.environ.get("TF_CONFIG"):
+            return json.loads(os.environ["TF_CONFIG"])
+        if not workers:
+            raise ValueError("DISTRIBUTION multi_worker needs TF_CONFIG or training.cluster_workers in config.yaml")
+
+        tf_config = {
+                        "cluster" : {"worker": workers},
+                        "task"    : {"type": "worker", "index": int(os.environ.get("TRAINING_TASK_INDEX", task_index))}
+                    }
+        os.environ["TF_CONFIG"] = json.dumps(tf_config)           # Read by the strategy's cluster resolver
+        return tf_config
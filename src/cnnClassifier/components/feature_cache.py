@@ -0,0 +1,161 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import json
+import shutil
+import hashlib
+import numpy      as np
+import tensorflow as tf
+
+from   pathlib import Path
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier                           import logger             # Centralized logger instance
+from cnnClassifier.components.input_pipeline import DirectoryDataset   # Same listing / split / decode as training
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# FeatureCache Class: Frozen-backbone features computed once, memory-mapped from disk
+# ────────────────────────────────────────────────────────────────────────────────────────
+class FeatureCache:
+    def __init__(
+                    self,
+                    cache_dir: Path,
+                    data: DirectoryDataset,
+                    backbone: tf.keras.Model,
+                    views: int = 1,
+                    augment: bool = False
+                ):
+        """
+        Bottleneck features of every training / validation image, stored as
+        float16 .npy memmaps under `cache_dir/<key>/`.
+
+        The key covers the dataset contents (relative path, size and mtime of every
+        file, plus the split), a hash of the backbone weights, the image size and
+        the view settings, so an unchanged setup reuses the cache across runs.
+
+        Args:
+            cache_dir (Path)           : Root directory of the feature caches.
+            data (DirectoryDataset)    : File listing, split and decoding of the training data.
+            backbone (tf.keras.Model)  : Frozen model from the input up to the cut layer.
+            views (int)                : Feature rows per training image.
+            augment (bool)             : If True, each training view is an augmented copy.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.data      = data
+        self.backbone  = backbone
+        self.views     = max(1, int(views))
+        self.augment   = augment
+        self.path      = self.cache_dir / self._key()
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Cache Key: Dataset contents + backbone weights / precision + image size + views
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _key(self) -> str:
+        digest = hashlib.sha1(self.data.fingerprint().encode("utf-8"))
+        for weights in self.backbone.get_weights():
+            digest.update(np.ascontiguousarray(weights).tobytes())
+        digest.update(f"{self.data.image_size}|{self.views}|{self.augment}|{self.data.seed}|"
+                      f"{self.backbone.layers[-1].dtype_policy.name}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Build: One forward pass of the backbone per image (per view), written to memmaps
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def build(self):
+        """
+        Computes the features unless a complete cache with the same key exists.
+
+        Raises:
+            ValueError : The training or validation subset has no images.
+        """
+        for subset in ("training", "validation"):
+            if not self.data.samples(subset):
+                raise ValueError(f"No {subset} images in {self.data.directory}; the feature cache needs both subsets")
+
+        if (self.path / "meta.json").exists():
+            logger.info(f"Reusing bottleneck features from {self.path}")
+            return
+
+        staging = self.path.with_name(self.path.name + ".tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+
+        meta = {"feature_shape": list(self.backbone.output_shape[1:]), "views": self.views, "augment": self.augment}
+        for subset in ("training", "validation"):
+            views         = self.views if subset == "training" else 1
+            meta[subset]  = self._extract(staging, subset, views, augment=self.augment and subset == "training")
+
+        with open(staging / "meta.json", "w") as f:
+            json.dump(meta, f, indent=4)
+        os.replace(staging, self.path)                                # Readers only ever see a complete cache
+        logger.info(f"Bottleneck features cached in {self.path}")
+
+    def _extract(self, directory: Path, subset: str, views: int, augment: bool) -> int:
+        samples  = self.data.samples(subset)
+        shape    = (samples * views,) + tuple(self.backbone.output_shape[1:])
+        features = np.lib.format.open_memmap(directory / f"{subset}_features.npy", mode="w+", dtype=np.float16, shape=shape)
+        labels   = np.lib.format.open_memmap(directory / f"{subset}_labels.npy",   mode="w+", dtype=np.int32,   shape=shape[:1])
+
+        forward  = tf.function(lambda images: self.backbone(images, training=False))
+        row      = 0
+        for view in range(views):
+            dataset = self.data.dataset(subset, shuffle=False, augment=augment, repeat=False)
+            for images, one_hot in dataset:
+                batch                       = len(images)
+                features[row:row + batch]   = forward(images).numpy().astype(np.float16)
+                labels[row:row + batch]     = np.argmax(one_hot.numpy(), axis=1)
+                row                        += batch
+            logger.info(f"Bottleneck features: {subset} view {view + 1}/{views} ({samples} images)")
+
+        features.flush()
+        labels.flush()
+        return samples
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Load: Batches of cached features for Keras fit
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def sequence(self, subset: str, batch_size: int, num_classes: int, shuffle: bool) -> "FeatureSequence":
+        with open(self.path / "meta.json") as f:
+            meta = json.load(f)
+        return FeatureSequence(
+                                features    = np.load(self.path / f"{subset}_features.npy", mmap_mode="r"),
+                                labels      = np.load(self.path / f"{subset}_labels.npy",   mmap_mode="r"),
+                                samples     = meta[subset],
+                                batch_size  = batch_size,
+                                num_classes = num_classes,
+                                shuffle     = shuffle
+                              )
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# FeatureSequence Class: One view per image per epoch, read from the memmap
+# ────────────────────────────────────────────────────────────────────────────────────────
+class FeatureSequence(tf.keras.utils.Sequence):
+    def __init__(self, features, labels, samples: int, batch_size: int, num_classes: int, shuffle: bool, seed: int = 42):
+        super().__init__()
+        self.features    = features                                   # [views * samples, ...] view-major
+        self.labels      = labels
+        self.samples     = samples
+        self.views       = len(labels) // samples if samples else 0
+        self.batch_size  = batch_size
+        self.num_classes = num_classes
+        self.shuffle     = shuffle
+        self.rng         = np.random.default_rng(seed)
+        self.on_epoch_end()
+
+    def __len__(self) -> int:
+        return max(1, self.samples // self.batch_size)                # Same steps per epoch as the image path
+
+    def __getitem__(self, index: int):
+        rows = np.sort(self.rows[index * self.batch_size:(index + 1) * self.batch_size])  # Sorted for sequential reads
+        return (
+                    np.asarray(self.features[rows], dtype=np.float32),
+                    tf.keras.utils.to_categorical(self.labels[rows], self.num_classes)
+               )
+
+    def on_epoch_end(self):
+        order     = self.rng.permutation(self.samples) if self.shuffle else np.arange(self.samples)
+        view      = self.rng.integers(0, self.views, self.samples)    # Which cached view each image uses this epoch
+        self.rows = view[order] * self.samples + order
@@ -0,0 +1,313 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import json
+import hashlib
+import numpy      as np
+import tensorflow as tf
+
+from   pathlib import Path
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier import logger                 # Centralized logger instance
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Validation Split: Fraction of each class in Train_and_Validation_Set held out for
+# validation. Training, the feature cache, the shards and the teacher logits must all
+# see the same split.
+# ────────────────────────────────────────────────────────────────────────────────────────
+VALIDATION_SPLIT = 0.20
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# DirectoryDataset Class: tf.data equivalent of ImageDataGenerator.flow_from_directory
+# ────────────────────────────────────────────────────────────────────────────────────────
+class DirectoryDataset:
+    WHITE_LIST_FORMATS = ("png", "jpg", "jpeg", "bmp", "ppm", "tif", "tiff")
+    PIL_FORMATS        = r".*\.tiff?"                                # Decoded with PIL; tf.io.decode_image cannot read them
+
+    def __init__(
+                    self,
+                    directory: Path,
+                    image_size: list,
+                    batch_size: int,
+                    validation_split: float = 0.0,
+                    cache: str = "",
+                    seed: int = 42
+                ):
+        """
+        Lists `directory` once and builds parallel tf.data pipelines over it.
+
+        File listing, class order and the validation split reproduce
+        `flow_from_directory`: classes are the sorted sub-directories, files are
+        walked in sorted order, and the validation subset is the first
+        `validation_split` fraction of each class's files.
+
+        Args:
+            directory (Path)         : One sub-directory per class.
+            image_size (list)        : [height, width, channels].
+            batch_size (int)         : Images per batch.
+            validation_split (float) : Fraction of each class held out as "validation".
+            cache (str)              : Directory for an on-disk cache of decoded, resized
+                                       images; "memory" caches in RAM; "" disables caching.
+            seed (int)               : Seed for file order and shuffling.
+        """
+        self.directory        = Path(directory)
+        self.image_size       = tuple(image_size[:2])
+        self.batch_size       = batch_size
+        self.validation_split = validation_split
+        self.cache            = cache
+        self.seed             = seed
+
+        self.class_names      = sorted(entry.name for entry in os.scandir(self.directory) if entry.is_dir())
+        self.class_indices    = {name: index for index, name in enumerate(self.class_names)}
+        self._files           = {subset: self._list_files(subset) for subset in ("training", "validation")}
+
+        logger.info(f"tf.data input: {self.samples('training')} training / {self.samples('validation')} "
+                    f"validation images in {len(self.class_names)} classes {self.class_indices}")
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # File Listing: Same walk order and split boundaries as flow_from_directory
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _list_files(self, subset: str):
+        if self.validation_split:
+            split = (0.0, self.validation_split) if subset == "validation" else (self.validation_split, 1.0)
+        else:
+            split = None if subset == "training" else (0.0, 0.0)
+
+        paths, labels = [], []
+        for class_name in self.class_names:
+            class_files = []
+            for root, _, files in sorted(os.walk(self.directory / class_name), key=lambda x: x[0]):
+                class_files.extend(os.path.join(root, name) for name in sorted(files)
+                                   if name.lower().endswith(self.WHITE_LIST_FORMATS))
+            if split:
+                start, stop = int(split[0] * len(class_files)), int(split[1] * len(class_files))
+                class_files = class_files[start:stop]
+            paths.extend(class_files)
+            labels.extend([self.class_indices[class_name]] * len(class_files))
+        return paths, labels
+
+    def samples(self, subset: str) -> int:
+        return len(self._files[subset][0])
+
+    def fingerprint(self) -> str:
+        """Hash of relative path, size and mtime of every listed file, plus the split."""
+        digest = hashlib.sha1(f"{self.validation_split}\n".encode("utf-8"))
+        for subset in ("training", "validation"):
+            for path in self._files[subset][0]:
+                stat = os.stat(path)
+                digest.update(f"{subset}|{os.path.relpath(path, self.directory)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Augmentation: Vectorized preprocessing layers matching the ImageDataGenerator settings
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def augmentation_layers(seed: int = 42) -> tf.keras.Sequential:
+        """
+        rotation_range=40, horizontal_flip, width/height_shift_range=0.2 and
+        zoom_range=0.2 with nearest fill. Shear has no built-in layer and is left out.
+        """
+        return tf.keras.Sequential([
+                                        tf.keras.layers.RandomRotation   (40 / 360, fill_mode="nearest", seed=seed),
+                                        tf.keras.layers.RandomFlip       ("horizontal", seed=seed),
+                                        tf.keras.layers.RandomTranslation(0.2, 0.2, fill_mode="nearest", seed=seed),
+                                        tf.keras.layers.RandomZoom       (0.2, 0.2, fill_mode="nearest", seed=seed)
+                                   ], name="augmentation")
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Dataset: parallel read/decode/resize -> cache -> shuffle -> batch -> augment -> prefetch
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _decode_pil(path: bytes) -> np.ndarray:
+        from PIL import Image
+
+        with Image.open(path.decode("utf-8")) as image:
+            return np.asarray(image.convert("RGB"), dtype=np.uint8)
+
+    def _decode(self, path):
+        image = tf.cond(
+                            tf.strings.regex_full_match(tf.strings.lower(path), self.PIL_FORMATS),
+                            lambda: tf.numpy_function(self._decode_pil, [path], tf.uint8, stateful=False),
+                            lambda: tf.io.decode_image(tf.io.read_file(path), channels=3, expand_animations=False)
+                       )
+        image.set_shape([None, None, 3])
+        image = tf.image.resize(image, self.image_size, method="bilinear", antialias=True)
+        return tf.cast(tf.clip_by_value(tf.round(image), 0, 255), tf.uint8)   # uint8, like PIL's resize output
+
+    def _cache_path(self, subset: str, paths: list, targets: np.ndarray = None) -> str:
+        """Cache file name keyed on the exact file list, image size and targets, so a changed dataset is not reused."""
+        digest = hashlib.sha1("\n".join(paths).encode("utf-8"))
+        if targets is not None:
+            digest.update(np.ascontiguousarray(targets).tobytes())
+        digest = digest.hexdigest()[:12]
+        Path(self.cache).mkdir(parents=True, exist_ok=True)
+        return str(Path(self.cache) / f"{subset}_{self.image_size[0]}x{self.image_size[1]}_{digest}")
+
+    def decoded(self, subset: str) -> tf.data.Dataset:
+        """Unbatched (uint8 image, class index) pairs in listing order."""
+        paths, labels = self._files[subset]
+        files         = tf.data.Dataset.from_tensor_slices((paths, labels))
+        return files.map(lambda path, label: (self._decode(path), label), num_parallel_calls=tf.data.AUTOTUNE)
+
+    def dataset(self, subset: str, shuffle: bool, augment: bool = False, repeat: bool = True,
+                shard: tuple = None, targets: np.ndarray = None) -> tf.data.Dataset:
+        """
+        Returns batches of (float32 images rescaled to [0, 1], one-hot labels).
+
+        Args:
+            subset (str)         : "training" or "validation".
+            shuffle (bool)       : Shuffle file order once and examples every epoch.
+            augment (bool)       : Apply the augmentation layers to each batch.
+            repeat (bool)        : Repeat indefinitely (Keras `fit` with `steps_per_epoch`).
+            shard (tuple)        : (num_workers, worker_index): read only this worker's files.
+            targets (np.ndarray) : One row per image in listing order (e.g. teacher logits);
+                                   labels are then (one-hot labels, targets).
+        """
+        autotune      = tf.data.AUTOTUNE
+        paths, labels = self._files[subset]
+        num_classes   = len(self.class_names)
+        columns       = (paths, labels) if targets is None else (paths, labels, np.asarray(targets, dtype=np.float32))
+
+        files = tf.data.Dataset.from_tensor_slices(columns)
+        if shard:
+            files = _shard(files, shard)
+        if shuffle:
+            files = files.shuffle(len(paths), seed=self.seed, reshuffle_each_iteration=False)
+
+        def decode(path, label, *target):
+            y = tf.one_hot(label, num_classes)
+            return (self._decode(path), (y, target[0]) if target else y)
+
+        dataset = files.map(decode, num_parallel_calls=autotune, deterministic=not shuffle)
+
+        if self.cache == "memory":
+            dataset = dataset.cache()
+        elif self.cache:
+            dataset = dataset.cache(self._cache_path(subset, paths, targets))
+
+        if shuffle:
+            dataset = dataset.shuffle(min(len(paths), 1024), seed=self.seed, reshuffle_each_iteration=True)
+        if repeat:
+            dataset = dataset.repeat()
+
+        dataset = dataset.batch(self.batch_size, num_parallel_calls=autotune)
+        dataset = dataset.map(lambda images, y: (tf.cast(images, tf.float32) / 255.0, y), num_parallel_calls=autotune)
+
+        if augment:
+            layers  = self.augmentation_layers(self.seed)
+            dataset = dataset.map(lambda images, y: (layers(images, training=True), y), num_parallel_calls=autotune)
+
+        return dataset.prefetch(autotune)
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Worker Sharding: Each worker reads a disjoint part of the data (multi-worker training)
+# ────────────────────────────────────────────────────────────────────────────────────────
+def _shard(dataset: tf.data.Dataset, shard: tuple) -> tf.data.Dataset:
+    """Keeps every num_workers-th element from worker_index and turns off tf.distribute auto-sharding."""
+    num_workers, worker_index = shard
+    options = tf.data.Options()
+    options.experimental_distribute.auto_shard_policy = tf.data.experimental.AutoShardPolicy.OFF
+    return dataset.shard(num_workers, worker_index).with_options(options)
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# ShardedDataset Class: Same interface as DirectoryDataset, read from preprocessed shards
+# ────────────────────────────────────────────────────────────────────────────────────────
+class ShardedDataset:
+    def __init__(self, manifest_path: Path, batch_size: int, seed: int = 42):
+        """
+        Reads the uint8 image / label shards written by the data sharding stage.
+        Shards are memory-mapped, so a batch only touches the rows it needs and
+        no image is decoded or resized.
+
+        Args:
+            manifest_path (Path) : manifest.json written by DataSharding.
+            batch_size (int)     : Images per batch.
+            seed (int)           : Seed for shuffling.
+        """
+        manifest_path      = Path(manifest_path)
+        with open(manifest_path) as f:
+            self.manifest  = json.load(f)
+
+        self.batch_size    = batch_size
+        self.seed          = seed
+        self.image_size    = tuple(self.manifest["image_size"][:2])
+        self.class_names   = self.manifest["class_names"]
+        self.class_indices = {name: index for index, name in enumerate(self.class_names)}
+
+        self._shards       = {}
+        for subset, entry in self.manifest["subsets"].items():
+            shards         = [(np.load(manifest_path.parent / shard["images"], mmap_mode="r"),
+                               np.load(manifest_path.parent / shard["labels"], mmap_mode="r"))
+                              for shard in entry["shards"]]
+            offsets        = np.cumsum([0] + [len(labels) for _, labels in shards])
+            self._shards[subset] = (shards, offsets)
+
+    def fingerprint(self) -> str:
+        """Source fingerprint recorded by the data sharding stage, plus the shard image size."""
+        return f"{self.manifest['fingerprint']}|{list(self.image_size)}"
+
+    def samples(self, subset: str) -> int:
+        return int(self._shards[subset][1][-1])
+
+    def labels(self, subset: str) -> np.ndarray:
+        """Class index of every image, in shard order (like `flow_from_directory(...).classes`)."""
+        shards, _ = self._shards[subset]
+        return np.concatenate([np.asarray(labels) for _, labels in shards]).astype(np.int32)
+
+    def _gather(self, subset: str, rows: np.ndarray):
+        shards, offsets = self._shards[subset]
+        rows            = np.sort(rows)                               # Sequential reads within each shard
+        shard_of_row    = np.searchsorted(offsets, rows, side="right") - 1
+        images, labels  = [], []
+        for shard in np.unique(shard_of_row):
+            local       = rows[shard_of_row == shard] - offsets[shard]
+            images.append(shards[shard][0][local])
+            labels.append(shards[shard][1][local])
+        return np.concatenate(images), np.concatenate(labels).astype(np.int32)
+
+    def dataset(self, subset: str, shuffle: bool, augment: bool = False, repeat: bool = True,
+                shard: tuple = None, targets: np.ndarray = None) -> tf.data.Dataset:
+        """
+        Returns batches of (float32 images rescaled to [0, 1], one-hot labels), like
+        `DirectoryDataset.dataset`. Without shuffling, batches follow shard order;
+        `targets` rows follow shard order as well.
+        """
+        autotune    = tf.data.AUTOTUNE
+        num_classes = len(self.class_names)
+        samples     = self.samples(subset)
+
+        rows = tf.data.Dataset.range(samples)
+        if shard:
+            rows    = _shard(rows, shard)
+            samples = len(range(shard[1], samples, shard[0]))      # Shuffle buffer covers this worker's rows
+        if shuffle:
+            rows = rows.shuffle(samples, seed=self.seed, reshuffle_each_iteration=True)
+        if repeat:
+            rows = rows.repeat()
+        rows = rows.batch(self.batch_size)
+
+        if targets is not None:
+            targets = np.asarray(targets, dtype=np.float32)
+
+        def gather(batch_rows):
+            images, labels = tf.numpy_function(lambda r: self._gather(subset, r), [batch_rows], [tf.uint8, tf.int32])
+            images.set_shape([None, *self.image_size, 3])
+            labels.set_shape([None])
+            y = tf.one_hot(labels, num_classes)
+            if targets is not None:
+                rows = tf.sort(batch_rows)                            # `_gather` returns rows in sorted order
+                y    = (y, tf.gather(tf.constant(targets), rows))
+            return tf.cast(images, tf.float32) / 255.0, y
+
+        dataset = rows.map(gather, num_parallel_calls=autotune, deterministic=not shuffle)
+
+        if augment:
+            layers  = DirectoryDataset.augmentation_layers(self.seed)
+            dataset = dataset.map(lambda images, y: (layers(images, training=True), y), num_parallel_calls=autotune)
+
+        return dataset.prefetch(autotune)
@@ -0,0 +1,246 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import math
+import time
+import queue
+import threading
+import numpy as np
+
+from   concurrent.futures import Future, TimeoutError as FutureTimeoutError
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier import logger                 # Centralized logger instance
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Admission Errors: Raised instead of queueing work the batcher cannot serve in time
+# ────────────────────────────────────────────────────────────────────────────────────────
+class QueueFullError(RuntimeError):
+    def __init__(self, message: str, retry_after_s: float):
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
+class DeadlineExceededError(TimeoutError):
+    def __init__(self, message: str, retry_after_s: float):
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# MicroBatcher Class: Groups concurrent requests into a single forward pass
+# ────────────────────────────────────────────────────────────────────────────────────────
+class MicroBatcher:
+    def __init__(self, predict_fn, max_batch_size: int = 16, max_wait_ms: float = 5.0, max_queue_size: int = 0):
+        """
+        Starts a background worker that collects queued inputs into batches.
+
+        A batch is flushed as soon as it holds `max_batch_size` items, or when
+        `max_wait_ms` has elapsed since its first item was dequeued, whichever
+        comes first. One call to `predict_fn` is made per batch.
+
+        The queue is bounded by `max_queue_size`: once full, new requests are
+        rejected immediately rather than waiting behind an ever-growing backlog.
+        Requests may carry a deadline; those that cannot finish in time are
+        rejected on submit, and those that expire while queued never reach
+        `predict_fn`.
+
+        Args:
+            predict_fn (callable) : Maps a stacked (N, ...) array to a sequence of N results.
+            max_batch_size (int)  : Upper bound on the number of inputs per batch.
+            max_wait_ms (float)   : Max time (ms) to wait for a batch to fill.
+            max_queue_size (int)  : Max queued inputs; <= 0 means unbounded.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+
+        self.predict_fn     = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_s     = max(0.0, max_wait_ms) / 1000.0
+
+        self.max_queue_size = max(0, max_queue_size)
+
+        self._queue         = queue.Queue(maxsize=self.max_queue_size)
+        self._closed        = False
+        self._stats_lock    = threading.Lock()
+        self.batches_run    = 0                          # Number of forward passes executed
+        self.items_run      = 0                          # Number of inputs served across all batches
+        self.batch_seconds  = None                       # Moving average of one forward pass, for admission
+        self.rejected_full  = 0                          # Refused because the queue was full
+        self.rejected_late  = 0                          # Refused because the deadline could not be met
+        self.expired        = 0                          # Dropped after their deadline passed in the queue
+
+        self._worker        = threading.Thread(target=self._run, name="MicroBatcher", daemon=True)
+        self._worker.start()
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Public API: Submit a single input and receive its own result
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def submit(self, item: np.ndarray, deadline: float = None) -> Future:
+        """
+        Queues a single (unbatched) input for inference.
+
+        Args:
+            item (np.ndarray) : One preprocessed sample, without the batch dimension.
+            deadline (float)  : Absolute `time.monotonic()` by which the result is needed.
+
+        Returns:
+            Future            : Resolves to this item's entry in the batch output.
+
+        Raises:
+            QueueFullError        : The bounded queue is full.
+            DeadlineExceededError : The queue ahead of this item cannot drain before `deadline`.
+        """
+        self.admit(deadline)
+
+        future = Future()
+        try:
+            self._queue.put_nowait((item, future, deadline))
+        except queue.Full:
+            with self._stats_lock:
+                self.rejected_full += 1
+            raise QueueFullError(f"Inference queue is full ({self.max_queue_size} requests)",
+                                 retry_after_s=self.retry_after_s())
+        return future
+
+    def admit(self, deadline: float = None):
+        """
+        Raises what `submit` would raise for a request arriving now, without queueing
+        anything, so callers can turn a request away before decoding its payload.
+
+        Raises:
+            QueueFullError        : The bounded queue is full.
+            DeadlineExceededError : The queue cannot drain before `deadline`.
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed and no longer accepts requests.")
+
+        if deadline is not None:
+            expected = self.expected_wait_s()
+            if time.monotonic() + expected > deadline:
+                with self._stats_lock:
+                    self.rejected_late += 1
+                raise DeadlineExceededError(f"Request deadline cannot be met (expected wait {expected * 1000:.0f} ms)",
+                                            retry_after_s=self.retry_after_s())
+
+        if self.max_queue_size and self._queue.qsize() >= self.max_queue_size:
+            with self._stats_lock:
+                self.rejected_full += 1
+            raise QueueFullError(f"Inference queue is full ({self.max_queue_size} requests)",
+                                 retry_after_s=self.retry_after_s())
+
+    def predict(self, item: np.ndarray, timeout: float = None, deadline: float = None):
+        """Blocking convenience wrapper around `submit`."""
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+            timeout   = remaining if timeout is None else min(timeout, remaining)
+
+        future = self.submit(item, deadline=deadline)
+        try:
+            return future.result(timeout=timeout)
+        except DeadlineExceededError:
+            raise                                        # Expired in the queue
+        except FutureTimeoutError:
+            raise DeadlineExceededError("Request deadline passed before inference finished",
+                                        retry_after_s=self.retry_after_s())
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Admission Estimates: Queue drain time from the moving average batch latency
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def expected_wait_s(self) -> float:
+        """Estimated time until an item submitted now has its result (0 until a batch has run)."""
+        if self.batch_seconds is None:
+            return 0.0
+        batches_ahead = self._queue.qsize() // self.max_batch_size + 1
+        return batches_ahead * self.batch_seconds + self.max_wait_s
+
+    def retry_after_s(self) -> int:
+        """Whole seconds a rejected client should wait; the value of the Retry-After header."""
+        return max(1, math.ceil(self.expected_wait_s()))
+
+    def close(self):
+        """Stops accepting requests; already queued items are still served."""
+        self._closed = True
+        self._queue.put(None)                            # Sentinel wakes the worker up (waits for room if full)
+        self._worker.join()
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Worker Loop: Collect a batch, run it, fan results back out
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch    = [first]
+            deadline = time.monotonic() + self.max_wait_s
+            stop     = False
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                    break
+                batch.append(entry)
+
+            self._run_batch(batch)
+            if stop:
+                break
+
+    def _run_batch(self, batch):
+        """Drops expired entries, runs one forward pass and resolves every caller's future."""
+        now  = time.monotonic()
+        live = []
+        for item, future, deadline in batch:
+            if deadline is not None and deadline <= now:
+                future.set_exception(DeadlineExceededError("Request deadline passed while queued",
+                                                           retry_after_s=self.retry_after_s()))
+                with self._stats_lock:
+                    self.expired += 1
+            else:
+                live.append((item, future))
+        if not live:
+            return
+
+        futures = [future for _, future in live]
+        started = time.perf_counter()
+        try:
+            inputs  = np.stack([item for item, _ in live])
+            outputs = self.predict_fn(inputs)
+        except Exception as e:
+            logger.exception(f"Batched inference failed for {len(live)} request(s): {e}")
+            for future in futures:
+                future.set_exception(e)
+            return
+        elapsed = time.perf_counter() - started
+
+        with self._stats_lock:
+            self.batches_run  += 1
+            self.items_run    += len(live)
+            self.batch_seconds = elapsed if self.batch_seconds is None else 0.8 * self.batch_seconds + 0.2 * elapsed
+
+        for future, output in zip(futures, outputs):
+            future.set_result(output)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Stats: Average batch size tunes max_wait_ms; rejections tune max_queue_size
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                        "batches_run"    : self.batches_run,
+                        "items_run"      : self.items_run,
+                        "avg_batch_size" : (self.items_run / self.batches_run) if self.batches_run else 0.0,
+                        "avg_batch_ms"   : (self.batch_seconds * 1000.0) if self.batch_seconds is not None else None,
+                        "queue_depth"    : self._queue.qsize(),
+                        "max_queue_size" : self.max_queue_size,
+                        "rejected_full"  : self.rejected_full,
+                        "rejected_late"  : self.rejected_late,
+                        "expired"        : self.expired
+                   }
@@ -0,0 +1,203 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import json
+import shutil
+import hashlib
+import contextlib
+
+from   pathlib import Path
+
+try:
+    import fcntl                                                  # Per-version download lock (Unix only)
+except ImportError:
+    fcntl = None
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier import logger                 # Centralized logger instance
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# ModelArtifactCache Class: Content-verified local copies of registry model versions
+# ────────────────────────────────────────────────────────────────────────────────────────
+class ModelArtifactCache:
+    MANIFEST_NAME = "cache_manifest.json"
+
+    def __init__(self, root_dir: Path):
+        """
+        Keeps downloaded MLflow model versions under `root_dir/<model name>/<version>/`,
+        each with a manifest of SHA-256 digests so a truncated or tampered copy is
+        detected and re-downloaded instead of being served.
+
+        Args:
+            root_dir (Path) : Directory holding the cached model versions.
+        """
+        self.root_dir = Path(root_dir)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Resolve: Cheap registry version check, then local load or download
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def resolve(self, registered_model_name: str, stage: str = "Production"):
+        """
+        Finds the current version of `registered_model_name` in `stage` and returns
+        a verified local copy of it. When the registry cannot be reached, the newest
+        verified version already on disk is returned instead.
+
+        Returns:
+            tuple : (model_version as str, local_model_path)
+
+        Raises:
+            RuntimeError : If the registry is unreachable and nothing is cached.
+        """
+        try:
+            model_version = self.latest_version(registered_model_name, stage)
+        except Exception as e:
+            cached = self.cached_versions(registered_model_name)
+            if not cached:
+                raise RuntimeError(f"Registry unavailable and no cached copy of {registered_model_name}: {e}")
+
+            model_version = cached[0]
+            logger.warning(f"Registry lookup failed ({e}); falling back to cached {registered_model_name} v{model_version}")
+            return model_version, self._model_path(registered_model_name, model_version)
+
+        return model_version, self.fetch(registered_model_name, model_version)
+
+    @staticmethod
+    def latest_version(registered_model_name: str, stage: str = "Production") -> str:
+        """Registry lookup only (no download); raises when the registry is unreachable."""
+        from mlflow.tracking import MlflowClient
+
+        client = MlflowClient()
+        return str(client.get_latest_versions(registered_model_name, stages=[stage])[0].version)
+
+    def fetch(self, registered_model_name: str, model_version) -> str:
+        """
+        Returns the local path of a model version, downloading it only when no
+        verified copy exists.
+
+        Check, download and publish run under a per-version file lock, so
+        processes that miss the same version at once (every worker's watcher on
+        a rollout) download it once; the others wait and then load the published
+        copy. A published copy that verifies is never removed.
+        """
+        if self.is_valid(registered_model_name, model_version):
+            logger.info(f"Model cache hit: {registered_model_name} v{model_version}")
+            return self._model_path(registered_model_name, model_version)
+
+        with self._version_lock(registered_model_name, model_version):
+            if self.is_valid(registered_model_name, model_version):
+                logger.info(f"Model cache hit after wait: {registered_model_name} v{model_version}")
+                return self._model_path(registered_model_name, model_version)
+            self._download(registered_model_name, model_version)
+
+        return self._model_path(registered_model_name, model_version)
+
+    def _download(self, registered_model_name: str, model_version):
+        import mlflow.artifacts
+
+        logger.info(f"Model cache miss: downloading {registered_model_name} v{model_version}")
+        version_dir = self._version_dir(registered_model_name, model_version)
+        tmp_dir     = version_dir.parent / f".tmp-{model_version}-{os.getpid()}"
+        stale_dir   = version_dir.parent / f".stale-{model_version}-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        try:
+            local_path = mlflow.artifacts.download_artifacts(
+                                                              artifact_uri = f"models:/{registered_model_name}/{model_version}",
+                                                              dst_path     = str(tmp_dir)
+                                                            )
+            manifest   = {
+                            "registered_model_name" : registered_model_name,
+                            "version"               : str(model_version),
+                            "model_path"            : os.path.relpath(local_path, tmp_dir),
+                            "files"                 : self._digest_tree(tmp_dir)
+                         }
+            with open(tmp_dir / self.MANIFEST_NAME, "w") as f:
+                json.dump(manifest, f, indent=4)
+
+            # Without a lock (no fcntl) another process may have published meanwhile: keep its copy
+            if self.is_valid(registered_model_name, model_version):
+                return
+
+            # A copy that fails verification is moved aside, then the new one is published atomically
+            if version_dir.exists():
+                os.replace(version_dir, stale_dir)
+            os.replace(tmp_dir, version_dir)
+        except OSError:
+            # Another process published the same version first
+            if not self.is_valid(registered_model_name, model_version):
+                raise
+        finally:
+            shutil.rmtree(tmp_dir,   ignore_errors=True)
+            shutil.rmtree(stale_dir, ignore_errors=True)
+
+    @contextlib.contextmanager
+    def _version_lock(self, registered_model_name: str, model_version):
+        """Exclusive lock on `<model name>/.lock-<version>` (a no-op without fcntl)."""
+        lock_path = self.root_dir / registered_model_name / f".lock-{model_version}"
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Verification: Recompute digests and compare with the manifest
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def is_valid(self, registered_model_name: str, model_version) -> bool:
+        version_dir = self._version_dir(registered_model_name, model_version)
+        manifest    = self._read_manifest(version_dir)
+        if manifest is None:
+            return False
+
+        try:
+            return self._digest_tree(version_dir) == manifest["files"]
+        except OSError:
+            return False
+
+    def cached_versions(self, registered_model_name: str) -> list:
+        """Verified cached versions of a model, newest first."""
+        model_dir = self.root_dir / registered_model_name
+        if not model_dir.is_dir():
+            return []
+
+        versions  = [entry.name for entry in model_dir.iterdir() if entry.is_dir() and not entry.name.startswith(".")]
+        versions  = [v for v in versions if self.is_valid(registered_model_name, v)]
+        return sorted(versions, key=lambda v: int(v) if v.isdigit() else -1, reverse=True)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Helpers
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _version_dir(self, registered_model_name: str, model_version) -> Path:
+        return self.root_dir / registered_model_name / str(model_version)
+
+    def _model_path(self, registered_model_name: str, model_version) -> str:
+        version_dir = self._version_dir(registered_model_name, model_version)
+        manifest    = self._read_manifest(version_dir)
+        return str(version_dir / manifest["model_path"])
+
+    def _read_manifest(self, version_dir: Path):
+        try:
+            with open(version_dir / self.MANIFEST_NAME) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _digest_tree(self, directory: Path) -> dict:
+        """Maps every file below `directory` (except the manifest) to its SHA-256."""
+        digests = {}
+        for path in sorted(Path(directory).rglob("*")):
+            if not path.is_file() or path.name == self.MANIFEST_NAME:
+                continue
+            sha256 = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    sha256.update(chunk)
+            digests[path.relative_to(directory).as_posix()] = sha256.hexdigest()
+        return digests
@@ -0,0 +1,261 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import shutil
+import hashlib
+import numpy      as np
+import tensorflow as tf
+
+from   pathlib import Path
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier                               import logger                  # Centralized logger instance
+from cnnClassifier.entity.config_entity          import DistillationConfig      # Typed config object
+from cnnClassifier.utils.common                  import configure_tf_threading  # CPU thread topology
+from cnnClassifier.components.input_pipeline     import DirectoryDataset        # tf.data input pipeline
+from cnnClassifier.components.input_pipeline     import ShardedDataset          # Preprocessed shard reader
+from cnnClassifier.components.input_pipeline     import VALIDATION_SPLIT        # Same split as training
+from cnnClassifier.components.backbones          import build_backbone          # Backbone registry
+from cnnClassifier.components.prepare_base_model import PrepareBaseModel        # Classification head
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Distillation Class: Trains a small student on the trained teacher's soft targets
+# ────────────────────────────────────────────────────────────────────────────────────────
+class Distillation:
+    def __init__(self, config: DistillationConfig):
+        """
+        Initialize with structured config containing paths and hyperparameters.
+
+        Args:
+            config (DistillationConfig): Configuration entity for the distillation stage.
+        """
+        self.config = config
+
+        # Thread topology must be in place before the first TensorFlow op runs
+        configure_tf_threading(
+                                config.params_intra_op_threads,
+                                config.params_inter_op_threads,
+                                config.params_onednn_opts
+                              )
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Load Teacher: The model written by the training stage
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def load_teacher(self):
+        self.teacher = tf.keras.models.load_model(self.config.teacher_model_path)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Setup Training and Validation Data (same split and class order as training)
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def input_data(self):
+        """
+        Shards with INPUT_PIPELINE "shards", the tf.data directory pipeline
+        otherwise (the generator path cannot carry the cached teacher logits).
+        """
+        if self.config.params_input_pipeline == "shards":
+            self.data = ShardedDataset(
+                                        manifest_path    = self.config.shard_manifest,
+                                        batch_size       = self.config.params_batch_size
+                                      )
+            if list(self.data.image_size) != list(self.config.params_image_size[:2]):
+                raise ValueError(f"Shards hold {self.data.image_size} images but IMAGE_SIZE is "
+                                 f"{self.config.params_image_size}; re-run the data sharding stage")
+        else:
+            self.data = DirectoryDataset(
+                                        directory        = self.config.training_data,
+                                        image_size       = self.config.params_image_size,
+                                        batch_size       = self.config.params_batch_size,
+                                        validation_split = VALIDATION_SPLIT,
+                                        cache            = self.config.tf_data_cache
+                                      )
+        self.train_samples = self.data.samples("training")
+        self.valid_samples = self.data.samples("validation")
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Teacher Logits: One teacher forward pass per training image, cached on disk
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _cache_key(self) -> str:
+        """Dataset contents + teacher weights + image size; an unchanged setup reuses the cache."""
+        digest = hashlib.sha1(self.data.fingerprint().encode("utf-8"))
+        for weights in self.teacher.get_weights():
+            digest.update(np.ascontiguousarray(weights).tobytes())
+        digest.update(f"{list(self.config.params_image_size)}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def cache_teacher_logits(self):
+        """
+        Runs the teacher once over the training images (unshuffled, so row i
+        belongs to image i of the listing / shard order) and stores its
+        pre-softmax logits as a float32 .npy under `teacher_logits_dir/<key>/`.
+        Student epochs read them instead of re-running the teacher.
+        """
+        path = Path(self.config.teacher_logits_dir) / self._cache_key() / "training_logits.npy"
+        if not path.exists():
+            staging = path.parent.with_name(path.parent.name + ".tmp")
+            shutil.rmtree(staging, ignore_errors=True)
+            staging.mkdir(parents=True)
+
+            forward = tf.function(logits_fn(self.teacher))
+            logits  = np.lib.format.open_memmap(staging / path.name, mode="w+", dtype=np.float32,
+                                                shape=(self.train_samples, self.teacher.output_shape[-1]))
+            row     = 0
+            for images, _ in self.data.dataset("training", shuffle=False, repeat=False):
+                batch                    = len(images)
+                logits[row:row + batch]  = forward(images).numpy()
+                row                     += batch
+            logits.flush()
+            os.replace(staging, path.parent)                          # Readers only ever see a complete cache
+            logger.info(f"Teacher logits of {row} training images cached in {path.parent}")
+        else:
+            logger.info(f"Reusing teacher logits from {path.parent}")
+
+        self.teacher_logits = np.load(path)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Build Student: Registry backbone + configured head, same input as the teacher
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def build_student(self):
+        """
+        The whole student is trained. With pretrained weights its batch norm
+        layers stay in inference mode, as in fine-tuning; the input
+        preprocessing is fixed.
+        """
+        backbone     = build_backbone(
+                                        name        = self.config.params_student,
+                                        input_shape = self.config.params_image_size,
+                                        weights     = self.config.params_weights
+                                     )
+        self.student = PrepareBaseModel._prepare_full_model(
+                                        model         = backbone,
+                                        classes       = self.config.params_num_classes,
+                                        freeze_all    = False,
+                                        freeze_till   = None,
+                                        learning_rate = self.config.params_learning_rate,
+                                        jit_compile   = self.config.params_jit_compile,
+                                        precision     = self.config.params_mixed_precision,
+                                        head_type     = self.config.params_head_type,
+                                        head_units    = self.config.params_head_units,
+                                        head_rank     = self.config.params_head_rank
+                                                           )
+
+        pretrained = str(self.config.params_weights).lower() != "none"
+        for layer in self.student.layers:
+            if (pretrained and isinstance(layer, tf.keras.layers.BatchNormalization)) or layer.name == "preprocessing":
+                layer.trainable = False
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Distill: Student trained on hard labels + temperature-softened teacher targets
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def train(self):
+        """
+        Fits the student through `Distiller` and saves it as a plain Keras model
+        (softmax output), so evaluation, quantization and serving load it like
+        the teacher. The training images are not augmented: the cached logits
+        belong to the unaugmented images.
+        """
+        batch_size = self.config.params_batch_size
+        distiller  = Distiller(self.student, self.config.params_temperature, self.config.params_alpha)
+        distiller.compile(
+                            optimizer   = tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate),
+                            metrics     = ['accuracy'],
+                            jit_compile = self.config.params_jit_compile
+                         )
+
+        early_stop = tf.keras.callbacks.EarlyStopping    (patience=5, restore_best_weights=True)
+        reduce_lr  = tf.keras.callbacks.ReduceLROnPlateau(patience=3, factor=0.5)
+
+        print(f"Distilling into {self.config.params_student} ({self.config.params_head_type} head)...")
+        distiller.fit(
+                        self.data.dataset("training", shuffle=True, targets=self.teacher_logits),
+                        epochs           = self.config.params_epochs,
+                        steps_per_epoch  = max(1, self.train_samples // batch_size),
+                        validation_data  = self.data.dataset("validation", shuffle=False),
+                        validation_steps = max(1, self.valid_samples // batch_size),
+                        callbacks        = [early_stop, reduce_lr]
+                     )
+
+        Path(self.config.student_model_path).parent.mkdir(parents=True, exist_ok=True)
+        self.student.save(self.config.student_model_path)
+        logger.info(f"Student model saved to {self.config.student_model_path}")
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Distiller Model: Custom train step over (images, (one-hot labels, teacher logits))
+# ────────────────────────────────────────────────────────────────────────────────────────
+class Distiller(tf.keras.Model):
+    def __init__(self, student: tf.keras.Model, temperature: float, alpha: float):
+        """
+        loss = alpha * CE(labels, student) + (1 - alpha) * T^2 * KL(teacher_T || student_T)
+
+        where _T is the softmax of the logits divided by `temperature`. The T^2
+        factor keeps the soft-target gradients on the scale of the hard-label ones.
+        Validation uses the hard labels only.
+
+        Args:
+            student (tf.keras.Model) : Model whose last layer is a softmax Dense layer.
+            temperature (float)      : Softening of both distributions (> 1 flattens them).
+            alpha (float)            : Weight of the hard-label loss.
+        """
+        super().__init__()
+        self.student      = student
+        self.logits       = logits_fn(student)
+        self.temperature  = float(temperature)
+        self.alpha        = float(alpha)
+        self.loss_tracker = tf.keras.metrics.Mean(name="loss")
+
+    @property
+    def metrics(self):
+        return [self.loss_tracker, *self.compiled_metrics.metrics]
+
+    def call(self, images, training=False):
+        return self.student(images, training=training)
+
+    def train_step(self, data):
+        images, (labels, teacher_logits) = data
+        with tf.GradientTape() as tape:
+            logits = self.logits(images, training=True)
+            hard   = tf.keras.losses.categorical_crossentropy(labels, logits, from_logits=True)
+            soft   = _kl_divergence(teacher_logits / self.temperature, logits / self.temperature)
+            loss   = tf.reduce_mean(self.alpha * hard + (1.0 - self.alpha) * self.temperature ** 2 * soft)
+            loss  += tf.add_n(self.student.losses) if self.student.losses else 0.0  # Head L2 regularization
+        self.optimizer.minimize(loss, self.student.trainable_variables, tape=tape)
+        return self._update_metrics(loss, labels, tf.nn.softmax(logits))
+
+    def test_step(self, data):
+        images, labels = data
+        logits = self.logits(images, training=False)
+        loss   = tf.reduce_mean(tf.keras.losses.categorical_crossentropy(labels, logits, from_logits=True))
+        return self._update_metrics(loss, labels, tf.nn.softmax(logits))
+
+    def _update_metrics(self, loss, labels, probabilities) -> dict:
+        self.loss_tracker.update_state(loss)
+        self.compiled_metrics.update_state(labels, probabilities)
+        return {metric.name: metric.result() for metric in self.metrics}
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────────────────────────────────────────────────
+def logits_fn(model: tf.keras.Model):
+    """
+    Returns `f(images, training=False)` computing the pre-softmax logits of `model`
+    from its last (softmax Dense) layer's input, sharing the model's variables.
+    """
+    output = model.layers[-1]
+    if not isinstance(output, tf.keras.layers.Dense) or output.activation is not tf.keras.activations.softmax:
+        raise ValueError(f"Expected a softmax Dense output layer, got {output.name}")
+    hidden = tf.keras.models.Model(inputs=model.input, outputs=output.input)
+
+    def logits(images, training=False):
+        features = tf.cast(hidden(images, training=training), tf.float32)
+        return tf.matmul(features, tf.cast(output.kernel, tf.float32)) + tf.cast(output.bias, tf.float32)
+    return logits
+
+
+def _kl_divergence(teacher_logits, student_logits):
+    """Per-example KL(softmax(teacher) || softmax(student)), computed in log space."""
+    teacher_log_probs = tf.nn.log_softmax(teacher_logits, axis=-1)
+    student_log_probs = tf.nn.log_softmax(student_logits, axis=-1)
+    return tf.reduce_sum(tf.exp(teacher_log_probs) * (teacher_log_probs - student_log_probs), axis=-1)
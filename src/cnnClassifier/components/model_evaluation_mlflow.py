@@ -1,21 +1,22 @@
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Imports: Standard Libraries
+#   mlflow, matplotlib, seaborn and sklearn are imported in the methods that use
+#   them; only scoring and MLflow logging need them.
 # ────────────────────────────────────────────────────────────────────────────────────────
 import os
-import mlflow
-import mlflow.keras
-import tensorflow        as tf
-import matplotlib.pyplot as plt
-import seaborn           as sns
-
-from   sklearn.metrics import confusion_matrix, classification_report
-from   pathlib         import Path
-from   urllib.parse    import urlparse
+import tensorflow as tf
+
+from   pathlib      import Path
+from   urllib.parse import urlparse
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Imports: Project Utilities
 # ────────────────────────────────────────────────────────────────────────────────────────
-from cnnClassifier.entity.config_entity import EvaluationConfig                          # Typed config object
-from cnnClassifier.utils.common         import read_yaml, create_directories, save_json  # Utility functions
+from cnnClassifier.entity.config_entity      import EvaluationConfig                          # Typed config object
+from cnnClassifier.utils.common              import read_yaml, create_directories, save_json  # Utility functions
+from cnnClassifier.utils.common              import load_json, file_sha256                    # Profile / quantization reports
+from cnnClassifier                           import logger                                    # Centralized logger instance
+from cnnClassifier.utils.common              import configure_tf_threading                    # CPU thread topology
+from cnnClassifier.components.input_pipeline import ShardedDataset                            # Preprocessed shard reader
 
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Evaluation Class: Handles model loading, validation, scoring, and MLflow logging
@@ -30,6 +31,13 @@ class Evaluation:
         """
         self.config = config
 
+        # Thread topology must be in place before the first TensorFlow op runs
+        configure_tf_threading(
+                                config.params_intra_op_threads,
+                                config.params_inter_op_threads,
+                                config.params_onednn_opts
+                              )
+
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Setup Validation Data Generator
     # ────────────────────────────────────────────────────────────────────────────────────────
@@ -51,6 +59,12 @@ class Evaluation:
                                                                         **dataflow_kwargs
                                                                      )    
 
+    def _test_shards(self):
+        """Test set from the preprocessed shards: no decode, same order and rescaling."""
+        data                = ShardedDataset(self.config.shard_manifest, batch_size=self.config.params_batch_size)
+        self.test_generator = data.dataset("test", shuffle=False, repeat=False)
+        self.test_labels    = data.labels("test")
+
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Load Trained Model from Disk
     # ────────────────────────────────────────────────────────────────────────────────────────
@@ -71,6 +85,11 @@ class Evaluation:
     # confusion matrics creation
     # ────────────────────────────────────────────────────────────────────────────────────────
     def log_confusion_matrix(self, y_true, y_pred, dataset_name="Test Data"):
+        import mlflow
+        import matplotlib.pyplot as plt
+        import seaborn           as sns
+        from   sklearn.metrics   import confusion_matrix
+
         cm = confusion_matrix(y_true, y_pred)
         plt.figure(figsize=(8, 6))
         sns.heatmap(cm, annot=True, fmt='d', cmap='Blues')
@@ -86,7 +105,9 @@ class Evaluation:
     # Save Evaluation Metrics Locally
     # ────────────────────────────────────────────────────────────────────────────────────────
     def save_score(self):
-        """Saves loss, accuracy, and class-wise metrics from classification report to scores.json."""
+        """Saves loss, accuracy, and class-wise metrics from classification report to `scores_path`."""
+        from sklearn.metrics import classification_report
+
         # Start with loss and accuracy (evaluation metrics)
         scores = {
                     "loss"     : float(self.score[0]),
@@ -103,8 +124,8 @@ class Evaluation:
             else:
                 scores[clean_label] = float(metrics)
 
-        # Save to scores.json
-        save_json(path=Path("scores.json"), data=scores)
+        # Save to scores.json (scores_student.json for the distilled student)
+        save_json(path=Path(self.config.scores_path), data=scores)
 
         # store for MLflow logging
         self.metric_store = scores
@@ -118,15 +139,44 @@ class Evaluation:
         and saves the score locally.
         """
         self.model          = self.load_model(self.config.path_of_model)
-        self._test_generator()
+        if self.config.params_input_pipeline == "shards":
+            self._test_shards()
+        else:
+            self._test_generator()
         self.score          = self.model.evaluate(self.test_generator)
         self.y_pred         = self.model.predict(self.test_generator)
         self.y_pred_classes = self.y_pred.argmax(axis=1)
-        self.y_true         = self.test_generator.classes
+        self.y_true         = self.test_labels if self.config.params_input_pipeline == "shards" else self.test_generator.classes
 
         self.save_score()
 
     
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # TFLite Variants: Shipped with the registered model version they were converted from
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def log_tflite_variants(self):
+        """
+        Logs the quantization stage's .tflite files under `model/tflite/` of the
+        active run, so a registry version downloads with the variants of its own
+        weights and the tflite_* serving backends load them from there. Skipped
+        (with a warning) when the report was made from a different model file.
+        """
+        import mlflow
+
+        report_path = self.config.quantization_report
+        if not report_path or not Path(report_path).exists():
+            return
+
+        source = load_json(report_path).get("source")
+        if not source or source.get("sha256") != file_sha256(self.config.path_of_model):
+            logger.warning(f"TFLite variants in {report_path} were not converted from {self.config.path_of_model}; "
+                           f"not registering them (re-run the quantization stage)")
+            return
+
+        for variant, path in source.variants.items():
+            mlflow.log_artifact(str(path), artifact_path="model/tflite")
+            logger.info(f"Logged TFLite variant {variant} with the model")
+
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Log Metrics and Model into MLflow
     # ────────────────────────────────────────────────────────────────────────────────────────
@@ -135,7 +185,9 @@ class Evaluation:
         Logs evaluation metrics and model artifacts into MLflow.
         Registers model if remote tracking URI is used.
         """
-        
+        import mlflow
+        import mlflow.keras
+
         # Set remote MLflow tracking URI (hosted on EC2) in secured way
         from dotenv import load_dotenv
         load_dotenv()
@@ -163,11 +215,20 @@ class Evaluation:
             # Log all evaluation metrics from scores.json
             mlflow.log_metrics(self.metric_store)
 
+            # Log the training profile of this model (PROFILE_TRAINING): summary metrics + full report
+            if self.config.training_profile_path and Path(self.config.training_profile_path).exists():
+                summary = load_json(self.config.training_profile_path).summary
+                mlflow.log_metrics({f"train_profile_{name}": value for name, value in summary.items() if value is not None})
+                mlflow.log_artifact(str(self.config.training_profile_path))
+
             # Log confusion matrix
             self.log_confusion_matrix(self.y_true, self.y_pred_classes)
 
             # Log scores.json as an artifact
-            mlflow.log_artifact("scores.json")
+            mlflow.log_artifact(str(self.config.scores_path))
+
+            # TFLite variants of this exact model, inside the model directory the registry version points to
+            self.log_tflite_variants()
 
             # Log model to S3 (via MLflow)
             if tracking_url_type_store != "file":
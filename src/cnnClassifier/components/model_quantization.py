@@ -0,0 +1,164 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import time
+import numpy      as np
+import tensorflow as tf
+
+from   pathlib import Path
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier                      import logger                    # Centralized logger instance
+from cnnClassifier.entity.config_entity import ModelQuantizationConfig   # Typed config object
+from cnnClassifier.utils.common         import save_json, file_sha256    # Utility functions
+from cnnClassifier.pipeline.prediction  import TFLiteModel               # TFLite serving backend
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# ModelQuantization Class: Exports TFLite variants and measures their trade-offs
+# ────────────────────────────────────────────────────────────────────────────────────────
+class ModelQuantization:
+    SUPPORTED_VARIANTS = ("float32", "dynamic_range", "float16", "int8")
+
+    def __init__(self, config: ModelQuantizationConfig):
+        """
+        Initialize with structured config containing model/data paths and quantization settings.
+
+        Args:
+            config (ModelQuantizationConfig): Configuration entity for the quantization stage.
+        """
+        self.config = config
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Load Trained Keras Model
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def load_model(self):
+        self.model = tf.keras.models.load_model(self.config.trained_model_path)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Data Generators: Same preprocessing as Training / Evaluation
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _flow(self, directory: Path, batch_size: int, shuffle: bool):
+        datagenerator = tf.keras.preprocessing.image.ImageDataGenerator(rescale=1./255)
+        return datagenerator.flow_from_directory(
+                                                    directory     = directory,
+                                                    target_size   = self.config.params_image_size[:-1],   # Exclude channel dimension
+                                                    batch_size    = batch_size,
+                                                    interpolation = "bilinear",
+                                                    shuffle       = shuffle,
+                                                    seed          = 42
+                                                )
+
+    def _representative_dataset(self):
+        """Calibration subset for full-INT8: a shuffled sample of the training directory."""
+        calibration = self._flow(self.config.training_data, batch_size=1, shuffle=True)
+        samples     = min(self.config.params_calibration_samples, calibration.samples)
+        for _ in range(samples):
+            images, _ = next(calibration)
+            yield [images.astype(np.float32)]
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Convert: One TFLite flatbuffer per variant
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def convert(self, variant: str) -> bytes:
+        """
+        Converts the Keras model into a TFLite variant. Input and output stay float32
+        for every variant so the serving code does not depend on the variant.
+        'float32' is not quantized: the Keras model's predictions, served from a
+        memory-mapped flatbuffer (see TFLiteModel).
+
+        Args:
+            variant (str): 'float32', 'dynamic_range', 'float16' or 'int8'.
+
+        Returns:
+            bytes        : Serialized TFLite model.
+        """
+        converter               = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+        if variant == "float32":
+            converter.optimizations = []                                   # Float weights, no quantization
+        elif variant == "dynamic_range":
+            pass                                                           # int8 weights, float activations
+        elif variant == "float16":
+            converter.target_spec.supported_types = [tf.float16]
+        elif variant == "int8":
+            converter.representative_dataset      = self._representative_dataset
+            converter.target_spec.supported_ops   = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        else:
+            raise ValueError(f"Unsupported quantization variant: {variant}")
+
+        return converter.convert()
+
+    def export_variants(self):
+        """Writes every configured variant to `<root_dir>/model_<variant>.tflite`."""
+        self.variant_paths = {}
+        for variant in self.config.params_variants:
+            path = Path(self.config.root_dir) / f"model_{variant}.tflite"
+            logger.info(f"Converting model to TFLite variant: {variant}")
+            with open(path, "wb") as f:
+                f.write(self.convert(variant))
+            self.variant_paths[variant] = path
+            logger.info(f"Saved {variant} model at: {path}")
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Evaluate: Test accuracy, latency and size for the baseline and each variant
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _accuracy(self, forward) -> float:
+        test_generator = self._flow(self.config.test_data, batch_size=self.config.params_batch_size, shuffle=False)
+        predictions    = []
+        for _ in range(len(test_generator)):
+            images, _  = next(test_generator)
+            predictions.append(np.argmax(np.asarray(forward(images.astype(np.float32))), axis=1))
+        return float(np.mean(np.concatenate(predictions) == test_generator.classes))
+
+    def _latency_ms(self, forward, runs: int = 50) -> float:
+        """Median single-image latency (ms) after a short warm-up."""
+        height, width = self.config.params_image_size[:2]
+        sample        = np.random.default_rng(0).random((1, height, width, 3), dtype=np.float32)
+        for _ in range(5):
+            forward(sample)
+
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            forward(sample)
+            timings.append((time.perf_counter() - started) * 1000.0)
+        return float(np.median(timings))
+
+    def evaluate_variants(self):
+        """
+        Records accuracy delta, latency and size of each variant next to the Keras
+        baseline. The report's "source" entry names the exported files and the
+        digest of the model they were converted from; evaluation attaches the
+        variants to a registered model version only if that digest matches.
+        """
+        keras_forward = tf.function(lambda batch: self.model(batch, training=False))
+        baseline      = {
+                            "accuracy"   : self._accuracy(keras_forward),
+                            "latency_ms" : self._latency_ms(keras_forward),
+                            "size_mb"    : os.path.getsize(self.config.trained_model_path) / 2**20
+                        }
+        report        = {
+                            "source" : {
+                                          "model_path" : str(self.config.trained_model_path),
+                                          "sha256"     : file_sha256(self.config.trained_model_path),
+                                          "variants"   : {variant: str(path) for variant, path in self.variant_paths.items()}
+                                       },
+                            "keras"  : {**baseline, "accuracy_delta": 0.0}
+                        }
+
+        for variant, path in self.variant_paths.items():
+            tflite_model    = TFLiteModel(path)
+            accuracy        = self._accuracy(tflite_model)
+            report[variant] = {
+                                "accuracy"       : accuracy,
+                                "accuracy_delta" : accuracy - baseline["accuracy"],
+                                "latency_ms"     : self._latency_ms(tflite_model),
+                                "size_mb"        : os.path.getsize(path) / 2**20
+                              }
+            logger.info(f"{variant}: {report[variant]}")
+
+        save_json(path=Path(self.config.report_path), data=report)
+        self.report = report
@@ -2,6 +2,8 @@
 # Imports: Standard Libraries
 # ────────────────────────────────────────────────────────────────────────────────────────
 import os
+import shutil
+import tempfile
 import urllib.request as request
 import tensorflow     as tf
 import time
@@ -11,7 +13,18 @@ from   pathlib    import Path
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Imports: Project Modules for config entity
 # ────────────────────────────────────────────────────────────────────────────────────────
-from cnnClassifier.entity.config_entity import TrainingConfig        # Typed config object
+from cnnClassifier.entity.config_entity           import TrainingConfig          # Typed config object
+from cnnClassifier.utils.common                   import configure_tf_threading  # CPU thread topology
+from cnnClassifier.utils.common                   import apply_precision_policy  # Mixed-precision layer policies
+from cnnClassifier                                import logger                  # Centralized logger instance
+from cnnClassifier.components.input_pipeline      import DirectoryDataset        # tf.data input pipeline
+from cnnClassifier.components.input_pipeline      import ShardedDataset          # Preprocessed shard reader
+from cnnClassifier.components.input_pipeline      import VALIDATION_SPLIT        # Train / validation split
+from cnnClassifier.components.feature_cache       import FeatureCache            # Cached bottleneck features
+from cnnClassifier.components.training_checkpoint import TrainingCheckpoint      # Resumable training state
+from cnnClassifier.components.distribution        import Distribution            # tf.distribute strategy / cluster role
+from cnnClassifier.components.training_profiler   import TrainingProfiler        # Step / input-wait / memory profile
+from cnnClassifier.components.backbones           import get_backbone            # Backbone registry (cut layer)
 
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Training Class: Handles model loading, data generators, and training execution
@@ -24,29 +37,86 @@ class Training:
         Args:
             config (TrainingConfig): Configuration entity for training stage.
         """
-        self.config = config
+        self.config       = config
+        self.cut_layer    = get_backbone(config.base_model_type).cut_layer   # Last layer of the backbone
+
+        # Thread topology and the distribution strategy must be in place before the first TensorFlow op runs
+        configure_tf_threading(
+                                config.params_intra_op_threads,
+                                config.params_inter_op_threads,
+                                config.params_onednn_opts
+                              )
+        self.distribution = Distribution(
+                                            mode              = config.params_distribution,
+                                            workers           = config.cluster_workers,
+                                            task_index        = config.task_index,
+                                            mirrored_replicas = config.params_mirrored_replicas
+                                        )
+
+        # Batch size and learning rates are per replica in params.yaml; they scale with the replica count
+        self.global_batch_size = config.params_batch_size * self.distribution.replicas
+        self.lr_scale          = self.distribution.replicas
+
+        self.checkpoint   = TrainingCheckpoint(
+                                                directory   = config.checkpoint_dir,
+                                                max_to_keep = config.params_checkpoints_to_keep,
+                                                every_steps = config.params_checkpoint_every,
+                                                signature   = self._run_signature(),
+                                                is_chief    = self.distribution.is_chief
+                                            )
+        self.profiler     = TrainingProfiler(
+                                                report_path = config.profile_report_path,
+                                                trace_dir   = config.profile_trace_dir,
+                                                trace_phase = config.params_profile_trace_phase,
+                                                trace_steps = config.params_profile_trace_steps
+                                            ) if config.params_profile_training else None
+
+    def _run_signature(self) -> dict:
+        """What a checkpoint must match to be resumed: starting model, data and step layout."""
+        start = Path(self.config.updated_base_model_path)
+        stat  = start.stat() if start.exists() else None
+        return {
+                    "updated_base_model" : [str(start), stat.st_size if stat else None, stat.st_mtime_ns if stat else None],
+                    "training_data"      : str(self.config.training_data),
+                    "image_size"         : list(self.config.params_image_size),
+                    "batch_size"         : self.config.params_batch_size,
+                    "num_classes"        : self.config.params_num_classes,
+                    "freeze_till"        : self.config.params_freeze_till,
+                    "replicas"           : self.distribution.replicas
+               }
 
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Load Updated Base Model
     # ────────────────────────────────────────────────────────────────────────────────────────
     def get_base_model(self):
         """
-        Loads the updated base model (with custom layers) from disk.
+        Loads the updated base model (with custom layers) from disk, under the
+        MIXED_PRECISION layer policy. Variables are created in the strategy scope.
         """
-        self.model = tf.keras.models.load_model(self.config.updated_base_model_path)
+        with self.distribution.strategy.scope():
+            self.model = tf.keras.models.load_model(self.config.updated_base_model_path)
+            self.model = apply_precision_policy(self.model, self.config.params_mixed_precision)
 
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Setup Training and Validation Data Generators
     # ────────────────────────────────────────────────────────────────────────────────────────
     def train_valid_generator(self):
         """
-        Creates training and validation data generators using ImageDataGenerator.
+        Creates training and validation data generators using ImageDataGenerator,
+        or tf.data pipelines when INPUT_PIPELINE is "tf_data" or "shards".
         Applies augmentation if enabled in config.
         """
+        if self.config.params_input_pipeline in ("tf_data", "shards"):
+            return self.train_valid_datasets()
+        if self.config.params_input_pipeline != "generator":
+            raise ValueError(f"Unsupported INPUT_PIPELINE: {self.config.params_input_pipeline}")
+        if self.distribution.mode != "none":
+            raise ValueError(f"DISTRIBUTION {self.distribution.mode} needs INPUT_PIPELINE tf_data or shards")
+
         # Common preprocessing parameters
         datagenerator_kwargs = dict(
                                         rescale          = 1./255,
-                                        validation_split = 0.20
+                                        validation_split = VALIDATION_SPLIT
                                    )
 
         # Image resizing and batching parameters
@@ -86,43 +156,222 @@ class Training:
                                                                                 shuffle   = True,
                                                                                 **dataflow_kwargs
                                                                          )
+        self.train_samples      = self.train_generator.samples
+        self.valid_samples      = self.valid_generator.samples
+
+    def train_valid_datasets(self):
+        """
+        tf.data equivalent of `train_valid_generator`: same 20% validation split and
+        class indices, with parallel decode/resize, a decoded-image cache, batched
+        augmentation layers and prefetch. With "shards", images come already
+        decoded and resized from the data sharding stage.
+
+        Batches hold the global batch size; with several workers, each worker reads
+        only its own part of the files and tf.distribute splits its batches
+        across the replicas.
+        """
+        if self.config.params_input_pipeline == "shards":
+            data             = ShardedDataset(
+                                                    manifest_path    = self.config.shard_manifest,
+                                                    batch_size       = self.global_batch_size
+                                             )
+            if list(data.image_size) != list(self.config.params_image_size[:2]):
+                raise ValueError(f"Shards hold {data.image_size} images but IMAGE_SIZE is "
+                                 f"{self.config.params_image_size}; re-run the data sharding stage")
+        else:
+            data             = DirectoryDataset(
+                                                    directory        = self.config.training_data,
+                                                    image_size       = self.config.params_image_size,
+                                                    batch_size       = self.global_batch_size,
+                                                    validation_split = VALIDATION_SPLIT,
+                                                    cache            = self.config.tf_data_cache
+                                               )
+        self.class_indices   = data.class_indices
+        self.train_samples   = data.samples("training")
+        self.valid_samples   = data.samples("validation")
+
+        shard                = (self.distribution.num_workers, self.distribution.worker_index) if self.distribution.num_workers > 1 else None
+        self.valid_generator = data.dataset("validation", shuffle=False, shard=shard)
+        self.train_generator = data.dataset("training",   shuffle=True,  shard=shard, augment=self.config.params_is_augmentation)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Head Phase on Cached Bottleneck Features
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def use_feature_cache(self) -> bool:
+        """
+        The cache is opt-in (FEATURE_CACHE) and applies only while the backbone is
+        frozen, and with augmentation only if a fixed number of augmented views per
+        image is cached. Those views come from the tf.data augmentation layers (no
+        shear), not from the ImageDataGenerator settings of the regular path. It is
+        not used in distributed training.
+        """
+        if not (self.config.params_feature_cache and self.config.params_freeze_all):
+            return False
+        if self.distribution.mode != "none":
+            logger.info(f"Feature cache skipped: DISTRIBUTION is {self.distribution.mode}")
+            return False
+        if self.config.params_is_augmentation and self.config.params_feature_cache_views <= 0:
+            logger.info("Feature cache skipped: AUGMENTATION is on and FEATURE_CACHE_VIEWS is 0")
+            return False
+        return True
+
+    def train_head_on_features(self, resume: dict = None):
+        """
+        Runs the frozen backbone once per image (per view) up to `cut_layer`, then
+        fits only the layers after it on the cached features. The head layers are
+        shared with `self.model`, so the fine-tuning phase starts from these weights.
+        """
+        cut_layer = self.model.get_layer(self.cut_layer)
+        backbone  = tf.keras.models.Model(inputs=self.model.input, outputs=cut_layer.output)
+
+        features  = tf.keras.Input(shape=cut_layer.output.shape[1:])
+        x         = features
+        for layer in self.model.layers[self.model.layers.index(cut_layer) + 1:]:
+            x     = layer(x)                                          # Flatten / Dense / Dropout / Dense
+        head      = tf.keras.models.Model(inputs=features, outputs=x)
+
+        augment   = self.config.params_is_augmentation
+        cache     = FeatureCache(
+                                    cache_dir = self.config.feature_cache_dir,
+                                    data      = DirectoryDataset(
+                                                                    directory        = self.config.training_data,
+                                                                    image_size       = self.config.params_image_size,
+                                                                    batch_size       = self.config.params_batch_size,
+                                                                    validation_split = VALIDATION_SPLIT
+                                                                ),
+                                    backbone  = backbone,
+                                    views     = self.config.params_feature_cache_views if augment else 1,
+                                    augment   = augment
+                                )
+        cache.build()
+
+        head.compile(
+                        optimizer   = tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate_head),
+                        loss        = 'categorical_crossentropy',
+                        metrics     = ['accuracy'],
+                        jit_compile = self.config.params_jit_compile
+                    )
+        self.fit_resumable(
+                            head,
+                            cache.sequence("training",   self.config.params_batch_size, self.config.params_num_classes, shuffle=True),
+                            phase           = "head",
+                            epochs          = self.config.params_epochs_head,
+                            resume          = resume,
+                            validation_data = cache.sequence("validation", self.config.params_batch_size, self.config.params_num_classes, shuffle=False)
+                          )
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Resumable Fit: Checkpoints during fit, continues an interrupted phase
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def fit_resumable(self, model, data, phase: str, epochs: int, resume: dict = None,
+                      steps_per_epoch: int = None, callbacks: list = (), **fit_kwargs):
+        """
+        `model.fit` with checkpoints of `self.model`. If `resume` belongs to `phase`,
+        its weights, optimizer state, progress and the EarlyStopping /
+        ReduceLROnPlateau state among `callbacks` are restored first; an epoch that
+        was interrupted mid-way is finished with its remaining steps (the data order
+        of that epoch is not replayed), then training continues at the next epoch
+        unless a callback stopped training at the end of that partial epoch.
+        With PROFILE_TRAINING, the steps of the phase are profiled (the input wait
+        only without a distribution strategy).
+
+        Args:
+            model (tf.keras.Model) : Compiled model to fit (the full model or a head sharing its layers).
+            data                   : Training data (generator, tf.data.Dataset or Sequence).
+            phase (str)            : "head" or "fine".
+            epochs (int)           : Total epochs of the phase.
+            resume (dict)          : Resume point from `TrainingCheckpoint.resume_point`.
+            steps_per_epoch (int)  : Steps per epoch; defaults to `len(data)`.
+            callbacks (list)       : Extra Keras callbacks.
+        """
+        resume      = resume if resume and resume["phase"] == phase else None
+        epoch, step = (resume["epoch"], resume["step"]) if resume else (0, 0)
+        steps       = steps_per_epoch or len(data)
+
+        with self.distribution.strategy.scope():
+            checkpoint = self.checkpoint.callback(self.model, model, phase, step_offset=step, callbacks=callbacks)
+            if resume:
+                checkpoint.restore(resume["path"])
+        callbacks   = [*callbacks, checkpoint]                        # Last: saves the callbacks' state of the finished epoch
+
+        if self.profiler:
+            callbacks.insert(0, self.profiler.callback(phase, self.global_batch_size))  # First: step time excludes checkpoint saves
+            if self.distribution.mode == "none":
+                data = self.profiler.instrument(data)
+
+        stopped     = False
+        if 0 < step < steps:
+            model.fit(data, initial_epoch=epoch, epochs=epoch + 1, steps_per_epoch=steps - step, callbacks=callbacks, **fit_kwargs)
+            epoch  += 1
+            stopped = model.stop_training                             # EarlyStopping may have ended it; only this fit's flag counts
+        if epoch < epochs and not stopped:
+            model.fit(data, initial_epoch=epoch, epochs=epochs, steps_per_epoch=steps, callbacks=callbacks, **fit_kwargs)
 
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Save Trained Model to Disk
     # ────────────────────────────────────────────────────────────────────────────────────────
-    @staticmethod
-    def save_model(path: Path, model: tf.keras.Model):
+    def save_model(self, path: Path, model: tf.keras.Model):
         """
-        Saves the trained model to the specified path.
+        Saves the trained model to the specified path. In multi-worker training
+        every worker must save, but only the chief writes to `path`; the others
+        save to a temporary directory that is removed again.
 
         Args:
             path (Path): Destination path for saving the model.
             model (tf.keras.Model): Trained model instance.
         """
-        model.save(path)
+        if self.distribution.is_chief:
+            model.save(path)
+            return
+
+        scratch = tempfile.mkdtemp(prefix="model_worker_")
+        try:
+            model.save(os.path.join(scratch, Path(path).name))
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
 
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Train Model Using Generators
     # ────────────────────────────────────────────────────────────────────────────────────────
     def train(self):
-        """Trains the model in two phases: head training and fine-tuning."""
-        self.steps_per_epoch  = self.train_generator.samples // self.train_generator.batch_size
-        self.validation_steps = self.valid_generator.samples // self.valid_generator.batch_size
+        """
+        Trains the model in two phases: head training and fine-tuning. Continues
+        from the latest valid checkpoint of the same run, if there is one. Under
+        a distribution strategy, steps use the global batch size and only the
+        chief writes the final model.
+        """
+        self.steps_per_epoch  = self.train_samples // self.global_batch_size
+        self.validation_steps = self.valid_samples // self.global_batch_size
+        resume                = self.checkpoint.resume_point()
+
+        if not self.profiler and self.distribution.is_chief:
+            Path(self.config.profile_report_path).unlink(missing_ok=True)  # No stale profile next to the new model
 
         # Phase 1: Train classification head
-        self.model.compile(
-                            optimizer = tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate_head),
-                            loss      = 'categorical_crossentropy',
-                            metrics   = ['accuracy']
-                          )
-        print("Training with frozen base model...")
-        self.model.fit(
-                            self.train_generator,
-                            epochs           = self.config.params_epochs_head,
-                            steps_per_epoch  = self.steps_per_epoch,
-                            validation_steps = self.validation_steps,
-                            validation_data  = self.valid_generator
-                      )
+        if resume and resume["phase"] == "fine":
+            print("Head phase already completed, resuming fine-tuning...")
+        elif self.use_feature_cache():
+            print("Training head on cached backbone features...")
+            self.train_head_on_features(resume)
+        else:
+            with self.distribution.strategy.scope():
+                self.model.compile(
+                                    optimizer   = tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate_head * self.lr_scale),
+                                    loss        = 'categorical_crossentropy',
+                                    metrics     = ['accuracy'],
+                                    jit_compile = self.config.params_jit_compile
+                                  )
+            print("Training with frozen base model...")
+            self.fit_resumable(
+                                self.model,
+                                self.train_generator,
+                                phase            = "head",
+                                epochs           = self.config.params_epochs_head,
+                                resume           = resume,
+                                steps_per_epoch  = self.steps_per_epoch,
+                                validation_steps = self.validation_steps,
+                                validation_data  = self.valid_generator
+                              )
 
         # Phase 2: Fine-tune top layers
         
@@ -130,38 +379,66 @@ class Training:
         # Extract base model by slicing known layers
         base_model = tf.keras.models.Model(
                                             inputs  = self.model.input,
-                                            outputs = self.model.get_layer("block5_pool").output  # Last layer of VGG16
+                                            outputs = self.model.get_layer(self.cut_layer).output  # Last layer of the backbone
                                           )
         # Apply fine-tuning logic
         base_model.trainable = True
         for layer in base_model.layers[:-self.config.params_freeze_till]:
             layer.trainable = False
 
+        # Batch norm stays in inference mode: small fine-tuning batches would overwrite the ImageNet statistics.
+        # The input preprocessing is fixed.
+        for layer in base_model.layers:
+            if isinstance(layer, tf.keras.layers.BatchNormalization) or layer.name == "preprocessing":
+                layer.trainable = False
 
-        self.model.compile(
-                            optimizer = tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate_fine),
-                            loss      = 'categorical_crossentropy',
-                            metrics   = ['accuracy']
-                          )
+
+        with self.distribution.strategy.scope():
+            self.model.compile(
+                                optimizer   = tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate_fine * self.lr_scale),
+                                loss        = 'categorical_crossentropy',
+                                metrics     = ['accuracy'],
+                                jit_compile = self.config.params_jit_compile
+                              )
 
         early_stop = tf.keras.callbacks.EarlyStopping    (patience=5, restore_best_weights=True)
         reduce_lr  = tf.keras.callbacks.ReduceLROnPlateau(patience=3, factor=0.5)
 
         print("Fine-tuning top layers...")
-        self.model.fit(
+        self.fit_resumable(
+                            self.model,
                             self.train_generator,
+                            phase            = "fine",
                             epochs           = self.config.params_epochs_fine,
+                            resume           = resume,
                             steps_per_epoch  = self.steps_per_epoch,
                             validation_steps = self.validation_steps,
                             validation_data  = self.valid_generator,
                             callbacks        = [early_stop, reduce_lr]
-                        )
+                          )
 
         # Save to artifacts/training (which will be ignored by gitignore)
         self.save_model(path=self.config.trained_model_path, model=self.model)
 
         # Save to model/final_model.h5 (tracked outside .gitignore)
         export_path = Path(self.config.model_export_path)
-        export_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure model/ exists
+        if self.distribution.is_chief:
+            export_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure model/ exists
         self.save_model(path=export_path, model=self.model)
 
+        if self.profiler and self.distribution.is_chief:
+            self.profiler.write_report(
+                                        input_pipeline    = self.config.params_input_pipeline,
+                                        feature_cache     = self.use_feature_cache(),
+                                        batch_size        = self.global_batch_size,
+                                        image_size        = list(self.config.params_image_size),
+                                        distribution      = self.distribution.mode,
+                                        replicas          = self.distribution.replicas,
+                                        mixed_precision   = self.config.params_mixed_precision,
+                                        jit_compile       = self.config.params_jit_compile,
+                                        resumed           = resume is not None
+                                      )
+
+        # The run is complete; the next run starts from the updated base model again
+        self.checkpoint.clear()
+
@@ -0,0 +1,110 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import time
+import threading
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier import logger                 # Centralized logger instance
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# ModelWatcher Class: Polls the MLflow registry and hot-swaps new Production versions
+# ────────────────────────────────────────────────────────────────────────────────────────
+class ModelWatcher:
+    def __init__(self, client_app, poll_interval_s: float = 60.0, stage: str = "Production"):
+        """
+        Background thread that checks the registry every `poll_interval_s` seconds.
+        A new version is downloaded, loaded and warmed up on this thread, then
+        handed to `client_app.swap_classifier`, so requests never wait on a reload.
+
+        Args:
+            client_app (ClientApp)  : Owner of the model cache and the active classifier.
+            poll_interval_s (float) : Seconds between registry checks.
+            stage (str)             : Registry stage to follow.
+        """
+        self.client_app       = client_app
+        self.poll_interval_s  = poll_interval_s
+        self.stage            = stage
+
+        self._stop            = threading.Event()
+        self._thread          = None
+        self._lock            = threading.Lock()
+
+        self.checks           = 0
+        self.reloads          = 0
+        self.failed_swaps     = 0
+        self.last_reload_s    = None                     # Download + load + warm-up time of the last swap
+        self.last_error       = None
+        self.last_check_at    = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ModelWatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval_s):
+            self.check()
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Check: One registry poll; reload only when the Production version changed
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def check(self) -> bool:
+        """
+        Returns:
+            bool : True when a new version was swapped in.
+        """
+        app  = self.client_app
+        name = app.serving_config.registered_model_name
+
+        with self._lock:
+            self.checks       += 1
+            self.last_check_at = time.time()
+
+        try:
+            model_version = app.model_cache.latest_version(name, self.stage)
+        except Exception as e:
+            logger.warning(f"Model watcher could not reach the registry: {e}")
+            return False
+
+        if model_version == app.model_version:
+            return False
+
+        started = time.perf_counter()
+        try:
+            local_path = app.model_cache.fetch(name, model_version)
+            classifier = app.build_classifier(local_path)                 # Loads and warms up, off the request path
+            app.swap_classifier(classifier, model_version)
+        except Exception as e:
+            logger.exception(f"Hot reload of {name} v{model_version} failed, keeping v{app.model_version}: {e}")
+            with self._lock:
+                self.failed_swaps += 1
+                self.last_error    = str(e)
+            return False
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.reloads      += 1
+            self.last_reload_s = elapsed
+            self.last_error    = None
+        logger.info(f"Hot-swapped {name} to v{model_version} in {elapsed:.2f}s")
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                        "active_version"        : self.client_app.model_version,
+                        "poll_interval_s"       : self.poll_interval_s,
+                        "checks"                : self.checks,
+                        "reloads"               : self.reloads,
+                        "failed_swaps"          : self.failed_swaps,
+                        "last_reload_latency_s" : self.last_reload_s,
+                        "last_error"            : self.last_error,
+                        "last_check_at"         : self.last_check_at
+                   }
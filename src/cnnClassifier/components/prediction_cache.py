@@ -0,0 +1,157 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import time
+import hashlib
+import threading
+
+from   collections        import OrderedDict
+from   concurrent.futures import Future
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# PredictionCache Class: Bounded LRU/TTL cache keyed by image content and model version
+# ────────────────────────────────────────────────────────────────────────────────────────
+class PredictionCache:
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0, retry_on: tuple = ()):
+        """
+        Caches prediction results by SHA-256 of the raw image bytes plus model version.
+
+        Identical requests that arrive while the first one is still being computed
+        wait on that computation instead of starting another forward pass. If that
+        computation fails with one of `retry_on` (errors that concern the first
+        request only, such as its admission or deadline), the waiting requests
+        start over and one of them computes under its own terms.
+
+        Args:
+            max_entries (int)   : Max cached results; least recently used are evicted first.
+            ttl_seconds (float) : Lifetime of a cached result; <= 0 disables expiry.
+            retry_on (tuple)    : Exception types a waiting request retries instead of re-raising.
+        """
+        self.max_entries   = max_entries
+        self.ttl_seconds   = ttl_seconds
+        self.retry_on      = tuple(retry_on)
+        self.model_version = None
+
+        self._entries      = OrderedDict()                   # key -> (expires_at, result)
+        self._inflight     = {}                              # key -> Future of the running computation
+        self._lock         = threading.Lock()
+
+        self.hits          = 0
+        self.misses        = 0
+        self.coalesced     = 0
+        self.retries       = 0
+        self.evictions     = 0
+        self.invalidations = 0
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Key Derivation: Content hash is taken on the encoded bytes, before any decode work
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def make_key(data: bytes, model_version) -> str:
+        return f"{hashlib.sha256(data).hexdigest()}:{model_version}"
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Lookup or Compute: Cache hit, join an in-flight computation, or run it ourselves
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def get_or_compute(self, data: bytes, compute_fn, timeout: float = None):
+        """
+        Returns the cached result for `data`, computing it with `compute_fn()` on a miss.
+
+        Args:
+            data (bytes)          : Encoded image bytes used as the cache key.
+            compute_fn (callable) : Zero-argument function producing the prediction.
+            timeout (float)       : Max seconds to wait on other requests' in-flight computations.
+
+        Returns:
+            Any                   : Cached or freshly computed prediction result.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                version = self.model_version
+                key     = self.make_key(data, version)
+                entry   = self._entries.get(key)
+
+                if entry is not None:
+                    expires_at, result = entry
+                    if expires_at is None or expires_at > time.monotonic():
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                        return result
+                    del self._entries[key]                   # Expired: drop and recompute
+
+                future = self._inflight.get(key)
+                if future is not None:
+                    self.coalesced += 1
+                    owner           = False
+                else:
+                    self.misses    += 1
+                    future          = Future()
+                    self._inflight[key] = future
+                    owner           = True
+
+            if owner:
+                break
+            try:
+                return future.result(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except self.retry_on:
+                with self._lock:
+                    self.retries += 1                        # The owner was turned away; take over or join the next owner
+
+        try:
+            result = compute_fn()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            if version == self.model_version:                # Skip results from a superseded model
+                self._store(key, result)
+
+        future.set_result(result)
+        return result
+
+    def _store(self, key: str, result):
+        """Inserts a result and evicts least recently used entries beyond capacity."""
+        expires_at          = (time.monotonic() + self.ttl_seconds) if self.ttl_seconds > 0 else None
+        self._entries[key]  = (expires_at, result)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Invalidation: A new model version makes every cached prediction stale
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def set_model_version(self, model_version):
+        """Switches the active model version, clearing the cache when it changes."""
+        with self._lock:
+            if model_version != self.model_version:
+                if self.model_version is not None:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.model_version = model_version
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                        "model_version" : self.model_version,
+                        "entries"       : len(self._entries),
+                        "max_entries"   : self.max_entries,
+                        "hits"          : self.hits,
+                        "misses"        : self.misses,
+                        "coalesced"     : self.coalesced,
+                        "retries"       : self.retries,
+                        "evictions"     : self.evictions,
+                        "invalidations" : self.invalidations,
+                        "hit_ratio"     : ((self.hits + self.coalesced) / lookups) if lookups else 0.0
+                   }
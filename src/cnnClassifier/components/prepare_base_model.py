@@ -11,6 +11,8 @@ from   pathlib        import Path
 # Imports: Project Modules
 # ────────────────────────────────────────────────────────────────────────────────────────
 from cnnClassifier.entity.config_entity import PrepareBaseModelConfig  # Typed config object
+from cnnClassifier.utils.common         import apply_precision_policy  # Mixed-precision layer policies
+from cnnClassifier.components.backbones import build_backbone          # Backbone registry
 
 # ────────────────────────────────────────────────────────────────────────────────────────
 # PrepareBaseModel Class: Loads and customizes pretrained CNN architecture
@@ -26,21 +28,20 @@ class PrepareBaseModel:
         self.config = config
 
     # ────────────────────────────────────────────────────────────────────────────────────────
-    # Load Pretrained Base Model (VGG16)
+    # Load Pretrained Base Model (backbone registry)
     # ────────────────────────────────────────────────────────────────────────────────────────
     def get_base_model(self):
         """
-        Loads the base model dynamically based on config.base_model_type.
+        Loads the base model dynamically based on config.base_model_type, with the
+        backbone's input preprocessing as its first layer (see components/backbones.py).
         Saves the raw base model to disk for reproducibility.
         """        
-        if self.config.base_model_type.lower() == "vgg16":
-            base_model = tf.keras.applications.VGG16(
-                                                        input_shape = self.config.params_image_size,
-                                                        weights     = self.config.params_weights,
-                                                        include_top = self.config.params_include_top                                                        
-                                                    )
-        else:
-            raise ValueError(f"Unsupported base model type: {self.config.base_model_type}")
+        base_model = build_backbone(
+                                        name        = self.config.base_model_type,
+                                        input_shape = self.config.params_image_size,
+                                        weights     = self.config.params_weights,
+                                        include_top = self.config.params_include_top
+                                   )
 
         self.base_model = base_model                    # Store separately for later use
 
@@ -50,8 +51,48 @@ class PrepareBaseModel:
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Prepare Full Model: Adds custom layers and compiles the model
     # ────────────────────────────────────────────────────────────────────────────────────────
+    HEAD_TYPES = ("flatten_dense", "gap", "gmp", "low_rank", "depthwise")
+
+    @staticmethod
+    def _classification_head(features, head_type="flatten_dense", units=256, rank=32):
+        """
+        Reduces the backbone feature map to a vector and applies the hidden Dense
+        layer. Every head is a plain chain of layers after the cut layer, so the
+        feature cache, evaluation and serving handle all of them the same way.
+
+        - flatten_dense : Flatten -> Dense(units); H*W*C*units weights (6.4M on VGG16's 7x7x512)
+        - gap / gmp     : global average / max pooling -> Dense(units); C*units weights
+        - low_rank      : Flatten -> Dense(rank, linear) -> Dense(units); the Flatten
+                          projection factored through `rank` dimensions
+        - depthwise     : one learned HxW spatial weighting per channel (DepthwiseConv2D
+                          over the full map) -> Dense(units)
+
+        Args:
+            features (KerasTensor) : Backbone output (batch, H, W, C).
+            head_type (str)        : One of HEAD_TYPES.
+            units (int)            : Hidden Dense units.
+            rank (int)             : Projection size of 'low_rank'.
+        """
+        if head_type == "flatten_dense":
+            x = tf.keras.layers.Flatten()                                                  (features)
+        elif head_type == "gap":
+            x = tf.keras.layers.GlobalAveragePooling2D()                                   (features)
+        elif head_type == "gmp":
+            x = tf.keras.layers.GlobalMaxPooling2D()                                       (features)
+        elif head_type == "low_rank":
+            x = tf.keras.layers.Flatten()                                                  (features)
+            x = tf.keras.layers.Dense(rank, use_bias=False)                                (x)
+        elif head_type == "depthwise":
+            x = tf.keras.layers.DepthwiseConv2D(kernel_size=tuple(features.shape[1:3]))    (features)
+            x = tf.keras.layers.Flatten()                                                  (x)
+        else:
+            raise ValueError(f"Unsupported HEAD_TYPE: {head_type}; expected one of {PrepareBaseModel.HEAD_TYPES}")
+
+        return tf.keras.layers.Dense(units, activation='relu', kernel_regularizer=tf.keras.regularizers.l2(0.001))(x)
+
     @staticmethod
-    def _prepare_full_model(model, classes, freeze_all, freeze_till, learning_rate):
+    def _prepare_full_model(model, classes, freeze_all, freeze_till, learning_rate, jit_compile=False, precision="float32",
+                            head_type="flatten_dense", head_units=256, head_rank=32):
         """
         Freezes layers as per config, adds classification head, and compiles the model.
 
@@ -61,6 +102,11 @@ class PrepareBaseModel:
             freeze_all (bool)         : Whether to freeze all layers.
             freeze_till (int or None) : Number of layers to keep trainable from the end.
             learning_rate (float)     : Learning rate for optimizer.
+            jit_compile (bool)        : XLA-compile the train / predict steps.
+            precision (str)           : Layer dtype policy; the output layer stays float32.
+            head_type (str)           : Feature reduction of the head (see `_classification_head`).
+            head_units (int)          : Hidden Dense units of the head.
+            head_rank (int)           : Projection size of the 'low_rank' head.
 
         Returns:
             tf.keras.Model            : Fully prepared and compiled model.
@@ -73,23 +119,28 @@ class PrepareBaseModel:
             for layer in model.layers[:-freeze_till]:
                 layer.trainable = False
 
+        # The input preprocessing is fixed (model.trainable = True also unfreezes the caffe 1x1 conv)
+        if "preprocessing" in [layer.name for layer in model.layers]:
+            model.get_layer("preprocessing").trainable = False
+
         # Add custom classification head including droupout
-        x           = tf.keras.layers.Flatten()                                                                          (model.output)
-        x           = tf.keras.layers.Dense  (256, activation='relu', kernel_regularizer=tf.keras.regularizers.l2(0.001))(x)
+        x           = PrepareBaseModel._classification_head(model.output, head_type, head_units, head_rank)
         x           = tf.keras.layers.Dropout(0.5)                                                                       (x)
-        prediction  = tf.keras.layers.Dense  (classes, activation='softmax')                                             (x)
+        prediction  = tf.keras.layers.Dense  (classes, activation='softmax', dtype='float32')                             (x)
 
 
         full_model  = tf.keras.models.Model(
                                             inputs  = model.input,
                                             outputs = prediction
                                            )
+        full_model  = apply_precision_policy(full_model, precision)
 
         # Compile with SGD optimizer and categorical crossentropy loss
         full_model.compile(
-                            optimizer = tf.keras.optimizers.Adam(learning_rate=learning_rate),
-                            loss      = tf.keras.losses.CategoricalCrossentropy(),
-                            metrics   = ["accuracy"]
+                            optimizer   = tf.keras.optimizers.Adam(learning_rate=learning_rate),
+                            loss        = tf.keras.losses.CategoricalCrossentropy(),
+                            metrics     = ["accuracy"],
+                            jit_compile = jit_compile
                           )
 
         full_model.summary()
@@ -108,7 +159,12 @@ class PrepareBaseModel:
                                                     classes       = self.config.params_classes,
                                                     freeze_all    = self.config.params_freeze_all,
                                                     freeze_till   = self.config.params_freeze_till,
-                                                    learning_rate = self.config.params_learning_rate
+                                                    learning_rate = self.config.params_learning_rate,
+                                                    jit_compile   = self.config.params_jit_compile,
+                                                    precision     = self.config.params_mixed_precision,
+                                                    head_type     = self.config.params_head_type,
+                                                    head_units    = self.config.params_head_units,
+                                                    head_rank     = self.config.params_head_rank
                                                   )
 
         self.save_model(path=self.config.updated_base_model_path, model=self.full_model)
@@ -0,0 +1,159 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import time
+import bisect
+import threading
+
+from   contextlib import contextmanager
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Metric Primitives: Minimal, lock-protected Prometheus counters, gauges and histograms
+# ────────────────────────────────────────────────────────────────────────────────────────
+def _format_labels(labels: tuple, extra: tuple = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    escaped = [(key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for key, value in pairs]
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str):
+        self.name, self.documentation = name, documentation
+        self._values = {}
+        self._lock   = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self, const: tuple = ()) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(const + key)} {value}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str, function=None):
+        """A `function` returning the current value is evaluated at scrape time."""
+        self.name, self.documentation = name, documentation
+        self._function = function
+        self._values   = {}
+        self._lock     = threading.Lock()
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[tuple(sorted(labels.items()))] = value
+
+    def replace(self, value: float, **labels):
+        """Drops every other label set; used for info-style gauges such as the model version."""
+        with self._lock:
+            self._values = {tuple(sorted(labels.items())): value}
+
+    def render(self, const: tuple = ()) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        if self._function is not None:
+            lines.append(f"{self.name}{_format_labels(const)} {self._function()}")
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(const + key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, buckets: tuple):
+        self.name, self.documentation = name, documentation
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}                                # labels -> [bucket counts..., +Inf count, sum]
+        self._lock   = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key    = tuple(sorted(labels.items()))
+        index  = bisect.bisect_left(self.buckets, value)  # First bucket with upper bound >= value
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1]    += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self, const: tuple = ()) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                key        = const + key
+                cumulative = 0
+                for bound, count in zip(list(self.buckets) + ["+Inf"], series[:-1]):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_format_labels(key, (('le', bound),))} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {series[-1]}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# ServingMetrics Class: Every metric exported by the prediction service at /metrics
+# ────────────────────────────────────────────────────────────────────────────────────────
+LATENCY_BUCKETS    = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+class ServingMetrics:
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, queue_depth_fn=None):
+        """
+        Metrics live in process memory, so each gunicorn worker counts only the
+        requests it served, and a scrape of the shared port reaches whichever
+        worker accepts it. Every series therefore carries a `pid` label (read at
+        scrape time, so it is the worker's pid after fork): series of different
+        workers never overwrite each other, and dashboards aggregate across
+        workers with e.g. `sum without (pid) (rate(cnn_requests_total[5m]))`.
+        A worker's series goes stale once it exits or is not scraped for a while.
+
+        Args:
+            queue_depth_fn (callable) : Returns the current batcher queue depth at scrape time.
+        """
+        self.stage_seconds   = Histogram("cnn_stage_duration_seconds",
+                                         "Time spent per serving stage (base64_decode, image_decode, model_forward).",
+                                         LATENCY_BUCKETS)
+        self.request_seconds = Histogram("cnn_request_duration_seconds", "Total HTTP request time, by route.", LATENCY_BUCKETS)
+        self.batch_size      = Histogram("cnn_batch_size", "Images per model forward pass.", BATCH_SIZE_BUCKETS)
+        self.requests        = Counter  ("cnn_requests_total", "HTTP requests by route and status code.")
+        self.errors          = Counter  ("cnn_request_errors_total", "HTTP requests answered with a 4xx/5xx status, by route.")
+        self.batches         = Counter  ("cnn_batches_total", "Model forward passes executed.")
+        self.rejections      = Counter  ("cnn_rejected_requests_total", "Requests shed by admission control, by reason.")
+        self.queue_depth     = Gauge    ("cnn_queue_depth", "Requests waiting in the micro-batcher queue.",
+                                         function=queue_depth_fn or (lambda: 0))
+        self.model_version   = Gauge    ("cnn_model_version_info", "Loaded model version and backend (value is always 1).")
+
+    def observe_request(self, route: str, status: int, seconds: float):
+        self.requests.inc(route=route, status=status)
+        if status >= 400:
+            self.errors.inc(route=route)
+        self.request_seconds.observe(seconds, route=route)
+
+    def observe_batch(self, size: int, seconds: float):
+        self.batches.inc()
+        self.batch_size.observe(size)
+        self.stage_seconds.observe(seconds, stage="model_forward")
+
+    def render(self) -> str:
+        const = (("pid", os.getpid()),)                  # This worker's series, see __init__
+        lines = []
+        for metric in (self.stage_seconds, self.request_seconds, self.batch_size, self.requests, self.errors,
+                       self.batches, self.rejections, self.queue_depth, self.model_version):
+            lines.extend(metric.render(const))
+        return "\n".join(lines) + "\n"
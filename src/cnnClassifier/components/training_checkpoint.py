@@ -0,0 +1,209 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import os
+import json
+import shutil
+import tempfile
+import numpy      as np
+import tensorflow as tf
+
+from   pathlib import Path
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier import logger                 # Centralized logger instance
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# TrainingCheckpoint Class: Model / optimizer / progress checkpoints for resumable training
+# ────────────────────────────────────────────────────────────────────────────────────────
+class TrainingCheckpoint:
+    PHASES = ("head", "fine")
+
+    def __init__(self, directory: Path, max_to_keep: int, every_steps: int, signature: dict, is_chief: bool = True):
+        """
+        Checkpoints hold model weights, optimizer state (including the learning
+        rate), the phase, the epoch and the step within that epoch, plus the
+        counters of EarlyStopping / ReduceLROnPlateau callbacks. They are
+        written with `tf.train.CheckpointManager`, which keeps the newest
+        `max_to_keep`. EarlyStopping's best weights are kept next to them.
+
+        Checkpoints only resume a run with the same `signature` (starting model,
+        data and shape parameters). Any other run starts fresh and clears them.
+
+        In multi-worker training every worker takes part in each save, but only the
+        chief writes to `directory`; the other workers write to a temporary
+        directory and resume from the chief's checkpoints.
+
+        Args:
+            directory (Path)   : Checkpoint directory.
+            max_to_keep (int)  : Number of checkpoints kept on disk.
+            every_steps (int)  : Save every N training steps (0: at epoch ends only).
+            signature (dict)   : JSON-serializable description of the run.
+            is_chief (bool)    : False on non-chief workers of a multi-worker run.
+        """
+        self.directory       = Path(directory)
+        self.max_to_keep     = max(1, int(max_to_keep))
+        self.every_steps     = int(every_steps)
+        self.signature       = signature
+        self.is_chief        = is_chief
+        self.write_directory = self.directory if is_chief else Path(tempfile.mkdtemp(prefix="checkpoints_worker_"))
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Resume Point: Progress recorded in the newest readable checkpoint of this run
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def resume_point(self):
+        """
+        Returns {"phase", "epoch", "step", "path"} of the newest checkpoint that can
+        be read, or None when there is nothing to resume from.
+        """
+        signature_file = self.directory / "run.json"
+        if not self.is_chief:
+            # Read-only: the chief owns the directory and clears or stamps it
+            if not signature_file.exists():
+                return None
+            with open(signature_file) as f:
+                if json.load(f) != self.signature:
+                    return None
+            return self._latest()
+
+        if signature_file.exists():
+            with open(signature_file) as f:
+                if json.load(f) != self.signature:
+                    logger.info(f"Checkpoints in {self.directory} belong to a different run; starting fresh")
+                    self.clear()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(signature_file, "w") as f:
+            json.dump(self.signature, f, indent=4)
+        return self._latest()
+
+    def _latest(self):
+        state = tf.train.get_checkpoint_state(str(self.directory))
+        paths = list(state.all_model_checkpoint_paths) if state else []
+        for path in reversed(paths):
+            try:
+                reader = tf.train.load_checkpoint(path)
+                point  = {
+                            "phase" : self.PHASES[int(reader.get_tensor("phase/.ATTRIBUTES/VARIABLE_VALUE"))],
+                            "epoch" : int(reader.get_tensor("epoch/.ATTRIBUTES/VARIABLE_VALUE")),
+                            "step"  : int(reader.get_tensor("step/.ATTRIBUTES/VARIABLE_VALUE")),
+                            "path"  : path
+                         }
+            except (tf.errors.OpError, ValueError) as e:
+                logger.warning(f"Skipping unreadable checkpoint {path}: {e}")
+                continue
+            logger.info(f"Resuming {point['phase']} phase at epoch {point['epoch']}, step {point['step']} from {path}")
+            return point
+        return None
+
+    def clear(self):
+        """Removes every checkpoint this process wrote, e.g. once the final model is saved."""
+        shutil.rmtree(self.write_directory, ignore_errors=True)
+
+    def callback(self, model: tf.keras.Model, fit_model: tf.keras.Model, phase: str, step_offset: int = 0,
+                 callbacks: list = ()) -> "CheckpointCallback":
+        """
+        Keras callback that saves `model` together with the optimizer of `fit_model`
+        (the compiled model being fit; a head-only model shares its layers) and the
+        state of the EarlyStopping / ReduceLROnPlateau instances among `callbacks`.
+        It must come after those in the callback list.
+        """
+        return CheckpointCallback(self, model, fit_model, phase, step_offset, callbacks)
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# CheckpointCallback: Periodic saves during fit
+# ────────────────────────────────────────────────────────────────────────────────────────
+class CheckpointCallback(tf.keras.callbacks.Callback):
+    STATEFUL_CALLBACKS = (tf.keras.callbacks.EarlyStopping, tf.keras.callbacks.ReduceLROnPlateau)
+    CALLBACK_STATE     = ("wait", "best", "best_epoch", "cooldown_counter")  # Attributes a callback lacks are skipped
+
+    def __init__(self, checkpoint: TrainingCheckpoint, model: tf.keras.Model, fit_model: tf.keras.Model, phase: str,
+                 step_offset: int, callbacks: list = ()):
+        super().__init__()
+        self.every_steps     = checkpoint.every_steps
+        self.step_offset     = step_offset                            # Steps already done in a resumed epoch
+        self.current_epoch   = 0
+        self.read_directory  = checkpoint.directory
+        self.write_directory = checkpoint.write_directory
+
+        self.phase           = tf.Variable(TrainingCheckpoint.PHASES.index(phase), dtype=tf.int64, trainable=False)
+        self.epoch           = tf.Variable(0, dtype=tf.int64, trainable=False)
+        self.step            = tf.Variable(0, dtype=tf.int64, trainable=False)
+
+        # One row of CALLBACK_STATE per stateful callback, as of the last completed epoch
+        self.tracked         = [callback for callback in callbacks if isinstance(callback, self.STATEFUL_CALLBACKS)]
+        self.tracked_state   = tf.Variable(tf.zeros([len(self.tracked), len(self.CALLBACK_STATE)], tf.float64), trainable=False)
+        self.has_state       = tf.Variable(False, trainable=False)
+        self.best_weights    = [None] * len(self.tracked)
+
+        optimizer            = fit_model.optimizer
+        optimizer.build(fit_model.trainable_variables)                # Slots must exist for an immediate restore
+        self.state           = tf.train.Checkpoint(model=model, optimizer=optimizer, phase=self.phase, epoch=self.epoch, step=self.step,
+                                                   callback_state=self.tracked_state, has_callback_state=self.has_state)
+        self.manager         = tf.train.CheckpointManager(self.state, str(checkpoint.write_directory), max_to_keep=checkpoint.max_to_keep)
+
+    def restore(self, path: str):
+        """Loads weights, optimizer state, progress and callback state from `path`."""
+        self.state.restore(path).expect_partial()
+        if not self.has_state.numpy():
+            return
+
+        # Best weights are only usable if they belong to the best epoch recorded in the checkpoint
+        best_epoch = self.CALLBACK_STATE.index("best_epoch")
+        for index, callback in enumerate(self.tracked):
+            weights_path = self.read_directory / f"best_weights-{index}.npz"
+            if not getattr(callback, "restore_best_weights", False) or not weights_path.exists():
+                continue
+            with np.load(weights_path) as saved:
+                if int(saved["epoch"]) == int(self.tracked_state[index, best_epoch]):
+                    self.best_weights[index] = [saved[f"arr_{i}"] for i in range(len(saved.files) - 1)]
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Callback State: Keras resets callbacks at the start of every fit; carry it over
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def _capture_callbacks(self, epoch: int):
+        if not self.tracked:
+            return
+        self.tracked_state.assign([[float(getattr(callback, name, 0)) for name in self.CALLBACK_STATE] for callback in self.tracked])
+        self.has_state.assign(True)
+
+        for index, callback in enumerate(self.tracked):
+            if getattr(callback, "restore_best_weights", False) and callback.best_weights is not None:
+                if callback.best_epoch == epoch:
+                    staging = self.write_directory / f"best_weights-{index}.tmp.npz"
+                    np.savez(staging, *callback.best_weights, epoch=np.array(epoch))
+                    os.replace(staging, self.write_directory / f"best_weights-{index}.npz")
+                self.best_weights[index] = callback.best_weights
+
+    def on_train_begin(self, logs=None):
+        if not self.has_state.numpy():
+            return
+        for index, (callback, values) in enumerate(zip(self.tracked, self.tracked_state.numpy())):
+            for name, value in zip(self.CALLBACK_STATE, values):
+                if hasattr(callback, name):
+                    setattr(callback, name, float(value) if name == "best" else int(value))
+            if getattr(callback, "restore_best_weights", False):
+                callback.best_weights = self.best_weights[index]
+
+    def _save(self, epoch: int, step: int):
+        self.epoch.assign(epoch)
+        self.step.assign(step)
+
+        # Continue the numbering of earlier phases / runs in the same directory
+        latest = self.manager.checkpoints[-1] if self.manager.checkpoints else None
+        self.manager.save(checkpoint_number=int(latest.rsplit("-", 1)[1]) + 1 if latest else 1)
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.current_epoch = epoch
+
+    def on_train_batch_end(self, batch, logs=None):
+        step = self.step_offset + batch + 1
+        if self.every_steps and step % self.every_steps == 0:
+            self._save(self.current_epoch, step)
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.step_offset = 0                                          # Only the first, resumed epoch is partial
+        self._capture_callbacks(epoch)
+        self._save(epoch + 1, 0)
@@ -0,0 +1,208 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Standard Libraries
+# ────────────────────────────────────────────────────────────────────────────────────────
+import sys
+import json
+import time
+import collections
+import numpy      as np
+import tensorflow as tf
+
+from   pathlib import Path
+
+try:
+    import resource                                               # Peak RSS (Unix only)
+except ImportError:
+    resource = None
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Project Modules
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier import logger                 # Centralized logger instance
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# TrainingProfiler Class: Per-step time, input wait, throughput and memory of each phase
+# ────────────────────────────────────────────────────────────────────────────────────────
+class TrainingProfiler:
+    def __init__(self, report_path: Path, trace_dir: Path, trace_phase: str = "fine", trace_steps: list = ()):
+        """
+        Collects per-step measurements of every training phase and writes them,
+        with summary statistics, to a JSON report.
+
+        - step time    : wall time of each training step (input + compute)
+        - data wait    : part of the step spent waiting for the input batch
+        - images / sec : images per second of step time
+        - peak RSS     : peak resident memory of the process
+
+        Args:
+            report_path (Path)  : JSON report destination.
+            trace_dir (Path)    : TensorBoard log directory for the profiler trace.
+            trace_phase (str)   : Phase in which the trace window is captured.
+            trace_steps (list)  : [first, last] step of that phase to trace; empty for no trace.
+        """
+        self.report_path = Path(report_path)
+        self.trace_dir   = Path(trace_dir)
+        self.trace_phase = trace_phase
+        self.trace_steps = tuple(int(step) for step in trace_steps) if trace_steps else None
+        self.phases      = {}
+        self.delivered   = collections.deque()                        # (time, batch size) per batch taken from the input
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Input Probe: Timestamps each batch when the training step receives it
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def instrument(self, data):
+        """
+        Returns `data` as a tf.data.Dataset whose last stage records when each batch
+        reaches the training step. The stage runs in the step's own get-next call
+        (after any prefetch), so the time from step start to delivery is the wait
+        on the input. Keras Sequences (ImageDataGenerator, feature cache) are read
+        the way `fit` reads them: one batch prefetched in a background thread.
+        """
+        if isinstance(data, tf.keras.utils.Sequence):
+            data = self._sequence_dataset(data)
+
+        def delivered(images):
+            self.delivered.append((time.perf_counter(), int(images.shape[0])))
+            return np.float64(0.0)
+
+        def probe(*batch):
+            stamp = tf.py_function(delivered, [tf.nest.flatten(batch)[0]], tf.float64)
+            with tf.control_dependencies([stamp]):
+                return tf.nest.map_structure(tf.identity, batch)
+
+        # tf.data's autotuner would otherwise add a prefetch after the probe, stamping batches ahead of their step
+        options = tf.data.Options()
+        options.experimental_optimization.inject_prefetch = False
+        return data.map(probe).with_options(options)
+
+    @staticmethod
+    def _sequence_dataset(sequence: tf.keras.utils.Sequence) -> tf.data.Dataset:
+        def batches():
+            while True:
+                for index in range(len(sequence)):
+                    yield sequence[index]
+                sequence.on_epoch_end()
+
+        first     = sequence[0]
+        signature = tuple(tf.TensorSpec((None,) + tuple(np.shape(t)[1:]), tf.as_dtype(np.asarray(t).dtype)) for t in first)
+        return tf.data.Dataset.from_generator(batches, output_signature=signature).prefetch(1)
+
+    def callback(self, phase: str, batch_size: int) -> "ProfilingCallback":
+        """Keras callback recording the steps of `phase` (one per `fit_resumable` call)."""
+        record = self.phases.setdefault(phase, {"step_ms": [], "data_wait_ms": [], "images": [], "epochs": []})
+        return ProfilingCallback(self, phase, record, batch_size)
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Report: Per-phase summary + raw per-step series, flat metrics for MLflow
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def summary(self) -> dict:
+        """Flat {metric: value} of every phase, e.g. fine_step_ms_p50, fine_data_wait_fraction."""
+        metrics = {}
+        for phase, record in self.phases.items():
+            for name, value in _phase_summary(record).items():
+                if value is not None:
+                    metrics[f"{phase}_{name}"] = value
+        metrics["peak_rss_mb"] = peak_rss_mb()
+        return metrics
+
+    def write_report(self, **context):
+        """Writes the report; `context` (pipeline, batch size, ...) is stored alongside."""
+        report = {
+                    "context" : context,
+                    "summary" : self.summary(),
+                    "phases"  : {phase: {**_phase_summary(record), **record} for phase, record in self.phases.items()},
+                    "trace"   : {"dir": str(self.trace_dir), "phase": self.trace_phase, "steps": self.trace_steps} if self.trace_steps else None
+                 }
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.report_path, "w") as f:
+            json.dump(report, f, indent=4)
+        logger.info(f"Training profile written to {self.report_path}: {report['summary']}")
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# ProfilingCallback: Step timing, input wait and the optional trace window
+# ────────────────────────────────────────────────────────────────────────────────────────
+class ProfilingCallback(tf.keras.callbacks.Callback):
+    def __init__(self, profiler: TrainingProfiler, phase: str, record: dict, batch_size: int):
+        super().__init__()
+        self.profiler   = profiler
+        self.phase      = phase
+        self.record     = record
+        self.batch_size = batch_size
+        self.tracing    = False
+        self.trace      = profiler.trace_steps if profiler.trace_phase == phase else None
+
+    def on_train_batch_begin(self, batch, logs=None):
+        step = len(self.record["step_ms"])                            # Steps of this phase so far
+        if self.trace and step == self.trace[0] and not self.tracing:
+            tf.profiler.experimental.start(str(self.profiler.trace_dir))
+            self.tracing = True
+        self.started = time.perf_counter()
+
+    def on_train_batch_end(self, batch, logs=None):
+        ended = time.perf_counter()
+        wait, images = None, self.batch_size
+        while self.profiler.delivered:
+            delivered, images = self.profiler.delivered.popleft()
+            if delivered >= self.started:                             # Drop batches taken outside this step
+                wait = (delivered - self.started) * 1000.0
+                break
+
+        self.record["step_ms"].append((ended - self.started) * 1000.0)
+        self.record["data_wait_ms"].append(wait)
+        self.record["images"].append(images)
+
+        if self.tracing and len(self.record["step_ms"]) > self.trace[1]:
+            self._stop_trace()
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.epoch_start = len(self.record["step_ms"])
+
+    def on_epoch_end(self, epoch, logs=None):
+        steps   = slice(self.epoch_start, None)
+        seconds = sum(self.record["step_ms"][steps]) / 1000.0
+        waits   = [w for w in self.record["data_wait_ms"][steps] if w is not None]
+        self.record["epochs"].append({
+                                        "epoch"              : epoch,
+                                        "steps"              : len(self.record["step_ms"][steps]),
+                                        "step_seconds"       : seconds,
+                                        "images_per_sec"     : sum(self.record["images"][steps]) / seconds if seconds else None,
+                                        "data_wait_fraction" : sum(waits) / 1000.0 / seconds if waits and seconds else None,
+                                        "peak_rss_mb"        : peak_rss_mb()
+                                     })
+
+    def on_train_end(self, logs=None):
+        if self.tracing:
+            self._stop_trace()
+
+    def _stop_trace(self):
+        tf.profiler.experimental.stop()
+        self.tracing = False
+        logger.info(f"Profiler trace of {self.phase} steps {self.trace[0]}-{self.trace[1]} saved to {self.profiler.trace_dir}")
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────────────────────────────────────────────────
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024.0 / (1024.0 if sys.platform == "darwin" else 1.0)  # bytes on macOS, KiB on Linux
+
+
+def _phase_summary(record: dict) -> dict:
+    """Steady-state statistics; the first step (tracing / compilation) is reported on its own."""
+    step_ms = record["step_ms"]
+    steady  = step_ms[1:] or step_ms
+    waits   = [w for w in record["data_wait_ms"][1:] if w is not None]
+    seconds = sum(steady) / 1000.0
+    return {
+                "steps"              : len(step_ms),
+                "first_step_ms"      : step_ms[0] if step_ms else None,
+                "step_ms_p50"        : float(np.percentile(steady, 50)) if steady else None,
+                "step_ms_p90"        : float(np.percentile(steady, 90)) if steady else None,
+                "data_wait_ms_p50"   : float(np.percentile(waits, 50)) if waits else None,
+                "data_wait_fraction" : sum(waits) / 1000.0 / seconds if waits and seconds else None,
+                "images_per_sec"     : sum(record["images"][1:] or record["images"]) / seconds if seconds else None
+           }
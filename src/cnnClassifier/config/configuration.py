@@ -2,13 +2,18 @@
 # Imports: Constants, Utilities, and Config Entities
 # ────────────────────────────────────────────────────────────────────────────────────────
 import os
+import dataclasses
 
 from cnnClassifier.constants            import *                              # Centralized constant paths
 from cnnClassifier.utils.common         import read_yaml, create_directories  # Utility functions
 from cnnClassifier.entity.config_entity import ( DataIngestionConfig,
+                                                 DataShardingConfig,
                                                  PrepareBaseModelConfig,
                                                  TrainingConfig,
-                                                 EvaluationConfig
+                                                 DistillationConfig,
+                                                 EvaluationConfig,
+                                                 ModelQuantizationConfig,
+                                                 ServingConfig
                                                )                              # Typed config dataclasses
 
 # ────────────────────────────────────────────────────────────────────────────────────────
@@ -45,6 +50,25 @@ class ConfigurationManager:
                                                    )
         return data_ingestion_config
 
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Data Sharding Config: Setup for writing preprocessed, memory-mappable shards
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def get_data_sharding_config(self) -> DataShardingConfig:
+        config     = self.config.data_sharding
+        source_dir = os.path.join(self.config.data_ingestion.unzip_dir, self.config.data_ingestion.source_dir_name)
+
+        # Return structured config object for the sharding stage
+        data_sharding_config = DataShardingConfig(
+                                                    root_dir              = Path(config.root_dir),
+                                                    manifest_path         = Path(config.manifest_path),
+                                                    training_data         = Path(source_dir, "Train_and_Validation_Set"),
+                                                    test_data             = Path(source_dir, "Test_Set"),
+                                                    params_image_size     = self.params.IMAGE_SIZE,
+                                                    params_shard_size     = int(self.params.SHARD_SIZE),
+                                                    params_input_pipeline = str(self.params.INPUT_PIPELINE)
+                                                 )
+        return data_sharding_config
+
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Base Model Preparation Config: Setup for loading and customizing pretrained model
     # ────────────────────────────────────────────────────────────────────────────────────────
@@ -66,7 +90,12 @@ class ConfigurationManager:
                                                     params_weights          = self.params.WEIGHTS,
                                                     params_classes          = self.params.CLASSES,
                                                     params_freeze_all       = self.params.FREEZE_ALL,
-                                                    params_freeze_till      = self.params.FREEZE_TILL
+                                                    params_freeze_till      = self.params.FREEZE_TILL,
+                                                    params_jit_compile      = bool(self.params.JIT_COMPILE),
+                                                    params_mixed_precision  = str(self.params.MIXED_PRECISION),
+                                                    params_head_type        = str(self.params.HEAD_TYPE),
+                                                    params_head_units       = int(self.params.HEAD_UNITS),
+                                                    params_head_rank        = int(self.params.HEAD_RANK)
                                                           )
         return prepare_base_model_config
 
@@ -91,10 +120,14 @@ class ConfigurationManager:
                                                     trained_model_path         = Path(training.trained_model_path),
                                                     model_export_path          = Path(training.model_export_path),
                                                     updated_base_model_path    = Path(prepare_base_model.updated_base_model_path),
+                                                    base_model_type            = str(prepare_base_model.base_model_type),
                                                     training_data              = Path(training_data),
                                                     params_batch_size          = params.BATCH_SIZE,
                                                     params_is_augmentation     = params.AUGMENTATION,
                                                     params_image_size          = params.IMAGE_SIZE,
+                                                    params_input_pipeline      = str(params.INPUT_PIPELINE),
+                                                    tf_data_cache              = str(training.tf_data_cache or ""),
+                                                    shard_manifest             = Path(self.config.data_sharding.manifest_path),
 
                                                     # New fields for VGG16 fine-tuning
                                                     params_num_classes         = params.CLASSES,
@@ -103,11 +136,83 @@ class ConfigurationManager:
                                                     params_learning_rate_head  = params.LEARNING_RATE_HEAD,
                                                     params_learning_rate_fine  = params.LEARNING_RATE_FINE,
                                                     params_freeze_all          = params.FREEZE_ALL,
-                                                    params_freeze_till         = params.FREEZE_TILL
+                                                    params_freeze_till         = params.FREEZE_TILL,
+                                                    params_jit_compile         = bool(params.JIT_COMPILE),
+                                                    params_mixed_precision     = str(params.MIXED_PRECISION),
+
+                                                    # Bottleneck feature cache for the frozen-backbone head phase
+                                                    feature_cache_dir          = Path(training.feature_cache_dir),
+                                                    params_feature_cache       = bool(params.FEATURE_CACHE),
+                                                    params_feature_cache_views = int(params.FEATURE_CACHE_VIEWS),
+
+                                                    # Resumable training
+                                                    checkpoint_dir             = Path(training.checkpoint_dir),
+                                                    params_checkpoint_every    = int(params.CHECKPOINT_EVERY_STEPS),
+                                                    params_checkpoints_to_keep = int(params.CHECKPOINTS_TO_KEEP),
+
+                                                    # Data-parallel training
+                                                    params_distribution        = str(os.environ.get("TRAINING_DISTRIBUTION", params.DISTRIBUTION)),
+                                                    params_mirrored_replicas   = int(params.MIRRORED_REPLICAS),
+                                                    cluster_workers            = list(training.cluster_workers or []),
+                                                    task_index                 = int(training.task_index),
+
+                                                    # Training profiler
+                                                    params_profile_training    = bool(params.PROFILE_TRAINING),
+                                                    profile_report_path        = Path(training.profile_report_path),
+                                                    profile_trace_dir          = Path(training.profile_trace_dir),
+                                                    params_profile_trace_phase = str(params.PROFILE_TRACE_PHASE),
+                                                    params_profile_trace_steps = list(params.PROFILE_TRACE_STEPS or []),
+
+                                                    # CPU thread topology
+                                                    params_intra_op_threads    = int(params.INTRA_OP_THREADS),
+                                                    params_inter_op_threads    = int(params.INTER_OP_THREADS),
+                                                    params_onednn_opts         = bool(params.ONEDNN_OPTS)
                                            )
         return training_config
 
 
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Distillation Config: Setup for training the student on the teacher's soft targets
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def get_distillation_config(self) -> DistillationConfig:
+        config        = self.config.distillation
+        params        = self.params
+        training_data = os.path.join(self.config.data_ingestion.unzip_dir, self.config.data_ingestion.source_dir_name, "Train_and_Validation_Set")
+
+        # Create distillation-specific directory
+        create_directories([config.root_dir])
+
+        # Return structured config object for the distillation stage
+        distillation_config = DistillationConfig(
+                                                    params_distill          = bool(params.DISTILL),
+                                                    root_dir                = Path(config.root_dir),
+                                                    teacher_model_path      = Path(self.config.training.trained_model_path),
+                                                    teacher_logits_dir      = Path(config.teacher_logits_dir),
+                                                    student_model_path      = Path(config.student_model_path),
+                                                    training_data           = Path(training_data),
+                                                    params_input_pipeline   = str(params.INPUT_PIPELINE),
+                                                    tf_data_cache           = str(self.config.training.tf_data_cache or ""),
+                                                    shard_manifest          = Path(self.config.data_sharding.manifest_path),
+                                                    params_image_size       = params.IMAGE_SIZE,
+                                                    params_batch_size       = params.BATCH_SIZE,
+                                                    params_num_classes      = params.CLASSES,
+                                                    params_weights          = params.WEIGHTS,
+                                                    params_student          = str(params.DISTILL_STUDENT),
+                                                    params_head_type        = str(params.DISTILL_HEAD_TYPE),
+                                                    params_head_units       = int(params.HEAD_UNITS),
+                                                    params_head_rank        = int(params.HEAD_RANK),
+                                                    params_temperature      = float(params.DISTILL_TEMPERATURE),
+                                                    params_alpha            = float(params.DISTILL_ALPHA),
+                                                    params_epochs           = int(params.DISTILL_EPOCHS),
+                                                    params_learning_rate    = float(params.DISTILL_LEARNING_RATE),
+                                                    params_jit_compile      = bool(params.JIT_COMPILE),
+                                                    params_mixed_precision  = str(params.MIXED_PRECISION),
+                                                    params_intra_op_threads = int(params.INTRA_OP_THREADS),
+                                                    params_inter_op_threads = int(params.INTER_OP_THREADS),
+                                                    params_onednn_opts      = bool(params.ONEDNN_OPTS)
+                                                )
+        return distillation_config
+
     # ────────────────────────────────────────────────────────────────────────────────────────
     # Evaluation Config: Setup for model evaluation and MLflow logging
     # ────────────────────────────────────────────────────────────────────────────────────────
@@ -118,15 +223,95 @@ class ConfigurationManager:
         testing_data  = os.path.join(self.config.data_ingestion.unzip_dir, self.config.data_ingestion.source_dir_name, "Test_Set")
         
         eval_config   = EvaluationConfig(
-                         path_of_model         = "artifacts/training/model.h5",                  # Path to trained model
-                         test_data             = Path(testing_data),
-                         mlflow_uri            = os.environ.get("MLFLOW_TRACKING_URI"),          # MLflow tracking URI
-                         all_params            = self.params,                                    # Full parameter dictionary
-                         params_image_size     = self.params.IMAGE_SIZE,
-                         params_batch_size     = self.params.BATCH_SIZE,
-                         experiment_name       = self.config.mlflow.experiment_name,                         
-                         registered_model_name = self.config.mlflow.registered_model_name
-
+                         path_of_model           = "artifacts/training/model.h5",                  # Path to trained model
+                         test_data               = Path(testing_data),
+                         mlflow_uri              = os.environ.get("MLFLOW_TRACKING_URI"),          # MLflow tracking URI
+                         all_params              = self.params,                                    # Full parameter dictionary
+                         params_image_size       = self.params.IMAGE_SIZE,
+                         params_batch_size       = self.params.BATCH_SIZE,
+                         experiment_name         = self.config.mlflow.experiment_name,
+                         registered_model_name   = self.config.mlflow.registered_model_name,
+                         scores_path             = Path("scores.json"),
+                         params_input_pipeline   = str(self.params.INPUT_PIPELINE),
+                         shard_manifest          = Path(self.config.data_sharding.manifest_path),
+                         training_profile_path   = Path(self.config.training.profile_report_path),
+                         quantization_report     = Path(self.config.model_quantization.report_path),
+                         params_intra_op_threads = int(self.params.INTRA_OP_THREADS),
+                         params_inter_op_threads = int(self.params.INTER_OP_THREADS),
+                         params_onednn_opts      = bool(self.params.ONEDNN_OPTS)
                                       )
         return eval_config
-      
\ No newline at end of file
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Student Evaluation Config: Same evaluation, distilled model under its own registry name
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def get_student_evaluation_config(self) -> EvaluationConfig:
+        config = self.config.distillation
+        return dataclasses.replace(
+                                    self.get_evaluation_config(),
+                                    path_of_model         = Path(config.student_model_path),
+                                    registered_model_name = self.config.mlflow.student_registered_model_name,
+                                    scores_path           = Path(config.scores_path),
+                                    training_profile_path = None,                       # The profile belongs to the teacher
+                                    quantization_report   = None                        # So do the TFLite variants
+                                  )
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Model Quantization Config: Setup for TFLite export of the trained model
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def get_model_quantization_config(self) -> ModelQuantizationConfig:
+        config        = self.config.model_quantization
+        source_dir    = os.path.join(self.config.data_ingestion.unzip_dir, self.config.data_ingestion.source_dir_name)
+
+        # Create quantization-specific directory
+        create_directories([config.root_dir])
+
+        # Return structured config object for the quantization stage
+        quantization_config = ModelQuantizationConfig(
+                                                    root_dir                   = Path(config.root_dir),
+                                                    report_path                = Path(config.report_path),
+                                                    trained_model_path         = Path(self.config.training.trained_model_path),
+                                                    training_data              = Path(source_dir, "Train_and_Validation_Set"),
+                                                    test_data                  = Path(source_dir, "Test_Set"),
+                                                    params_image_size          = self.params.IMAGE_SIZE,
+                                                    params_batch_size          = self.params.BATCH_SIZE,
+                                                    params_variants            = list(self.params.QUANTIZATION_VARIANTS),
+                                                    params_calibration_samples = self.params.QUANTIZATION_CALIBRATION_SAMPLES
+                                                      )
+        return quantization_config
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Serving Config: Setup for the Flask prediction service
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def get_serving_config(self) -> ServingConfig:
+        config         = self.config.serving
+        workers        = int(os.environ.get("WEB_CONCURRENCY", config.workers))
+
+        # "auto": split the usable cores evenly between the worker processes
+        intra_op       = config.intra_op_threads
+        if str(intra_op).lower() == "auto":
+            cores      = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+            intra_op   = max(1, cores // max(1, workers))
+
+        # Return structured config object for the serving layer
+        serving_config = ServingConfig(
+                                        registered_model_name = self.config.mlflow.registered_model_name,
+                                        max_batch_size        = int(config.max_batch_size),
+                                        max_wait_ms           = float(config.max_wait_ms),
+                                        max_queue_size        = int(config.max_queue_size),
+                                        default_deadline_ms   = float(config.default_deadline_ms),
+                                        cache_max_entries     = int(config.cache_max_entries),
+                                        cache_ttl_seconds     = float(config.cache_ttl_seconds),
+                                        bind                  = str(config.bind),
+                                        workers               = int(config.workers),
+                                        threads               = int(config.threads),
+                                        preload_model         = bool(config.preload_model),
+                                        model_cache_dir       = Path(config.model_cache_dir),
+                                        reload_poll_seconds   = float(config.reload_poll_seconds),
+                                        warmup_batch_sizes    = [int(size) for size in config.warmup_batch_sizes],
+                                        backend               = str(config.backend),
+                                        intra_op_threads      = int(intra_op),
+                                        inter_op_threads      = int(config.inter_op_threads),
+                                        onednn_opts           = bool(config.onednn_opts)
+                                      )
+        return serving_config
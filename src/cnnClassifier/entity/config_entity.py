@@ -15,12 +15,25 @@ class DataIngestionConfig:
     local_data_file            : Path      # Path to store downloaded file locally
     unzip_dir                  : Path      # Directory to extract and organize raw data
 
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Configuration Entity: Data Sharding Stage
+# ────────────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class DataShardingConfig:
+    root_dir                   : Path      # Directory for the shard files and manifest
+    manifest_path              : Path      # JSON index of subsets, shards and the source fingerprint
+    training_data              : Path      # Source of the training / validation subsets
+    test_data                  : Path      # Source of the test subset
+    params_image_size          : list      # Stored image dimensions [height, width, channels]
+    params_shard_size          : int       # Max images per shard file
+    params_input_pipeline      : str       # Shards are written only for INPUT_PIPELINE "shards"
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Configuration Entity: Base Model Preparation Stage
 # ────────────────────────────────────────────────────────────────────────────────────────
 @dataclass(frozen=True)
 class PrepareBaseModelConfig:
-    base_model_type            : str       # Architecture type (e.g., 'vgg16', 'resnet50')
+    base_model_type            : str       # Backbone registry key (e.g., 'vgg16', 'mobilenet_v2')
     root_dir                   : Path      # Directory to store base model artifacts
     base_model_path            : Path      # Path to original pre-trained model
     updated_base_model_path    : Path      # Path to updated model with custom layers
@@ -31,6 +44,11 @@ class PrepareBaseModelConfig:
     params_classes             : int       # Number of output classes
     params_freeze_all          : bool      # If True, freezes all layers of base model during initial training 
     params_freeze_till         : int       # Number of layers (from the end) to keep trainable during fine-tuning
+    params_jit_compile         : bool      # XLA-compile the train / predict steps
+    params_mixed_precision     : str       # Layer dtype policy: float32, mixed_bfloat16 or mixed_float16
+    params_head_type           : str       # Head feature reduction: flatten_dense, gap, gmp, low_rank or depthwise
+    params_head_units          : int       # Hidden Dense units of the head
+    params_head_rank           : int       # Projection size of the low_rank head
 
 
 # ────────────────────────────────────────────────────────────────────────────────────────
@@ -42,10 +60,14 @@ class TrainingConfig:
     trained_model_path         : Path      # Path to save final trained model
     model_export_path          : Path      # Path to save final trained model for docker visibility
     updated_base_model_path    : Path      # Path to fine-tuned base model
+    base_model_type            : str       # Backbone registry key; selects the fine-tune cut layer
     training_data              : Path      # Path to training dataset
     params_batch_size          : int       # Batch size for training
     params_is_augmentation     : bool      # Flag to enable/disable data augmentation
     params_image_size          : list      # Input image dimensions [height, width, channels]
+    params_input_pipeline      : str       # "generator" (ImageDataGenerator), "tf_data" or "shards"
+    tf_data_cache              : str       # tf_data cache: directory, "memory", or "" to disable
+    shard_manifest             : Path      # Manifest of the preprocessed shards ("shards" pipeline)
 
     # New fields for VGG16 fine-tuning
     params_num_classes         : int       # Number of output classes
@@ -55,6 +77,68 @@ class TrainingConfig:
     params_learning_rate_fine  : float     # Learning rate for fine-tuning
     params_freeze_all          : bool      # Whether to freeze all layers initially
     params_freeze_till         : int       # Number of layers to unfreeze from the end
+    params_jit_compile         : bool      # XLA-compile the train / predict steps
+    params_mixed_precision     : str       # Layer dtype policy: float32, mixed_bfloat16 or mixed_float16
+
+    # Bottleneck feature cache for the frozen-backbone head phase
+    feature_cache_dir          : Path      # Root of the memory-mapped feature caches
+    params_feature_cache       : bool      # Train the head on cached features when FREEZE_ALL is set
+    params_feature_cache_views : int       # Augmented views per image to cache (0: no cache with augmentation)
+
+    # Resumable training
+    checkpoint_dir             : Path      # Checkpoints of weights, optimizer state and progress
+    params_checkpoint_every    : int       # Save every N steps (0: at epoch ends only)
+    params_checkpoints_to_keep : int       # Number of checkpoints kept on disk
+
+    # Data-parallel training
+    params_distribution        : str       # none, mirrored or multi_worker
+    params_mirrored_replicas   : int       # CPU replicas for mirrored
+    cluster_workers            : list      # host:port of every worker when TF_CONFIG is not set
+    task_index                 : int       # Index of this process in cluster_workers
+
+    # Training profiler
+    params_profile_training    : bool      # Record step / input-wait / throughput / memory per phase
+    profile_report_path        : Path      # JSON report of the profiler
+    profile_trace_dir          : Path      # TensorBoard log directory of the profiler trace
+    params_profile_trace_phase : str       # Phase of the trace window: head or fine
+    params_profile_trace_steps : list      # [first, last] step of the trace window; empty for no trace
+
+    # CPU thread topology
+    params_intra_op_threads    : int       # Threads per op (0: TensorFlow default)
+    params_inter_op_threads    : int       # Concurrent independent ops (0: TensorFlow default)
+    params_onednn_opts         : bool      # Enable oneDNN optimized kernels
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Configuration Entity: Knowledge Distillation Stage
+# ────────────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class DistillationConfig:
+    params_distill             : bool      # Run the stage at all (DISTILL)
+    root_dir                   : Path      # Directory for the distillation outputs
+    teacher_model_path         : Path      # Trained model of the training stage (the teacher)
+    teacher_logits_dir         : Path      # Cached teacher logits, one dir per dataset / teacher key
+    student_model_path         : Path      # Path to save the trained student
+    training_data              : Path      # Path to training dataset
+    params_input_pipeline      : str       # "shards" reads the preprocessed shards, anything else the image directory
+    tf_data_cache              : str       # tf_data cache: directory, "memory", or "" to disable
+    shard_manifest             : Path      # Manifest of the preprocessed shards
+    params_image_size          : list      # Input image dimensions [height, width, channels]
+    params_batch_size          : int       # Batch size for distillation
+    params_num_classes         : int       # Number of output classes
+    params_weights             : str       # Student backbone weights (e.g., 'imagenet')
+    params_student             : str       # Backbone registry key of the student
+    params_head_type           : str       # Head feature reduction of the student
+    params_head_units          : int       # Hidden Dense units of the student head
+    params_head_rank           : int       # Projection size of a low_rank student head
+    params_temperature         : float     # Softmax temperature of teacher and student logits
+    params_alpha               : float     # Weight of the hard-label loss (1 - alpha: soft targets)
+    params_epochs              : int       # Student training epochs
+    params_learning_rate       : float     # Student learning rate
+    params_jit_compile         : bool      # XLA-compile the train / predict steps
+    params_mixed_precision     : str       # Layer dtype policy: float32, mixed_bfloat16 or mixed_float16
+    params_intra_op_threads    : int       # Threads per op (0: TensorFlow default)
+    params_inter_op_threads    : int       # Concurrent independent ops (0: TensorFlow default)
+    params_onednn_opts         : bool      # Enable oneDNN optimized kernels
 
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Configuration Entity: Model Evaluation Stage
@@ -69,3 +153,50 @@ class EvaluationConfig:
     params_batch_size          : int       # Batch size for evaluation
     experiment_name            : str       # experiment name to set in mlflow
     registered_model_name      : str       # final model name to set in mlflow model registry
+    scores_path                : Path      # Where the evaluation metrics are written
+    params_input_pipeline      : str       # "shards" reads the test set from the preprocessed shards
+    shard_manifest             : Path      # Manifest of the preprocessed shards
+    training_profile_path      : Path      # Training profiler report; its summary is logged with the run (None: none)
+    quantization_report        : Path      # TFLite variants of this model are registered with it (None: none)
+    params_intra_op_threads    : int       # Threads per op (0: TensorFlow default)
+    params_inter_op_threads    : int       # Concurrent independent ops (0: TensorFlow default)
+    params_onednn_opts         : bool      # Enable oneDNN optimized kernels
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Configuration Entity: TFLite Export and Quantization Stage
+# ────────────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class ModelQuantizationConfig:
+    root_dir                   : Path      # Directory for the exported .tflite variants
+    report_path                : Path      # JSON report of accuracy delta, latency and size per variant
+    trained_model_path         : Path      # Keras model produced by the training stage
+    training_data              : Path      # Source of the INT8 calibration subset
+    test_data                  : Path      # Test set used to measure accuracy deltas
+    params_image_size          : list      # Input image dimensions [height, width, channels]
+    params_batch_size          : int       # Batch size for test-set evaluation
+    params_variants            : list      # Variants to export: float32, dynamic_range, float16, int8
+    params_calibration_samples : int       # Number of calibration images for full-INT8
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Configuration Entity: Model Serving (Flask API)
+# ────────────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class ServingConfig:
+    registered_model_name      : str       # Model name to resolve from the MLflow model registry
+    max_batch_size             : int       # Max images grouped into a single forward pass
+    max_wait_ms                : float     # Max wait (ms) for a batch to fill before it is flushed
+    max_queue_size             : int       # Bound on queued inference requests (<= 0: unbounded)
+    default_deadline_ms        : float     # Per-request deadline when the client sends none (<= 0: none)
+    cache_max_entries          : int       # Capacity of the content-addressed prediction cache
+    cache_ttl_seconds          : float     # Lifetime of a cached prediction (<= 0: no expiry)
+    bind                       : str       # host:port the gunicorn master listens on
+    workers                    : int       # Number of pre-forked worker processes
+    threads                    : int       # Request threads per worker process
+    preload_model              : bool      # Stage the registry model in the master before forking
+    model_cache_dir            : Path      # On-disk cache of registry model versions
+    reload_poll_seconds        : float     # Registry poll interval for hot reload (<= 0: disabled)
+    warmup_batch_sizes         : list      # Batch sizes run through the model before readiness
+    backend                    : str       # keras, or tflite_<variant> to serve the registered version's (memory-mapped) TFLite variant
+    intra_op_threads           : int       # Threads per op in each worker ("auto" resolved to cores / workers)
+    inter_op_threads           : int       # Concurrent independent ops in each worker
+    onednn_opts                : bool      # Enable oneDNN optimized kernels in the workers
@@ -2,32 +2,92 @@
 # Imports: standard libraries
 # ────────────────────────────────────────────────────────────────────────────────────────
 import os
+import threading
 import numpy      as np
 import tensorflow as tf
 
 from   tensorflow.keras.preprocessing import image
+from   dataclasses                    import dataclass
 from   pathlib                        import Path
+from   typing                         import Callable
+
+from   cnnClassifier.constants        import PARAMS_FILE_PATH
+from   cnnClassifier.utils.common     import read_yaml, image_bytes_to_array, apply_precision_policy
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# InferencePlan: Everything a request needs, resolved once at pipeline construction
+# ────────────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class InferencePlan:
+    image_size                 : tuple     # Model input (height, width)
+    class_labels               : tuple     # Output index -> human-readable label
+    forward                    : Callable  # float32 (N, H, W, 3) -> class probabilities (tf.function or TFLite)
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# TFLiteModel: Callable wrapper so a .tflite file can stand in for the Keras model
+# ────────────────────────────────────────────────────────────────────────────────────────
+class TFLiteModel:
+    def __init__(self, model_path, num_threads: int = None):
+        """
+        The interpreter is built from the file path, which TFLite memory-maps read-only
+        rather than copying into the heap: worker processes serving the same staged
+        file share its pages through the page cache. Kernels that repack weights
+        (XNNPACK for float models) still keep a private copy of those.
+
+        Args:
+            model_path (Path)  : TFLite flatbuffer produced by the quantization stage.
+            num_threads (int)  : Interpreter threads (None lets TFLite decide).
+        """
+        self.model_path  = str(model_path)
+        self.interpreter = tf.lite.Interpreter(model_path=self.model_path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+
+        self._input      = self.interpreter.get_input_details()[0]
+        self._output     = self.interpreter.get_output_details()[0]
+        self._batch_size = int(self._input["shape"][0])
+        self._lock       = threading.Lock()                   # An interpreter is not thread-safe
+
+    def __call__(self, batch) -> np.ndarray:
+        """
+        Runs the interpreter on a float32 (N, H, W, 3) batch and returns class probabilities.
+        The input tensor is resized only when the batch size changes.
+        """
+        batch = np.asarray(batch, dtype=np.float32)
+
+        with self._lock:
+            if batch.shape[0] != self._batch_size:
+                self.interpreter.resize_tensor_input(self._input["index"], batch.shape)
+                self.interpreter.allocate_tensors()
+                self._batch_size = batch.shape[0]
+
+            self.interpreter.set_tensor(self._input["index"], batch)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self._output["index"]).copy()
+
 
-from   cnnClassifier.utils.common     import read_yaml
-        
 # ────────────────────────────────────────────────────────────────────────────────────────
 # PredictionPipeline Class: Handles model inference on input image
 # ────────────────────────────────────────────────────────────────────────────────────────
 class PredictionPipeline:
-    def __init__(self, filename, model=None):
+    def __init__(self, filename=None, model=None, params_filepath=PARAMS_FILE_PATH):
         """
-        Initializes the prediction pipeline with the input image filename and model.
+        Initializes the prediction pipeline with an optional input image filename and model,
+        and compiles the inference plan used by every request.
 
         Args:
-            filename (str)         : Path to the image file to be classified.
-            model (tf.keras.Model) : Preloaded model instance (optional).
+            filename (str)         : Default image file to classify when `predict` gets no input.
+            model (tf.keras.Model | TFLiteModel) : Preloaded model instance (optional).
+            params_filepath (Path) : params.yaml holding IMAGE_SIZE and CLASS_LABELS.
         """
         self.filename = filename
         self.model    = model or self._load_default_model()
-        
+
         if self.model is None:
             raise RuntimeError("Model is not loaded. Cannot perform prediction.")
 
+        self.plan     = self._build_plan(self.model, params_filepath)
+
 
     def _load_default_model(self):
         """
@@ -35,51 +95,126 @@ class PredictionPipeline:
         """
         raise RuntimeError("No model provided and fallback is disabled in production.")
 
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Build Plan: Read config once and trace the forward pass with a fixed signature
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _build_plan(model, params_filepath) -> InferencePlan:
+        """
+        Resolves image size and class labels from params.yaml and wraps the model
+        call in a `tf.function` whose batch dimension is left open, so one trace
+        serves every batch size handed over by the batcher. A Keras model runs
+        under the MIXED_PRECISION layer policy, XLA-compiled if JIT_COMPILE is set
+        (one compilation per batch size, paid during warm-up). A TFLiteModel is
+        already a compiled plan and is used as the forward function directly.
+
+        Returns:
+            InferencePlan : Immutable plan shared by all requests.
+        """
+        params        = read_yaml(Path(params_filepath))
+        height, width = params.IMAGE_SIZE[:2]
+
+        if isinstance(model, TFLiteModel):
+            forward = model
+        else:
+            model   = apply_precision_policy(model, str(params.MIXED_PRECISION))
+
+            @tf.function(input_signature=[tf.TensorSpec(shape=[None, height, width, 3], dtype=tf.float32)],
+                         jit_compile=bool(params.JIT_COMPILE))
+            def forward(batch):
+                return model(batch, training=False)
+
+        return InferencePlan(
+                                image_size   = (height, width),
+                                class_labels = tuple(params.CLASS_LABELS),
+                                forward      = forward
+                            )
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Warm-up Method: Pay graph tracing and kernel setup before real traffic arrives
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def warmup(self, batch_sizes=(1,)):
+        """
+        Runs the plan on zero-filled batches so the first real request does not pay
+        for tracing, kernel selection and buffer allocation.
+
+        Args:
+            batch_sizes (iterable[int]) : Batch sizes expected from the batcher.
+        """
+        height, width = self.plan.image_size
+        for batch_size in batch_sizes:
+            self.plan.forward(np.zeros((batch_size, height, width, 3), dtype=np.float32))
 
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Preprocess Method: Converts bytes, arrays or a file path into a model-ready array
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def preprocess(self, image_input=None):
+        """
+        Converts a single input image into one (H, W, 3) sample, rescaled to [0, 1]
+        like the training data (`rescale=1./255`); backbone-specific preprocessing
+        is part of the model.
+
+        Args:
+            image_input (bytes | np.ndarray | str) : Encoded image bytes (decoded in memory),
+                                                     an already decoded RGB array (0-255), or a path.
+                                                     Defaults to the pipeline's filename.
+
+        Returns:
+            np.ndarray : Preprocessed image without the batch dimension.
+        """
+        image_size = self.plan.image_size
+
+        if image_input is None:
+            image_input = self.filename
+
+        # In-memory path: no filesystem round-trip, safe under concurrent requests
+        if isinstance(image_input, (bytes, bytearray, memoryview)):
+            return image_bytes_to_array(bytes(image_input), image_size) / 255.0
+
+        if isinstance(image_input, np.ndarray):
+            if image_input.shape[:2] != image_size:
+                raise ValueError(f"Expected array of shape {image_size + (3,)}, got {image_input.shape}")
+            return image_input.astype(np.float32) / 255.0
+
+        # Load and preprocess input image from disk
+        test_image = image.load_img     (image_input, target_size=image_size)     # Resize to model input
+        return       image.img_to_array (test_image) / 255.0                      # NumPy array in [0, 1]
 
     # ────────────────────────────────────────────────────────────────────────────────────────
-    # Predict Method: Loads model, preprocesses image, performs inference
+    # Predict Batch Method: One forward pass for a stack of preprocessed images
     # ────────────────────────────────────────────────────────────────────────────────────────
-    def predict(self):
+    def predict_batch(self, batch):
+        """
+        Runs the traced forward pass on a batch of preprocessed images.
+
+        Args:
+            batch (np.ndarray) : Array of shape (N, H, W, 3).
+
+        Returns:
+            list[list[dict]]   : One prediction result per input image.
+        """
+        # Perform prediction and extract class index
+        probabilities = self.plan.forward(np.asarray(batch, dtype=np.float32))
+        result        = np.argmax(np.asarray(probabilities), axis=1)
+
+        # Map prediction index to human-readable label
+        labels        = self.plan.class_labels
+        return [[{"image" : labels[index] if index < len(labels) else "Unknown"}] for index in result]
+
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    # Predict Method: Preprocesses the input image and performs single-image inference
+    # ────────────────────────────────────────────────────────────────────────────────────────
+    def predict(self, image_input=None):
         """
         Executes the prediction workflow:
         - Preprocesses input image to match model input shape
         - Performs inference and returns class label
 
+        Args:
+            image_input (bytes | np.ndarray | str) : See `preprocess`; defaults to the pipeline's filename.
+
         Returns:
             list[dict]: Prediction result wrapped in a dictionary for downstream use
         """
-        
-        # Load image size from params.yaml
-        params     = read_yaml(Path("params.yaml"))                               # Read the parms file
-        image_size = tuple(params["IMAGE_SIZE"][:2])                              # Extract (height, width)
-        
-        # Load and preprocess input image
-        test_image = image.load_img     (self.filename, target_size=image_size)   # Resize to model input
-        test_image = image.img_to_array (test_image)                              # Convert to NumPy array
-        test_image = np.expand_dims     (test_image, axis=0)                      # Add batch dimension
-
-        print("Using MLflow-injected model for prediction")
-        # Perform prediction and extract class index
-        result     = np.argmax(self.model.predict(test_image), axis=1)
-        print(result)        # Optional: log raw prediction index
-
-        # Map prediction index to human-readable label
-        # class_map = {
-        #                 0 : "adeno_carcinoma",
-        #                 1 : "large_cell_carcinoma",
-        #                 2 : "normal",
-        #                 3 : "squamous_cell_carcinoma"
-        #             }
-
-        class_map = {
-                        0: "colon_adenocarcinoma",
-                        1: "colon_normal",
-                        2: "lung_adenocarcinoma",
-                        3: "lung_normal",
-                        4: "lung_squamous_cell_carcinoma"
-                    }                  # for LC25000 data
-
-
-        prediction = class_map.get(result[0], "Unknown")
-        return [{"image" : prediction}]
+        test_image = np.expand_dims(self.preprocess(image_input), axis=0)         # Add batch dimension
+        return self.predict_batch(test_image)[0]
@@ -0,0 +1,57 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Configuration Manager, Component Logic, and Logger
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier                          import logger                # Centralized logger
+from cnnClassifier.config.configuration     import ConfigurationManager  # Loads config entities
+from cnnClassifier.components.data_sharding import DataSharding          # Shard writing logic
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Stage Identifier for Logging and Traceability
+# ────────────────────────────────────────────────────────────────────────────────────────
+STAGE_NAME = "STAGE 01b: Data Sharding    "
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Pipeline Class: Orchestrates the Data Sharding Workflow
+# ────────────────────────────────────────────────────────────────────────────────────────
+class DataShardingPipeline:
+    def __init__(self):
+        """
+        Initializes the pipeline class.
+        No state is maintained here—execution is handled in `main()`.
+        """
+        pass
+
+    def main(self):
+        """
+        Executes the data sharding workflow:
+        - Loads config
+        - Skips the rest unless INPUT_PIPELINE is "shards"
+        - Decodes and resizes the extracted images once
+        - Writes uint8 image / label shards and their manifest
+        """
+        config               = ConfigurationManager()
+        data_sharding_config = config.get_data_sharding_config()
+
+        if data_sharding_config.params_input_pipeline != "shards":
+            logger.info(f"Data sharding skipped: INPUT_PIPELINE is {data_sharding_config.params_input_pipeline}")
+            data_sharding_config.root_dir.mkdir(parents=True, exist_ok=True)    # dvc stage output must exist
+            return
+
+        data_sharding        = DataSharding(config=data_sharding_config)
+                                          #(config=ConfigurationManager().get_data_sharding_config())
+        data_sharding.write_shards()
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Entry Point: Executes Pipeline with Logging and Exception Handling
+# ────────────────────────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    try:
+        logger.info("\n" + "*" * 90)
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} started   <<<<<<")
+        obj = DataShardingPipeline()
+        obj.main()
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} completed <<<<<<")
+    except Exception as e:
+        logger.exception(e)  # Logs full traceback for debugging
+        raise e              # Propagates error for upstream visibility
@@ -1,3 +1,14 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# CPU Thread Topology: When run as a DVC stage, applied before the imports below load
+# TensorFlow (oneDNN is only read at import time); main.py applies it itself
+# ────────────────────────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    from cnnClassifier.constants    import PARAMS_FILE_PATH
+    from cnnClassifier.utils.common import read_yaml, configure_tf_threading
+
+    params = read_yaml(PARAMS_FILE_PATH)
+    configure_tf_threading(int(params.INTRA_OP_THREADS), int(params.INTER_OP_THREADS), bool(params.ONEDNN_OPTS))
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Imports: Configuration Manager, Training Component, and Logger
 # ────────────────────────────────────────────────────────────────────────────────────────
@@ -28,7 +39,12 @@ class ModelTrainingPipeline:
         - Loads training configuration
         - Loads updated base model from disk
         - Prepares training and validation data generators
-        - Trains the model and saves final weights
+        - Trains the model and saves final weights, resuming from the latest
+          valid checkpoint if an earlier run was interrupted
+
+        With DISTRIBUTION mirrored / multi_worker, run this script in its own
+        process (the strategy is created before TensorFlow's first op); for local
+        workers use scripts/launch_local_workers.py.
         """
         config          = ConfigurationManager()
         training_config = config.get_training_config()
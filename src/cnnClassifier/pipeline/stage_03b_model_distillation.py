@@ -0,0 +1,84 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# CPU Thread Topology: When run as a DVC stage, applied before the imports below load
+# TensorFlow (oneDNN is only read at import time); main.py applies it itself
+# ────────────────────────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    from cnnClassifier.constants    import PARAMS_FILE_PATH
+    from cnnClassifier.utils.common import read_yaml, configure_tf_threading
+
+    params = read_yaml(PARAMS_FILE_PATH)
+    configure_tf_threading(int(params.INTRA_OP_THREADS), int(params.INTER_OP_THREADS), bool(params.ONEDNN_OPTS))
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Configuration Manager, Distillation / Evaluation Components, and Logger
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier                                    import logger                # Centralized logger instance
+from cnnClassifier.config.configuration               import ConfigurationManager  # Loads config entities
+from cnnClassifier.components.model_distillation      import Distillation          # Teacher -> student training
+from cnnClassifier.components.model_evaluation_mlflow import Evaluation            # Evaluation logic
+from cnnClassifier.utils.common                       import save_json             # Placeholder metrics when skipped
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# To make sure the environment variables are available before config is built
+# ────────────────────────────────────────────────────────────────────────────────────────
+from dotenv import load_dotenv
+load_dotenv()
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Stage Identifier for Logging and Traceability
+# ────────────────────────────────────────────────────────────────────────────────────────
+STAGE_NAME = "STAGE 03b: Model Distillation"
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Pipeline Class: Orchestrates Knowledge Distillation Workflow
+# ────────────────────────────────────────────────────────────────────────────────────────
+class ModelDistillationPipeline:
+    def __init__(self):
+        """
+        Initializes the pipeline class.
+        No state is maintained here—execution is handled in `main()`.
+        """
+        pass
+
+    def main(self):
+        """
+        Executes the distillation workflow (only with DISTILL: True):
+        - Loads the trained model of stage 03 as the teacher
+        - Caches the teacher's logits over the training set (reused while data and teacher are unchanged)
+        - Builds the DISTILL_STUDENT backbone with the DISTILL_HEAD_TYPE head
+        - Trains the student on hard labels and the teacher's soft targets, saves it
+        - Evaluates the student on the test set and logs / registers it in MLflow
+          under its own registered model name
+        """
+        config              = ConfigurationManager()
+        distillation_config = config.get_distillation_config()
+
+        if not distillation_config.params_distill:
+            logger.info("Distillation skipped: DISTILL is False; no student is trained or registered")
+            save_json(path=config.get_student_evaluation_config().scores_path, data={"skipped": True})  # dvc metrics output must exist
+            return
+
+        distillation        = Distillation(config=distillation_config)
+        distillation.load_teacher()
+        distillation.input_data()
+        distillation.cache_teacher_logits()
+        distillation.build_student()
+        distillation.train()
+
+        evaluation          = Evaluation(config.get_student_evaluation_config())
+        evaluation.evaluation()
+        evaluation.log_into_mlflow()
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Entry Point: Executes Pipeline with Logging and Exception Handling
+# ────────────────────────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    try:
+        logger.info("\n" + "*" * 90)
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} started   <<<<<<")
+        obj = ModelDistillationPipeline()
+        obj.main()
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} completed <<<<<<")
+    except Exception as e:
+        logger.exception(e)  # Logs full traceback for debugging
+        raise e              # Propagates error for upstream visibility
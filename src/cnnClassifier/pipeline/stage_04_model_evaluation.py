@@ -1,3 +1,14 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# CPU Thread Topology: When run as a DVC stage, applied before the imports below load
+# TensorFlow (oneDNN is only read at import time); main.py applies it itself
+# ────────────────────────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    from cnnClassifier.constants    import PARAMS_FILE_PATH
+    from cnnClassifier.utils.common import read_yaml, configure_tf_threading
+
+    params = read_yaml(PARAMS_FILE_PATH)
+    configure_tf_threading(int(params.INTRA_OP_THREADS), int(params.INTER_OP_THREADS), bool(params.ONEDNN_OPTS))
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Imports: Configuration Manager, Evaluation Component, and Logger
 # ────────────────────────────────────────────────────────────────────────────────────────
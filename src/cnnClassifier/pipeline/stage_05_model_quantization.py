@@ -0,0 +1,52 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Imports: Configuration Manager, Quantization Component, and Logger
+# ────────────────────────────────────────────────────────────────────────────────────────
+from cnnClassifier                               import logger                # Centralized logger instance
+from cnnClassifier.config.configuration          import ConfigurationManager  # Loads config entities
+from cnnClassifier.components.model_quantization import ModelQuantization     # TFLite export logic
+
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Stage Identifier for Logging and Traceability
+# ────────────────────────────────────────────────────────────────────────────────────────
+STAGE_NAME = "STAGE 05: Model Quantization"
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Pipeline Class: Orchestrates TFLite Export and Variant Comparison
+# ────────────────────────────────────────────────────────────────────────────────────────
+class ModelQuantizationPipeline:
+    def __init__(self):
+        """
+        Initializes the pipeline class.
+        No state is maintained here—execution is handled in `main()`.
+        """
+        pass
+
+    def main(self):
+        """
+        Executes the quantization workflow:
+        - Loads the trained Keras model
+        - Exports dynamic-range, float16 and full-INT8 TFLite variants
+        - Records test accuracy delta, latency and size per variant
+        """
+        config              = ConfigurationManager()
+        quantization_config = config.get_model_quantization_config()
+        quantization        = ModelQuantization(config=quantization_config)
+                                              #(config=ConfigurationManager().get_model_quantization_config())
+        quantization.load_model()
+        quantization.export_variants()
+        quantization.evaluate_variants()
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Entry Point: Executes Pipeline with Logging and Exception Handling
+# ────────────────────────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    try:
+        logger.info("\n" + "*" * 90)
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} started   <<<<<<")
+        obj = ModelQuantizationPipeline()
+        obj.main()
+        logger.info(f"\n\t\t\t>>>>>> {STAGE_NAME} completed <<<<<<")
+    except Exception as e:
+        logger.exception(e)  # Logs full traceback for debugging
+        raise e              # Propagates error for upstream visibility
@@ -1,14 +1,16 @@
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Standard Library and Third-Party Imports
+#   joblib, numpy and PIL are imported inside the functions that use them, so
+#   importing the config layer does not pay for them.
 # ────────────────────────────────────────────────────────────────────────────────────────
 import os
 import sys
 import json
 import yaml
-import joblib
 import base64
 
 from pathlib        import Path
+from io             import BytesIO
 from typing         import Any
 
 from box            import ConfigBox            # converts dict to box for easy element access
@@ -110,6 +112,8 @@ def save_bin(data: Any, path: Path):
              data (Any)  : Object to be serialized.
              path (Path) : Destination path.
     """
+    import joblib
+
     joblib.dump(value=data, filename=path)
     logger.info(f"Binary file saved at: {path}")
 
@@ -124,6 +128,8 @@ def load_bin(path: Path) -> Any:
     Returns:
              Any         : Deserialized Python object.
     """
+    import joblib
+
     data = joblib.load(path)
     logger.info(f"Binary file loaded from : {path}")
     return data
@@ -146,6 +152,16 @@ def get_size(path: Path) -> str:
     size_in_kb = round(os.path.getsize(path) / 1024)
     return f"~ {size_in_kb} KB"
 
+def file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in 1 MiB chunks."""
+    import hashlib
+
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
 # ────────────────────────────────────────────────────────────────────────────────────────
 # Base64 Image Encoding/Decoding (for API or UI integration)
 # ────────────────────────────────────────────────────────────────────────────────────────
@@ -163,6 +179,58 @@ def decodeImage(imgstring: str, fileName: str):
         f.write(imgdata)
 
 
+def decode_base64_image(imgstring: str) -> bytes:
+    """
+    Decodes a base64 image string into raw image bytes, without touching disk.
+
+    Args:
+           imgstring (str) : Base64-encoded image string.
+
+    Raises:
+           ValueError      : If the string is not valid base64 (binascii.Error).
+
+    Returns:
+           bytes           : Encoded image file content (JPEG, PNG, ...).
+    """
+    return base64.b64decode(imgstring)
+
+
+def image_bytes_to_array(data: bytes, target_size: tuple) -> "np.ndarray":
+    """
+    Decodes image bytes and resizes them to the model input size, fully in memory.
+
+    Mirrors `tf.keras.preprocessing.image.load_img` + `img_to_array`
+    (RGB conversion, nearest-neighbour resize, float32 output).
+
+    Args:
+           data (bytes)        : Encoded image file content.
+           target_size (tuple) : Target (height, width).
+
+    Raises:
+           ValueError          : If the bytes cannot be decoded as an image, are truncated,
+                                 or exceed PIL's decompression-bomb pixel limit.
+
+    Returns:
+           np.ndarray          : Float32 array of shape (height, width, 3).
+    """
+    import numpy as np
+    from   PIL   import Image, UnidentifiedImageError
+
+    height, width = target_size
+    try:
+        img = Image.open(BytesIO(data))
+        img.load()
+
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        if img.size != (width, height):
+            img = img.resize((width, height), Image.NEAREST)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError) as e:
+        raise ValueError(f"Could not decode image bytes: {e}")
+
+    return np.asarray(img, dtype=np.float32)
+
+
 def encodeImageIntoBase64(croppedImagePath: str) -> bytes:
     """
     Encodes an image file into base64 format.
@@ -174,4 +242,82 @@ def encodeImageIntoBase64(croppedImagePath: str) -> bytes:
                bytes                   : Base64-encoded image content.
     """
     with open(croppedImagePath, "rb") as f:
-        return base64.b64encode(f.read())
\ No newline at end of file
+        return base64.b64encode(f.read())
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# TensorFlow CPU Thread Topology
+# ────────────────────────────────────────────────────────────────────────────────────────
+
+def configure_tf_threading(intra_op_threads: int, inter_op_threads: int, onednn_opts: bool):
+    """
+    Applies intra-op / inter-op thread counts and the oneDNN switch to TensorFlow.
+
+    Thread counts must be set before TensorFlow runs its first op; oneDNN only
+    takes effect when set before TensorFlow is imported. Settings that arrive
+    too late are logged and skipped rather than failing the caller.
+
+    Args:
+           intra_op_threads (int) : Threads used inside a single op; 0 keeps TensorFlow's default.
+           inter_op_threads (int) : Independent ops run in parallel; 0 keeps TensorFlow's default.
+           onednn_opts (bool)     : Value for TF_ENABLE_ONEDNN_OPTS.
+    """
+    flag = "1" if onednn_opts else "0"
+    if "tensorflow" in sys.modules and os.environ.get("TF_ENABLE_ONEDNN_OPTS", "1") != flag:
+        logger.warning(f"TensorFlow already imported; export TF_ENABLE_ONEDNN_OPTS={flag} before start-up to apply it")
+    os.environ["TF_ENABLE_ONEDNN_OPTS"] = flag
+
+    import tensorflow as tf
+
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+    except RuntimeError as e:
+        logger.warning(f"TensorFlow runtime already initialised, thread settings left unchanged: {e}")
+        return
+    logger.info(f"TensorFlow threads: intra_op={intra_op_threads or 'default'}, "
+                f"inter_op={inter_op_threads or 'default'}, oneDNN={onednn_opts}")
+
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Mixed Precision: Per-layer dtype policy with a float32 output layer
+# ────────────────────────────────────────────────────────────────────────────────────────
+PRECISION_POLICIES = ("float32", "mixed_bfloat16", "mixed_float16")
+
+def apply_precision_policy(model, policy: str):
+    """
+    Returns `model` with every layer running under `policy`, except the output
+    layer, which stays float32 so the softmax and the loss are computed at full
+    precision. Weights and trainable flags are carried over. The model is returned
+    unchanged if it already matches.
+
+    Args:
+           model (tf.keras.Model) : Functional Keras model.
+           policy (str)           : 'float32', 'mixed_bfloat16' (CPUs with AVX512-BF16 / AMX) or
+                                    'mixed_float16' (GPUs).
+
+    Returns:
+           tf.keras.Model         : Model with the requested layer policies.
+    """
+    if policy not in PRECISION_POLICIES:
+        raise ValueError(f"Unsupported precision policy: {policy}; expected one of {PRECISION_POLICIES}")
+
+    import tensorflow as tf
+
+    outputs = set(model.output_names)
+    target  = {layer.name: ("float32" if layer.name in outputs else policy)
+               for layer in model.layers if not isinstance(layer, tf.keras.layers.InputLayer)}
+    if all(layer.dtype_policy.name == target[layer.name] for layer in model.layers if layer.name in target):
+        return model
+
+    def clone_layer(layer):
+        config = layer.get_config()
+        if layer.name in target:
+            config["dtype"] = target[layer.name]
+        return layer.__class__.from_config(config)
+
+    converted = tf.keras.models.clone_model(model, clone_function=clone_layer)
+    converted.set_weights(model.get_weights())
+    for source, layer in zip(model.layers, converted.layers):
+        layer.trainable = source.trainable
+
+    logger.info(f"Model layers set to {policy} (output layer float32)")
+    return converted
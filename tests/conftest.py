@@ -0,0 +1,30 @@
+# ────────────────────────────────────────────────────────────────────────────────────────
+# Shared Test Setup: Import path and small on-disk image datasets
+# ────────────────────────────────────────────────────────────────────────────────────────
+import sys
+import numpy as np
+import pytest
+
+from   pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))                             # Same as the editable install in requirements.txt
+
+
+def write_images(directory: Path, counts: dict, size: tuple = (24, 20), seed: int = 0) -> Path:
+    """Writes `counts[class_name]` random RGB images per class sub-directory."""
+    from PIL import Image
+
+    rng = np.random.default_rng(seed)
+    for class_name, count in counts.items():
+        (directory / class_name).mkdir(parents=True, exist_ok=True)
+        for index in range(count):
+            pixels = rng.integers(0, 256, (*size, 3), dtype=np.uint8)
+            Image.fromarray(pixels).save(directory / class_name / f"img_{index:03d}.png")
+    return directory
+
+
+@pytest.fixture(scope="session")
+def image_dir(tmp_path_factory) -> Path:
+    """Three classes with uneven counts, so per-class split boundaries are exercised."""
+    return write_images(tmp_path_factory.mktemp("images"), {"b_cls": 7, "a_cls": 10, "c_cls": 6})
@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from cnnClassifier.components.distribution import Distribution
+from conftest                              import ROOT
+
+# One SGD step on a fixed batch; with two replicas each sees half the batch and the gradients are averaged
+PROBE = """
+import json, sys
+import numpy as np
+import tensorflow as tf
+from cnnClassifier.components.distribution import Distribution
+
+distribution = Distribution(sys.argv[1], mirrored_replicas=2)
+with distribution.strategy.scope():
+    model = tf.keras.Sequential([tf.keras.Input((4,)), tf.keras.layers.Dense(2, kernel_initializer="ones", activation="softmax")])
+    model.compile(optimizer=tf.keras.optimizers.SGD(0.1), loss="categorical_crossentropy")
+rng    = np.random.default_rng(0)
+images = rng.normal(size=(8, 4)).astype(np.float32)
+labels = np.eye(2, dtype=np.float32)[rng.integers(0, 2, 8)]
+model.fit(images, labels, batch_size=8, epochs=1, shuffle=False, verbose=0)
+print(json.dumps({"replicas": distribution.replicas, "kernel": model.get_weights()[0].tolist()}))
+"""
+
+
+def _probe(mode, tmp_path):
+    env    = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), str(ROOT)]), "TF_CPP_MIN_LOG_LEVEL": "3"}
+    result = subprocess.run([sys.executable, "-c", PROBE, mode], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.splitlines()[-1])                # Log lines come first
+
+
+def test_none_is_a_single_chief_replica():
+    distribution = Distribution("none")
+    assert (distribution.replicas, distribution.num_workers, distribution.is_chief) == (1, 1, True)
+    assert distribution.strategy is tf.distribute.get_strategy()
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported DISTRIBUTION"):
+        Distribution("parameter_server")
+
+
+def test_mirrored_replicas_average_to_the_single_replica_step(tmp_path):
+    none, mirrored = _probe("none", tmp_path), _probe("mirrored", tmp_path)
+    assert (none["replicas"], mirrored["replicas"]) == (1, 2)
+    np.testing.assert_allclose(mirrored["kernel"], none["kernel"], rtol=1e-5, atol=1e-6)
+
+
+def test_mirrored_after_the_runtime_started_explains_the_fix():
+    tf.constant(1.0) + 1.0
+    with pytest.raises(RuntimeError, match="must be set up before TensorFlow runs its first op"):
+        Distribution("mirrored", mirrored_replicas=2)
+
+
+def test_tf_config_is_built_from_the_worker_list(monkeypatch):
+    monkeypatch.delenv("TF_CONFIG", raising=False)
+    monkeypatch.setenv("TRAINING_TASK_INDEX", "1")
+    tf_config = Distribution._tf_config(["host-a:2222", "host-b:2222"], task_index=0)
+
+    assert tf_config == {"cluster": {"worker": ["host-a:2222", "host-b:2222"]}, "task": {"type": "worker", "index": 1}}
+    assert json.loads(os.environ["TF_CONFIG"]) == tf_config
+
+    # An exported TF_CONFIG wins over the configured list
+    assert Distribution._tf_config(["other:1"], task_index=0) == tf_config
+
+    monkeypatch.delenv("TF_CONFIG")
+    with pytest.raises(ValueError, match="needs TF_CONFIG"):
+        Distribution._tf_config([], task_index=0)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from cnnClassifier.components.input_pipeline import DirectoryDataset, VALIDATION_SPLIT
+from cnnClassifier.components.feature_cache  import FeatureCache
+from conftest                                import write_images
+
+IMAGE_SIZE = [16, 12, 3]
+
+
+def _backbone():
+    tf.keras.utils.set_random_seed(0)
+    inputs = tf.keras.layers.Input(IMAGE_SIZE)
+    x      = tf.keras.layers.Conv2D(4, 3)(inputs)
+    return tf.keras.Model(inputs, tf.keras.layers.GlobalAveragePooling2D()(x))
+
+
+def test_features_round_trip(image_dir, tmp_path):
+    data     = DirectoryDataset(image_dir, IMAGE_SIZE, batch_size=4, validation_split=VALIDATION_SPLIT)
+    backbone = _backbone()
+    cache    = FeatureCache(tmp_path, data, backbone, views=2)
+    cache.build()
+
+    for subset in ("training", "validation"):
+        images, one_hot = map(np.concatenate, zip(*data.dataset(subset, shuffle=False, repeat=False).as_numpy_iterator()))
+        expected        = backbone.predict(images, verbose=0)
+        sequence        = cache.sequence(subset, batch_size=4, num_classes=3, shuffle=False)
+
+        assert sequence.samples == data.samples(subset)
+        assert sequence.views == (2 if subset == "training" else 1)
+        assert len(sequence) == max(1, data.samples(subset) // 4)
+
+        # Unaugmented views are identical, so every row matches its image whichever view is drawn
+        for index in range(len(sequence)):
+            features, labels = sequence[index]
+            rows             = np.sort(sequence.rows[index * 4:(index + 1) * 4]) % sequence.samples
+            np.testing.assert_allclose(features, expected[rows], rtol=1e-2, atol=1e-3)   # Stored as float16
+            assert np.array_equal(labels, one_hot[rows])
+
+    # Same data and backbone: the cache is reused, not rebuilt
+    stamp = (cache.path / "meta.json").stat().st_mtime_ns
+    FeatureCache(tmp_path, data, backbone, views=2).build()
+    assert (cache.path / "meta.json").stat().st_mtime_ns == stamp
+
+
+def test_empty_subset_is_rejected(tmp_path):
+    write_images(tmp_path / "images", {"a_cls": 2, "b_cls": 2})
+    data = DirectoryDataset(tmp_path / "images", IMAGE_SIZE, batch_size=2, validation_split=VALIDATION_SPLIT)
+    assert data.samples("validation") == 0                        # int(0.2 * 2) images per class
+
+    with pytest.raises(ValueError, match="No validation images"):
+        FeatureCache(tmp_path / "cache", data, _backbone()).build()
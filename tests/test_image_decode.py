@@ -0,0 +1,51 @@
+import base64
+import threading
+import numpy as np
+import pytest
+
+from io import BytesIO
+from PIL import Image
+
+from cnnClassifier.utils.common import decode_base64_image, image_bytes_to_array
+
+
+def _png(size=(30, 20), mode="RGB") -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, size, color=128 if mode == "L" else (10, 20, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_decodes_and_resizes_in_memory():
+    array = image_bytes_to_array(_png(), target_size=(8, 6))
+    assert array.shape == (8, 6, 3) and array.dtype == np.float32
+    assert array[0, 0].tolist() == [10.0, 20.0, 30.0]
+    assert image_bytes_to_array(_png(mode="L"), target_size=(4, 4)).shape == (4, 4, 3)
+
+
+def test_base64_round_trip():
+    data = _png()
+    assert decode_base64_image(base64.b64encode(data).decode("ascii")) == data
+
+
+@pytest.mark.parametrize("data", [b"not an image", b"", _png()[:60]], ids=["garbage", "empty", "truncated"])
+def test_undecodable_bytes_raise_value_error(data):
+    with pytest.raises(ValueError):
+        image_bytes_to_array(data, target_size=(8, 8))
+
+
+def test_decompression_bomb_raises_value_error(monkeypatch):
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)            # 30 x 20 is more than twice the limit
+    with pytest.raises(ValueError, match="decompression bomb"):
+        image_bytes_to_array(_png(), target_size=(8, 8))
+
+
+def test_concurrent_decodes_do_not_interfere():
+    images  = {index: _png(size=(10 + index, 10)) for index in range(8)}
+    results = {}
+    threads = [threading.Thread(target=lambda i=i: results.__setitem__(i, image_bytes_to_array(images[i], (5, 5 + i))))
+               for i in images]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert {index: array.shape for index, array in results.items()} == {i: (5, 5 + i, 3) for i in images}
@@ -0,0 +1,21 @@
+import importlib.util
+import pytest
+
+from conftest import ROOT
+
+spec      = importlib.util.spec_from_file_location("import_time_benchmark", ROOT / "scripts" / "import_time_benchmark.py")
+benchmark = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(benchmark)
+
+
+@pytest.mark.parametrize("module", list(benchmark.BUDGETS))
+def test_entry_modules_do_not_load_heavy_dependencies(module):
+    result = benchmark.measure(module, benchmark.BUDGETS[module]["forbidden"], repeats=1)   # Timings are machine-dependent
+    if result.get("error", "").startswith("ModuleNotFoundError"):
+        pytest.skip(result["error"])                              # e.g. gdown, not installed everywhere
+    assert "error" not in result, result["error"]
+    assert result["forbidden_loaded"] == []
+
+
+def test_probe_reports_a_loaded_dependency():
+    assert benchmark.measure("json", ["json"], repeats=1)["forbidden_loaded"] == ["json"]
@@ -0,0 +1,104 @@
+import shutil
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from cnnClassifier.components.input_pipeline        import DirectoryDataset, ShardedDataset, VALIDATION_SPLIT
+from cnnClassifier.components.data_sharding         import DataSharding
+from cnnClassifier.entity.config_entity             import DataShardingConfig
+from cnnClassifier.pipeline.stage_01b_data_sharding import DataShardingPipeline
+from conftest                                       import ROOT, write_images
+
+IMAGE_SIZE = [16, 12, 3]
+
+
+def _flow(directory, subset):
+    generator = tf.keras.preprocessing.image.ImageDataGenerator(rescale=1./255, validation_split=VALIDATION_SPLIT)
+    return generator.flow_from_directory(directory, target_size=IMAGE_SIZE[:2], batch_size=4, subset=subset,
+                                         shuffle=False, interpolation="bilinear")
+
+
+@pytest.fixture(scope="module")
+def data(image_dir):
+    return DirectoryDataset(image_dir, IMAGE_SIZE, batch_size=4, validation_split=VALIDATION_SPLIT)
+
+
+@pytest.mark.parametrize("subset", ["training", "validation"])
+def test_listing_matches_flow_from_directory(image_dir, data, subset):
+    flow          = _flow(image_dir, subset)
+    paths, labels = data._files[subset]
+
+    assert data.class_indices == flow.class_indices == {"a_cls": 0, "b_cls": 1, "c_cls": 2}
+    assert data.samples(subset) == flow.samples
+    assert [str(path) for path in flow.filepaths] == paths
+    assert list(flow.classes) == labels
+
+
+@pytest.mark.parametrize("subset", ["training", "validation"])
+def test_batches_match_flow_from_directory(image_dir, data, subset):
+    flow            = _flow(image_dir, subset)
+    images, one_hot = map(np.concatenate, zip(*data.dataset(subset, shuffle=False, repeat=False).as_numpy_iterator()))
+    expected        = np.concatenate([flow[index][0] for index in range(len(flow))])
+
+    assert images.dtype == np.float32 and 0.0 <= images.min() and images.max() <= 1.0
+    assert np.array_equal(one_hot.argmax(axis=1), flow.classes)
+    assert np.abs(images - expected).mean() < 0.05               # Resize kernels differ slightly from PIL's
+
+
+def test_tiff_files_are_listed_and_decoded(tmp_path):
+    from PIL import Image
+
+    write_images(tmp_path, {"a_cls": 2, "b_cls": 2})
+    for class_name in ("a_cls", "b_cls"):
+        png = tmp_path / class_name / "img_000.png"
+        Image.open(png).save(png.with_suffix(".tiff"))
+        png.unlink()
+
+    data   = DirectoryDataset(tmp_path, IMAGE_SIZE, batch_size=2)
+    images = [image for image, _ in data.decoded("training").as_numpy_iterator()]
+    assert len(images) == 4 and all(image.shape == (16, 12, 3) for image in images)
+
+
+def test_shards_round_trip(image_dir, data, tmp_path):
+    root   = tmp_path / "data_sharding"
+    config = DataShardingConfig(
+                                  root_dir              = root,
+                                  manifest_path         = root / "manifest.json",
+                                  training_data         = image_dir,
+                                  test_data             = image_dir,
+                                  params_image_size     = IMAGE_SIZE,
+                                  params_shard_size     = 5,
+                                  params_input_pipeline = "shards"
+                               )
+    DataSharding(config).write_shards()
+    shards = ShardedDataset(config.manifest_path, batch_size=4)
+
+    assert shards.class_indices == data.class_indices
+    for subset in ("training", "validation"):
+        decoded = list(data.decoded(subset).as_numpy_iterator())
+        assert shards.samples(subset) == len(decoded)
+        assert list(shards.labels(subset)) == [label for _, label in decoded]
+
+        images, one_hot = map(np.concatenate, zip(*shards.dataset(subset, shuffle=False, repeat=False).as_numpy_iterator()))
+        assert np.array_equal(images, np.stack([image for image, _ in decoded]) / np.float32(255.0))
+        assert np.array_equal(one_hot.argmax(axis=1), shards.labels(subset))
+
+    # Targets stay with their images under shuffling
+    targets = np.arange(shards.samples("training"), dtype=np.float32)[:, None]
+    for images, (one_hot, rows) in shards.dataset("training", shuffle=True, repeat=False, targets=targets):
+        assert np.array_equal(one_hot.numpy().argmax(axis=1), shards.labels("training")[rows.numpy()[:, 0].astype(int)])
+
+    # An unchanged source is not rewritten
+    stamp = config.manifest_path.stat().st_mtime_ns
+    DataSharding(config).write_shards()
+    assert config.manifest_path.stat().st_mtime_ns == stamp
+
+
+def test_sharding_stage_is_a_no_op_for_other_pipelines(tmp_path, monkeypatch):
+    shutil.copytree(ROOT / "config", tmp_path / "config")
+    (tmp_path / "params.yaml").write_text((ROOT / "params.yaml").read_text().replace(
+                                          "INPUT_PIPELINE     : generator", "INPUT_PIPELINE     : tf_data"))
+    monkeypatch.chdir(tmp_path)
+
+    DataShardingPipeline().main()                                 # No ingested data needed: nothing is read
+    assert list((tmp_path / "artifacts" / "data_sharding").iterdir()) == []
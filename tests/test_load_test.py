@@ -0,0 +1,33 @@
+import importlib.util
+import pytest
+
+from conftest import ROOT
+
+spec      = importlib.util.spec_from_file_location("load_test", ROOT / "scripts" / "load_test.py")
+load_test = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(load_test)
+
+
+@pytest.mark.parametrize("values, q, expected", [
+    (list(range(1, 101)), 50,   50),
+    (list(range(1, 101)), 99,   99),
+    (list(range(1, 101)), 99.9, 100),
+    (list(range(1, 101)), 100,  100),
+    (list(range(1, 101)), 0,    1),
+    ([1, 2, 3, 4],        50,   2),
+    ([1, 2, 3, 4],        75,   3),                               # ceil(0.75 * 4) = 3rd value, not the 4th
+    ([1, 2, 3, 4],        76,   4),
+    ([7],                 99,   7),
+])
+def test_percentile_is_nearest_rank(values, q, expected):
+    assert load_test.percentile(values, q) == expected
+
+
+def test_percentile_whole_ranks_are_exact():
+    values = list(range(1, 101))
+    for q in range(1, 101):                                       # q / 100 * n would land above some whole ranks
+        assert load_test.percentile(values, q) == q
+
+
+def test_percentile_of_nothing():
+    assert load_test.percentile([], 50) is None
@@ -0,0 +1,89 @@
+import time
+import threading
+import numpy as np
+import pytest
+
+from cnnClassifier.components.micro_batcher import MicroBatcher, QueueFullError, DeadlineExceededError
+
+
+@pytest.fixture
+def blocked_batcher():
+    """Batcher whose forward pass waits on `release`, with room for one queued item."""
+    release = threading.Event()
+
+    def predict(batch):
+        release.wait(5)
+        return [float(item.sum()) for item in batch]
+
+    batcher = MicroBatcher(predict, max_batch_size=1, max_wait_ms=1, max_queue_size=1)
+    yield batcher, release
+    release.set()
+    batcher.close()
+
+
+def test_results_return_to_their_callers():
+    batcher = MicroBatcher(lambda batch: [float(item.sum()) for item in batch], max_batch_size=4, max_wait_ms=20)
+    try:
+        futures = [batcher.submit(np.full(3, value, dtype=np.float32)) for value in range(8)]
+        assert [future.result(5) for future in futures] == [3.0 * value for value in range(8)]
+        assert batcher.stats()["batches_run"] < 8                 # Items were actually batched
+    finally:
+        batcher.close()
+
+
+def test_full_queue_rejects_and_admit_does_not_queue(blocked_batcher):
+    batcher, release = blocked_batcher
+    running = batcher.submit(np.zeros(1))
+    while batcher.stats()["queue_depth"]:                         # Worker has taken the first item
+        time.sleep(0.01)
+    queued  = batcher.submit(np.ones(1))
+
+    with pytest.raises(QueueFullError) as rejected:
+        batcher.admit()
+    assert rejected.value.retry_after_s >= 1
+    with pytest.raises(QueueFullError):
+        batcher.submit(np.ones(1))
+    assert batcher.stats()["queue_depth"] == 1
+    assert batcher.stats()["rejected_full"] == 2
+
+    release.set()
+    assert running.result(5) == 0.0 and queued.result(5) == 1.0
+    batcher.admit()                                               # Room again
+
+
+def test_deadline_that_cannot_be_met_is_rejected_on_submit():
+    batcher = MicroBatcher(lambda batch: [float(item.sum()) for item in batch], max_batch_size=1, max_wait_ms=1)
+    try:
+        batcher.batch_seconds = 0.5                               # Pretend one forward pass takes 500 ms
+        with pytest.raises(DeadlineExceededError):
+            batcher.submit(np.zeros(1), deadline=time.monotonic() + 0.1)
+        assert batcher.stats()["rejected_late"] == 1
+        assert batcher.predict(np.zeros(1), deadline=time.monotonic() + 5) == 0.0
+    finally:
+        batcher.close()
+
+
+def test_item_expiring_in_the_queue_never_reaches_the_model():
+    release, seen = threading.Event(), []
+
+    def predict(batch):
+        seen.append(len(batch))
+        release.wait(5)
+        return [0.0] * len(batch)
+
+    batcher = MicroBatcher(predict, max_batch_size=1, max_wait_ms=1)
+    try:
+        running = batcher.submit(np.zeros(1))
+        while batcher.stats()["queue_depth"]:
+            time.sleep(0.01)
+        expired = batcher.submit(np.zeros(1), deadline=time.monotonic() + 0.05)
+        time.sleep(0.1)
+        release.set()
+
+        running.result(5)
+        with pytest.raises(DeadlineExceededError):
+            expired.result(5)
+        assert seen == [1]
+        assert batcher.stats()["expired"] == 1
+    finally:
+        batcher.close()
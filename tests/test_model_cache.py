@@ -0,0 +1,94 @@
+import os
+import pytest
+
+from pathlib import Path
+
+from cnnClassifier.components.model_cache import ModelArtifactCache
+
+MODEL_NAME = "lung_cancer_classifier"
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """File-store MLflow registry with version 1 of MODEL_NAME in Production."""
+    import mlflow
+    from mlflow.tracking import MlflowClient
+
+    monkeypatch.chdir(tmp_path)
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+
+    model = tmp_path / "model"
+    (model / "data").mkdir(parents=True)
+    (model / "MLmodel").write_text("flavors: {}\n")
+    (model / "data" / "weights.bin").write_bytes(os.urandom(4096))
+    with mlflow.start_run() as run:
+        mlflow.log_artifacts(str(model), artifact_path="model")
+    version = mlflow.register_model(f"runs:/{run.info.run_id}/model", MODEL_NAME).version
+    MlflowClient().transition_model_version_stage(MODEL_NAME, version, "Production")
+
+    yield model
+    mlflow.set_tracking_uri(None)
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Counts registry downloads while still performing them."""
+    import mlflow.artifacts
+
+    calls    = []
+    download = mlflow.artifacts.download_artifacts
+    def counting(*args, **kwargs):
+        calls.append(kwargs.get("artifact_uri"))
+        return download(*args, **kwargs)
+    monkeypatch.setattr(mlflow.artifacts, "download_artifacts", counting)
+    return calls
+
+
+def test_resolve_downloads_once_and_verifies(registry, downloads, tmp_path):
+    cache          = ModelArtifactCache(tmp_path / "cache")
+    version, path  = cache.resolve(MODEL_NAME)
+
+    assert version == "1"
+    assert (Path(path) / "data" / "weights.bin").read_bytes() == (registry / "data" / "weights.bin").read_bytes()
+    assert cache.is_valid(MODEL_NAME, version)
+    assert cache.resolve(MODEL_NAME) == (version, path)
+    assert downloads == [f"models:/{MODEL_NAME}/1"]
+    assert not [entry for entry in (tmp_path / "cache" / MODEL_NAME).iterdir() if entry.name.startswith((".tmp", ".stale"))]
+
+
+def test_tampered_copy_is_replaced(registry, downloads, tmp_path):
+    cache    = ModelArtifactCache(tmp_path / "cache")
+    path     = Path(cache.fetch(MODEL_NAME, "1"))
+    original = (path / "data" / "weights.bin").read_bytes()
+
+    (path / "data" / "weights.bin").write_bytes(b"truncated")
+    assert not cache.is_valid(MODEL_NAME, "1")
+
+    path = Path(cache.fetch(MODEL_NAME, "1"))
+    assert (path / "data" / "weights.bin").read_bytes() == original
+    assert cache.is_valid(MODEL_NAME, "1")
+    assert len(downloads) == 2
+
+
+def test_published_copy_is_never_replaced(registry, tmp_path):
+    cache       = ModelArtifactCache(tmp_path / "cache")
+    cache.fetch(MODEL_NAME, "1")
+    version_dir = cache._version_dir(MODEL_NAME, "1")
+    inode       = version_dir.stat().st_ino
+
+    cache._download(MODEL_NAME, "1")                               # A racing process finishing after the first publish
+    assert version_dir.stat().st_ino == inode
+    assert cache.is_valid(MODEL_NAME, "1")
+
+
+def test_cached_copy_serves_when_registry_is_down(registry, tmp_path, monkeypatch):
+    cache = ModelArtifactCache(tmp_path / "cache")
+    _, path = cache.resolve(MODEL_NAME)
+
+    def unreachable(*args, **kwargs):
+        raise ConnectionError("registry down")
+    monkeypatch.setattr(ModelArtifactCache, "latest_version", staticmethod(unreachable))
+
+    assert cache.resolve(MODEL_NAME) == ("1", path)
+    with pytest.raises(RuntimeError):
+        ModelArtifactCache(tmp_path / "empty").resolve(MODEL_NAME)
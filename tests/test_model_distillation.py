@@ -0,0 +1,83 @@
+import json
+import shutil
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from cnnClassifier.components.model_distillation         import Distiller, logits_fn, _kl_divergence
+from cnnClassifier.pipeline.stage_03b_model_distillation import ModelDistillationPipeline
+from conftest                                            import ROOT
+
+
+def _student():
+    tf.keras.utils.set_random_seed(0)
+    inputs = tf.keras.Input((6,))
+    hidden = tf.keras.layers.Dense(8, activation="relu")(inputs)
+    return tf.keras.Model(inputs, tf.keras.layers.Dense(3, activation="softmax")(hidden))
+
+
+def _softmax(logits):
+    exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def _batch():
+    rng = np.random.default_rng(0)
+    return (rng.normal(size=(5, 6)).astype(np.float32), np.eye(3, dtype=np.float32)[rng.integers(0, 3, 5)],
+            rng.normal(scale=3.0, size=(5, 3)).astype(np.float32))
+
+
+def test_stage_is_skipped_unless_distill_is_on(tmp_path, monkeypatch):
+    shutil.copytree(ROOT / "config", tmp_path / "config")
+    shutil.copy(ROOT / "params.yaml", tmp_path / "params.yaml")
+    monkeypatch.chdir(tmp_path)
+
+    ModelDistillationPipeline().main()                            # No teacher, data or registry needed when skipped
+    assert json.loads((tmp_path / "scores_student.json").read_text()) == {"skipped": True}
+    assert not (tmp_path / "artifacts" / "distillation" / "student_model.h5").exists()
+
+
+def test_kl_divergence_matches_its_definition():
+    teacher, student = _batch()[2], np.random.default_rng(1).normal(size=(5, 3)).astype(np.float32)
+    p, q             = _softmax(teacher), _softmax(student)
+
+    np.testing.assert_allclose(_kl_divergence(teacher, student), (p * np.log(p / q)).sum(axis=-1), rtol=1e-5)
+    np.testing.assert_allclose(_kl_divergence(teacher, teacher + 7.0), 0.0, atol=1e-6)   # Softmax ignores a shift
+    assert (_kl_divergence(teacher, student).numpy() > 0).all()
+
+
+def test_logits_fn_returns_the_pre_softmax_output():
+    student = _student()
+    images  = _batch()[0]
+    np.testing.assert_allclose(tf.nn.softmax(logits_fn(student)(images)), student(images), rtol=1e-5, atol=1e-7)
+
+    inputs = tf.keras.Input((6,))
+    with pytest.raises(ValueError, match="softmax Dense output layer"):
+        logits_fn(tf.keras.Model(inputs, tf.keras.layers.Dense(3)(inputs)))
+
+
+@pytest.mark.parametrize("alpha, temperature", [(1.0, 4.0), (0.0, 4.0), (0.3, 2.0)])
+def test_train_step_loss_follows_the_distillation_formula(alpha, temperature):
+    images, labels, teacher = _batch()
+    student                 = _student()
+    logits                  = logits_fn(student)(images).numpy()
+
+    hard     = -(labels * np.log(_softmax(logits))).sum(axis=-1)
+    p, q     = _softmax(teacher / temperature), _softmax(logits / temperature)
+    soft     = (p * np.log(p / q)).sum(axis=-1)
+    expected = np.mean(alpha * hard + (1.0 - alpha) * temperature ** 2 * soft)
+
+    distiller = Distiller(student, temperature, alpha)
+    distiller.compile(optimizer=tf.keras.optimizers.SGD(0.0))     # Loss of the current weights, no update
+    loss      = distiller.train_on_batch(images, (labels, teacher), return_dict=True)["loss"]
+    assert loss == pytest.approx(expected, rel=1e-4)
+
+
+def test_matching_teacher_gives_zero_soft_loss():
+    images, labels, _ = _batch()
+    student           = _student()
+    distiller         = Distiller(student, temperature=3.0, alpha=0.0)
+    distiller.compile(optimizer=tf.keras.optimizers.SGD(0.0))
+    teacher           = logits_fn(student)(images).numpy()
+
+    assert distiller.train_on_batch(images, (labels, teacher), return_dict=True)["loss"] == pytest.approx(0.0, abs=1e-5)
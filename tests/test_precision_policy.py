@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from cnnClassifier.components.prepare_base_model import PrepareBaseModel
+from cnnClassifier.utils.common                  import apply_precision_policy
+
+
+def _model():
+    tf.keras.utils.set_random_seed(0)
+    inputs = tf.keras.Input((8,))
+    hidden = tf.keras.layers.Dense(16, activation="relu", name="hidden")(inputs)
+    output = tf.keras.layers.Dense(3, activation="softmax", name="output")(hidden)
+    model  = tf.keras.Model(inputs, output)
+    model.get_layer("hidden").trainable = False
+    return model
+
+
+def test_mixed_policy_keeps_the_output_layer_float32():
+    model     = _model()
+    converted = apply_precision_policy(model, "mixed_bfloat16")
+    hidden    = converted.get_layer("hidden")
+
+    assert (hidden.compute_dtype, hidden.variable_dtype) == ("bfloat16", "float32")
+    assert converted.get_layer("output").dtype_policy.name == "float32"
+    assert not hidden.trainable and converted.get_layer("output").trainable
+    for weight, expected in zip(converted.get_weights(), model.get_weights()):
+        np.testing.assert_array_equal(weight, expected)
+
+    batch  = np.random.default_rng(0).normal(size=(4, 8)).astype(np.float32)
+    output = converted(batch)
+    assert output.dtype == tf.float32
+    np.testing.assert_allclose(output, model(batch), atol=2e-2)  # bfloat16 keeps 8 mantissa bits
+
+
+def test_matching_policy_returns_the_model_unchanged():
+    model = _model()
+    assert apply_precision_policy(model, "float32") is model
+
+    converted = apply_precision_policy(model, "mixed_bfloat16")
+    assert apply_precision_policy(converted, "mixed_bfloat16") is converted
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported precision policy"):
+        apply_precision_policy(_model(), "float8")
+
+
+def test_prepared_model_trains_under_xla_and_mixed_precision():
+    tf.keras.utils.set_random_seed(0)
+    inputs   = tf.keras.Input((16, 16, 3))
+    backbone = tf.keras.Model(inputs, tf.keras.layers.Conv2D(4, 3, name="conv")(inputs))
+    model    = PrepareBaseModel._prepare_full_model(backbone, classes=3, freeze_all=False, freeze_till=0, learning_rate=0.01,
+                                                    jit_compile=True, precision="mixed_bfloat16", head_type="gap", head_units=8)
+
+    assert model.jit_compile
+    assert model.get_layer("conv").compute_dtype == "bfloat16"
+    assert model.layers[-1].compute_dtype == "float32"
+
+    rng    = np.random.default_rng(0)
+    images = rng.uniform(size=(8, 16, 16, 3)).astype(np.float32)
+    labels = np.eye(3, dtype=np.float32)[rng.integers(0, 3, 8)]
+    loss   = model.fit(images, labels, batch_size=4, epochs=2, verbose=0).history["loss"]
+    assert np.isfinite(loss).all()
+    assert model.predict(images, verbose=0).dtype == np.float32
@@ -0,0 +1,133 @@
+import time
+import threading
+import pytest
+
+from cnnClassifier.components.prediction_cache import PredictionCache
+
+
+class TurnedAway(Exception):
+    pass
+
+
+def test_miss_then_hit():
+    cache = PredictionCache()
+    calls = []
+    for _ in range(3):
+        assert cache.get_or_compute(b"image", lambda: calls.append(1) or "result") == "result"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_concurrent_identical_requests_share_one_computation():
+    cache   = PredictionCache()
+    release = threading.Event()
+    calls   = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute(b"image", compute))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while cache.stats()["coalesced"] < 3:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+
+
+def test_new_model_version_invalidates_and_drops_stale_results():
+    cache = PredictionCache()
+    cache.set_model_version("1")
+    cache.get_or_compute(b"image", lambda: "v1")
+
+    cache.set_model_version("2")
+    assert cache.stats()["entries"] == 0
+    assert cache.get_or_compute(b"image", lambda: "v2") == "v2"
+
+    # A result computed under version 2 that finishes after the switch to 3 is not stored
+    def compute():
+        cache.set_model_version("3")
+        return "v2-late"
+    cache.clear()
+    assert cache.get_or_compute(b"other", compute) == "v2-late"
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_lru_eviction():
+    cache = PredictionCache(max_entries=2)
+    for data in (b"a", b"b", b"a", b"c"):                         # "b" is least recently used when "c" arrives
+        cache.get_or_compute(data, lambda: data)
+    assert cache.stats()["evictions"] == 1
+    assert cache.get_or_compute(b"a", lambda: "recomputed") == b"a"
+    assert cache.get_or_compute(b"b", lambda: "recomputed") == "recomputed"
+
+
+def test_followers_retry_when_the_leader_is_turned_away():
+    cache   = PredictionCache(retry_on=(TurnedAway,))
+    started = threading.Event()
+    calls   = []
+
+    def leader():
+        calls.append("leader")
+        started.set()
+        time.sleep(0.2)
+        raise TurnedAway()
+
+    def follower():
+        calls.append("follower")
+        return "result"
+
+    outcomes = {}
+    def run(name, compute):
+        try:
+            outcomes[name] = cache.get_or_compute(b"image", compute, timeout=5)
+        except TurnedAway:
+            outcomes[name] = "turned away"
+
+    threads = [threading.Thread(target=run, args=("leader", leader))]
+    threads[0].start()
+    started.wait(5)
+    threads += [threading.Thread(target=run, args=(f"follower{i}", follower)) for i in range(3)]
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert outcomes.pop("leader") == "turned away"
+    assert set(outcomes.values()) == {"result"}
+    assert calls == ["leader", "follower"]                        # One follower took over, the others joined it
+
+
+def test_other_leader_errors_reach_followers():
+    cache   = PredictionCache(retry_on=(TurnedAway,))
+    started = threading.Event()
+
+    def leader():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("undecodable")
+
+    errors = []
+    def run(compute):
+        try:
+            cache.get_or_compute(b"image", compute, timeout=5)
+        except ValueError as e:
+            errors.append(str(e))
+
+    first = threading.Thread(target=run, args=(leader,))
+    first.start()
+    started.wait(5)
+    second = threading.Thread(target=run, args=(lambda: pytest.fail("follower must not recompute"),))
+    second.start()
+    first.join(5)
+    second.join(5)
+
+    assert errors == ["undecodable", "undecodable"]
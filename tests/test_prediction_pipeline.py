@@ -0,0 +1,60 @@
+import dataclasses
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from io import BytesIO
+from PIL import Image
+
+from cnnClassifier.pipeline.prediction import PredictionPipeline
+
+LABELS = ["a_cls", "b_cls", "c_cls"]
+
+
+@pytest.fixture(scope="module")
+def params(tmp_path_factory):
+    path = tmp_path_factory.mktemp("params") / "params.yaml"
+    path.write_text("IMAGE_SIZE: [24, 20, 3]\nCLASS_LABELS: [a_cls, b_cls, c_cls]\nMIXED_PRECISION: float32\nJIT_COMPILE: False\n")
+    return path
+
+
+@pytest.fixture(scope="module")
+def model():
+    """Predicts the class of the brightest colour channel."""
+    inputs = tf.keras.Input((24, 20, 3))
+    x      = tf.keras.layers.GlobalAveragePooling2D()(inputs)
+    return tf.keras.Model(inputs, tf.keras.layers.Softmax()(tf.keras.layers.Lambda(lambda v: v * 100.0)(x)))
+
+
+def _png(color) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (40, 30), color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_plan_resolves_config_once(model, params):
+    pipeline = PredictionPipeline(model=model, params_filepath=params)
+    assert pipeline.plan.image_size == (24, 20)
+    assert pipeline.plan.class_labels == tuple(LABELS)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        pipeline.plan.image_size = (1, 1)                         # Shared by concurrent requests
+
+
+def test_one_trace_serves_every_batch_size(model, params):
+    pipeline = PredictionPipeline(model=model, params_filepath=params)
+    pipeline.warmup([1, 2, 4])
+    pipeline.predict_batch(np.zeros((3, 24, 20, 3), np.float32))
+    assert pipeline.plan.forward.experimental_get_tracing_count() == 1
+
+
+def test_bytes_arrays_and_batches_predict_alike(model, params):
+    pipeline = PredictionPipeline(model=model, params_filepath=params)
+    images   = [pipeline.preprocess(_png(color)) for color in ((200, 0, 0), (0, 0, 200), (0, 200, 0))]
+
+    assert images[0].shape == (24, 20, 3) and 0.0 <= images[0].min() and images[0].max() <= 1.0
+    assert pipeline.predict_batch(np.stack(images)) == [[{"image": "a_cls"}], [{"image": "c_cls"}], [{"image": "b_cls"}]]
+    assert pipeline.predict(_png((0, 0, 200))) == [{"image": "c_cls"}]
+    assert pipeline.predict(np.full((24, 20, 3), (0, 255, 0), np.uint8)) == [{"image": "b_cls"}]
+
+    with pytest.raises(ValueError):
+        pipeline.predict(np.zeros((10, 10, 3), np.uint8))
@@ -0,0 +1,48 @@
+import pytest
+import tensorflow as tf
+
+from cnnClassifier.components.backbones          import build_backbone
+from cnnClassifier.components.prepare_base_model import PrepareBaseModel
+
+IMAGE_SIZE = [32, 32, 3]
+
+
+def _full_model(backbone="vgg16", **kwargs):
+    options = dict(classes=3, freeze_all=False, freeze_till=0, learning_rate=0.001)
+    options.update(kwargs)
+    return PrepareBaseModel._prepare_full_model(build_backbone(backbone, IMAGE_SIZE, weights=None, include_top=False), **options)
+
+
+@pytest.mark.parametrize("freeze_till", [0, None, 100])
+def test_preprocessing_stays_frozen_when_the_backbone_is_trainable(freeze_till):
+    model         = _full_model(freeze_till=freeze_till)
+    preprocessing = model.get_layer("preprocessing")
+
+    assert not preprocessing.trainable
+    assert not any(weight.name.startswith("preprocessing/") for weight in model.trainable_weights)
+    assert model.get_layer("block1_conv1").trainable
+
+
+def test_backbones_without_a_weighted_preprocessing_layer():
+    model = _full_model("mobilenet_v2")
+    assert isinstance(model.get_layer("preprocessing"), tf.keras.layers.Rescaling)
+    assert model.get_layer("Conv1").trainable
+
+
+@pytest.mark.parametrize("head_type, expected", [
+    ("flatten_dense", 7 * 7 * 512 * 256 + 256),
+    ("gap",           512 * 256 + 256),
+    ("gmp",           512 * 256 + 256),
+    ("low_rank",      7 * 7 * 512 * 32 + 32 * 256 + 256),
+    ("depthwise",     7 * 7 * 512 + 512 + 512 * 256 + 256),
+])
+def test_head_parameter_counts_on_the_vgg16_feature_map(head_type, expected):
+    features = tf.keras.Input((7, 7, 512))
+    head     = tf.keras.Model(features, PrepareBaseModel._classification_head(features, head_type, units=256, rank=32))
+    assert head.output_shape == (None, 256)
+    assert head.count_params() == expected
+
+
+def test_unknown_head_type_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported HEAD_TYPE"):
+        _full_model(head_type="attention")
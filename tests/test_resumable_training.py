@@ -0,0 +1,107 @@
+import dataclasses
+import shutil
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from cnnClassifier.config.configuration        import ConfigurationManager
+from cnnClassifier.components.model_trainer    import Training
+from conftest                                  import ROOT
+
+STEPS  = 6
+EPOCHS = 3
+
+
+class Interrupted(Exception):
+    pass
+
+
+class Recorder(tf.keras.callbacks.Callback):
+    """Records (epoch, batch) of every step, the weights when fit starts, and optionally interrupts or stops."""
+    def __init__(self, interrupt_at=None, stop_after_epoch=None):
+        super().__init__()
+        self.interrupt_at, self.stop_after_epoch = interrupt_at, stop_after_epoch
+        self.steps, self.start_weights = [], []
+
+    def on_train_begin(self, logs=None):
+        self.start_weights.append(self.model.get_weights())
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.epoch = epoch
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.steps.append((self.epoch, batch))
+        if (self.epoch, batch) == self.interrupt_at:
+            raise Interrupted()
+
+    def on_epoch_end(self, epoch, logs=None):
+        if epoch == self.stop_after_epoch:
+            self.model.stop_training = True
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    shutil.copytree(ROOT / "config", tmp_path / "config")
+    shutil.copy(ROOT / "params.yaml", tmp_path / "params.yaml")
+    monkeypatch.chdir(tmp_path)
+    return dataclasses.replace(ConfigurationManager().get_training_config(),
+                               params_checkpoint_every=2, params_profile_training=False, params_distribution="none")
+
+
+def _trainer(config) -> Training:
+    tf.keras.utils.set_random_seed(0)
+    trainer       = Training(config)
+    inputs        = tf.keras.Input((4,))
+    trainer.model = tf.keras.Model(inputs, tf.keras.layers.Dense(2, activation="softmax")(inputs))
+    trainer.model.compile(optimizer=tf.keras.optimizers.Adam(0.01), loss="categorical_crossentropy")
+    return trainer
+
+
+def _data():
+    rng    = np.random.default_rng(0)
+    images = rng.normal(size=(STEPS * 4, 4)).astype(np.float32)
+    labels = np.eye(2, dtype=np.float32)[rng.integers(0, 2, STEPS * 4)]
+    return tf.data.Dataset.from_tensor_slices((images, labels)).batch(4).repeat()
+
+
+def _interrupted_run(config):
+    """Head phase stopped during step 5 of epoch 1; the last checkpoint is at step 4."""
+    trainer  = _trainer(config)
+    recorder = Recorder(interrupt_at=(1, 4))
+    saved    = []
+    class Snapshot(tf.keras.callbacks.Callback):
+        def on_train_batch_end(self, batch, logs=None):
+            if (recorder.epoch, batch) == (1, 3):
+                saved.append(self.model.get_weights())
+    with pytest.raises(Interrupted):
+        trainer.fit_resumable(trainer.model, _data(), "head", EPOCHS, steps_per_epoch=STEPS, callbacks=[recorder, Snapshot()])
+    return saved[0]
+
+
+def test_resume_finishes_the_interrupted_epoch_then_continues(config):
+    saved   = _interrupted_run(config)
+    trainer = _trainer(config)
+    resume  = trainer.checkpoint.resume_point()
+    assert {key: resume[key] for key in ("phase", "epoch", "step")} == {"phase": "head", "epoch": 1, "step": 4}
+
+    recorder = Recorder()
+    trainer.fit_resumable(trainer.model, _data(), "head", EPOCHS, resume=resume, steps_per_epoch=STEPS, callbacks=[recorder])
+
+    for restored, expected in zip(recorder.start_weights[0], saved):
+        np.testing.assert_array_equal(restored, expected)
+    assert recorder.steps == [(1, 0), (1, 1)] + [(2, batch) for batch in range(STEPS)]   # Remaining 2 steps, then epoch 2
+
+
+def test_stop_training_in_the_resumed_epoch_ends_the_phase(config):
+    _interrupted_run(config)
+    trainer  = _trainer(config)
+    recorder = Recorder(stop_after_epoch=1)                         # e.g. EarlyStopping at the end of the partial epoch
+    trainer.fit_resumable(trainer.model, _data(), "head", EPOCHS, resume=trainer.checkpoint.resume_point(),
+                          steps_per_epoch=STEPS, callbacks=[recorder])
+    assert recorder.steps == [(1, 0), (1, 1)]
+    assert len(recorder.start_weights) == 1                         # No second fit
+
+    # The flag left on the model does not skip the next phase
+    recorder = Recorder()
+    trainer.fit_resumable(trainer.model, _data(), "fine", 1, steps_per_epoch=STEPS, callbacks=[recorder])
+    assert recorder.steps == [(0, batch) for batch in range(STEPS)]
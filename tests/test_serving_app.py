@@ -0,0 +1,166 @@
+import base64
+import importlib.util
+import shutil
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from io       import BytesIO
+from PIL      import Image
+
+from cnnClassifier.components.model_quantization import ModelQuantization
+from cnnClassifier.pipeline.prediction           import PredictionPipeline, TFLiteModel
+from conftest                                    import ROOT
+
+spec        = importlib.util.spec_from_file_location("app", ROOT / "app.py")
+serving_app = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(serving_app)
+
+
+class Registry:
+    """Stands in for ModelArtifactCache: `version` is the Production version, None while unreachable."""
+    def __init__(self, version=None):
+        self.version = version
+
+    def latest_version(self, registered_model_name, stage="Production"):
+        if self.version is None:
+            raise ConnectionError("registry down")
+        return self.version
+
+    def fetch(self, registered_model_name, model_version):
+        return f"versions/{model_version}"
+
+    def resolve(self, registered_model_name, stage="Production"):
+        version = self.latest_version(registered_model_name, stage)
+        return version, self.fetch(registered_model_name, version)
+
+
+def constant_model(class_index: int) -> tf.keras.Model:
+    """Input-independent model that always predicts `class_index`."""
+    inputs = tf.keras.layers.Input((224, 224, 3))
+    dense  = tf.keras.layers.Dense(5, activation="softmax", kernel_initializer="zeros",
+                                   bias_initializer=tf.keras.initializers.Constant(np.eye(5)[class_index]))
+    return tf.keras.Model(inputs, dense(tf.keras.layers.GlobalAveragePooling2D()(inputs)))
+
+
+@pytest.fixture
+def client_app(tmp_path, monkeypatch):
+    """ClientApp with a registry that is down at startup; version N serves constant_model(N)."""
+    shutil.copytree(ROOT / "config", tmp_path / "config")
+    shutil.copy(ROOT / "params.yaml", tmp_path / "params.yaml")
+    monkeypatch.chdir(tmp_path)
+
+    client             = serving_app.ClientApp(load=False)
+    client.model_cache = Registry()
+    client.watcher     = serving_app.ModelWatcher(client, poll_interval_s=3600)   # Checked by hand below
+    client.build_classifier = lambda local_path: PredictionPipeline(model=constant_model(int(local_path.split("/")[-1])))
+    client.load_model()
+    client.start()
+    monkeypatch.setattr(serving_app, "clApp", client)
+
+    yield client
+    client.batcher.close()
+
+
+@pytest.fixture
+def ready_app(client_app):
+    """client_app once version 1 (always class 1, "colon_normal") is up."""
+    client_app.model_cache.version = "1"
+    assert client_app.watcher.check()
+    return client_app
+
+
+@pytest.fixture
+def http():
+    return serving_app.app.test_client()
+
+
+def _png(color=(10, 200, 30)) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (40, 30), color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_health_without_client_app_reports_not_ready(http, monkeypatch):
+    monkeypatch.setattr(serving_app, "clApp", None)
+    response = http.get("/health")
+    assert response.status_code == 503
+    assert response.get_json() == {"model_loaded": False, "ready": False, "model_version": None, "reload": None}
+
+
+def test_failed_startup_recovers_through_the_watcher(client_app, http):
+    assert http.get("/readyz").status_code == 503
+    assert http.get("/health").status_code == 503
+    assert http.post("/predict/binary", data=b"image", content_type="image/png").status_code == 503
+
+    assert not client_app.watcher.check()                         # Registry still down: stays not ready
+    assert not client_app.ready.is_set()
+
+    client_app.model_cache.version = "1"
+    assert client_app.watcher.check()
+    assert http.get("/readyz").status_code == 200
+
+    health = http.get("/health")
+    assert health.status_code == 200
+    assert health.get_json()["model_loaded"] and health.get_json()["model_version"] == "1"
+
+
+def test_tflite_backend_loads_the_variant_of_the_resolved_version(client_app, tmp_path):
+    del client_app.build_classifier                               # The real one, for the configured tflite_float32 backend
+    version_dir        = tmp_path / "versions" / "2"
+    (version_dir / "tflite").mkdir(parents=True)
+    quantization       = ModelQuantization(config=None)
+    quantization.model = constant_model(2)
+    (version_dir / "tflite" / "model_float32.tflite").write_bytes(quantization.convert("float32"))
+
+    classifier = client_app.build_classifier(str(version_dir))
+    assert isinstance(classifier.model, TFLiteModel)
+    assert classifier.predict_batch(np.zeros((3, 224, 224, 3), np.float32)) == [[{"image": "lung_adenocarcinoma"}]] * 3
+
+    with pytest.raises(FileNotFoundError, match="model_float32.tflite"):
+        client_app.build_classifier(str(tmp_path / "versions" / "1"))
+
+
+def test_binary_endpoint_accepts_raw_and_multipart_bodies(ready_app, http):
+    expected  = [{"image": "colon_normal"}]
+    raw       = http.post("/predict/binary", data=_png(), content_type="image/png")
+    multipart = http.post("/predict/binary", data={"image": (BytesIO(_png((1, 2, 3))), "scan.png")},
+                          content_type="multipart/form-data")
+    other     = http.post("/predict/binary", data={"upload": (BytesIO(_png((4, 5, 6))), "scan.png")},
+                          content_type="multipart/form-data")
+    json_body = http.post("/predict", json={"image": base64.b64encode(_png((7, 8, 9))).decode("ascii")})
+
+    for response in (raw, multipart, other, json_body):
+        assert response.status_code == 200 and response.get_json() == expected
+    assert ready_app.cache.stats()["misses"] == 4
+
+
+def test_binary_endpoint_rejects_bad_uploads(ready_app, http):
+    assert http.post("/predict/binary", data=b"", content_type="image/png").status_code == 400
+    assert http.post("/predict/binary", data=b"not an image", content_type="image/jpeg").status_code == 400
+    assert http.post("/predict/binary", data={"note": "no file"}, content_type="multipart/form-data").status_code == 400
+    assert http.post("/predict/binary", data=_png(), content_type="text/plain").status_code == 415
+
+
+def test_watcher_swap_updates_version_and_clears_the_cache(ready_app, http):
+    assert http.post("/predict/binary", data=_png(), content_type="image/png").get_json() == [{"image": "colon_normal"}]
+    assert ready_app.cache.stats()["entries"] == 1
+    assert not ready_app.watcher.check()                          # Same version: nothing reloaded
+
+    ready_app.model_cache.version = "3"
+    assert ready_app.watcher.check()
+    assert ready_app.model_version == "3" and ready_app.cache.stats()["entries"] == 0
+    assert http.post("/predict/binary", data=_png(), content_type="image/png").get_json() == [{"image": "lung_normal"}]
+    info = [line for line in http.get("/metrics").text.splitlines() if line.startswith("cnn_model_version_info{")]
+    assert len(info) == 1 and 'version="3"' in info[0]
+
+    # A version that fails to load is not swapped in
+    def corrupt(local_path):
+        raise OSError("corrupt download")
+    ready_app.build_classifier    = corrupt
+    ready_app.model_cache.version = "4"
+    assert not ready_app.watcher.check()
+
+    reload = http.get("/health").get_json()["reload"]
+    assert ready_app.model_version == "3" and ready_app.ready.is_set()
+    assert (reload["reloads"], reload["failed_swaps"], reload["last_error"]) == (2, 1, "corrupt download")
@@ -0,0 +1,69 @@
+import os
+
+from cnnClassifier.components.serving_metrics import ServingMetrics
+
+PID = f'pid="{os.getpid()}"'
+
+
+def _samples(text: str) -> dict:
+    """Sample lines of a Prometheus text exposition, as {"name{labels}": value} without this process's pid label."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            assert PID in name
+            name = name.replace("{" + PID + "}", "").replace(PID + ",", "")
+            samples[name] = float(value)
+    return samples
+
+
+def test_every_metric_has_help_and_type():
+    text  = ServingMetrics().render()
+    names = [line.split()[2] for line in text.splitlines() if line.startswith("# TYPE")]
+    helps = [line.split()[2] for line in text.splitlines() if line.startswith("# HELP")]
+    assert names == helps
+    assert len(names) == len(set(names)) == 9
+    assert text.endswith("\n")
+
+
+def test_histogram_buckets_are_cumulative_with_sum_and_count():
+    metrics = ServingMetrics()
+    metrics.observe_batch(3, 0.004)
+    metrics.observe_batch(8, 0.2)
+    samples = _samples(metrics.render())
+
+    assert samples['cnn_batch_size_bucket{le="2"}']    == 0
+    assert samples['cnn_batch_size_bucket{le="4"}']    == 1
+    assert samples['cnn_batch_size_bucket{le="8"}']    == 2       # Upper bounds are inclusive
+    assert samples['cnn_batch_size_bucket{le="+Inf"}'] == 2
+    assert samples["cnn_batch_size_count"]             == 2
+    assert samples["cnn_batch_size_sum"]               == 11
+    assert samples['cnn_stage_duration_seconds_bucket{stage="model_forward",le="0.005"}'] == 1
+    assert samples["cnn_batches_total"]                == 2
+
+
+def test_counters_labels_and_gauges():
+    metrics = ServingMetrics(queue_depth_fn=lambda: 5)
+    metrics.observe_request("/predict", 200, 0.01)
+    metrics.observe_request("/predict", 429, 0.001)
+    metrics.rejections.inc(reason="queue_full")
+    metrics.model_version.replace(1, version="3", backend="keras")
+    metrics.model_version.replace(1, version="4", backend='say "hi"')
+    samples = _samples(metrics.render())
+
+    assert samples['cnn_requests_total{route="/predict",status="200"}'] == 1
+    assert samples['cnn_requests_total{route="/predict",status="429"}'] == 1
+    assert samples['cnn_request_errors_total{route="/predict"}']        == 1
+    assert samples['cnn_rejected_requests_total{reason="queue_full"}']  == 1
+    assert samples["cnn_queue_depth"]                                   == 5
+    assert samples['cnn_model_version_info{backend="say \\"hi\\"",version="4"}'] == 1
+    assert not any(key.startswith("cnn_model_version_info") and 'version="3"' in key for key in samples)
+
+
+def test_every_series_is_labelled_with_the_worker_pid():
+    metrics = ServingMetrics()
+    metrics.observe_batch(1, 0.001)
+    lines   = [line for line in metrics.render().splitlines() if line and not line.startswith("#")]
+    assert f'cnn_batch_size_bucket{{{PID},le="1"}} 1' in lines
+    assert f"cnn_queue_depth{{{PID}}} 0" in lines
+    assert all(PID in line for line in lines)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from cnnClassifier.components.model_quantization import ModelQuantization
+from cnnClassifier.pipeline.prediction           import TFLiteModel
+
+IMAGE_SIZE = [24, 20, 3]
+
+
+@pytest.fixture(scope="module")
+def keras_model():
+    tf.keras.utils.set_random_seed(0)
+    inputs = tf.keras.Input(IMAGE_SIZE)
+    x      = tf.keras.layers.Conv2D(8, 3, activation="relu")(inputs)
+    x      = tf.keras.layers.GlobalAveragePooling2D()(x)
+    return tf.keras.Model(inputs, tf.keras.layers.Dense(5, activation="softmax")(x))
+
+
+def _export(model, variant, directory):
+    quantization                         = ModelQuantization(config=None)
+    quantization.model                   = model
+    quantization._representative_dataset = lambda: ([image[None]] for image in _images(32))   # int8 calibration
+    path                                 = directory / f"model_{variant}.tflite"
+    path.write_bytes(quantization.convert(variant))
+    return path
+
+
+def _images(count=6):
+    return np.random.default_rng(1).random((count, *IMAGE_SIZE), dtype=np.float32)
+
+
+def test_float32_variant_is_memory_mapped_and_matches_keras(keras_model, tmp_path):
+    path  = _export(keras_model, "float32", tmp_path)
+    model = TFLiteModel(path, num_threads=1)
+
+    with open("/proc/self/maps") as f:
+        mappings = [line for line in f if line.rstrip().endswith(str(path))]
+    assert mappings and all(line.split()[1].startswith("r") and "w" not in line.split()[1] for line in mappings)
+
+    np.testing.assert_allclose(model(_images()), keras_model(_images()).numpy(), atol=1e-5)
+    np.testing.assert_allclose(model(_images(1)), keras_model(_images(1)).numpy(), atol=1e-5)   # Resized input
+
+
+@pytest.mark.parametrize("variant, atol", [("dynamic_range", 0.02), ("float16", 0.005), ("int8", 0.05)])
+def test_quantized_variants_track_keras(keras_model, tmp_path, variant, atol):
+    probabilities = TFLiteModel(_export(keras_model, variant, tmp_path))(_images())
+    assert probabilities.dtype == np.float32 and probabilities.shape == (6, 5)
+    np.testing.assert_allclose(probabilities, keras_model(_images()).numpy(), atol=atol)
+
+
+def test_unknown_variant_is_rejected(keras_model):
+    quantization       = ModelQuantization(config=None)
+    quantization.model = keras_model
+    with pytest.raises(ValueError, match="Unsupported quantization variant"):
+        quantization.convert("int4")
@@ -0,0 +1,59 @@
+import os
+import shutil
+import subprocess
+import sys
+import logging
+import pytest
+
+from cnnClassifier.config.configuration import ConfigurationManager
+from cnnClassifier.utils.common         import configure_tf_threading
+from conftest                           import ROOT
+
+PROBE = """
+import os, sys
+from cnnClassifier.utils.common import configure_tf_threading
+assert "tensorflow" not in sys.modules
+configure_tf_threading(3, 1, onednn_opts=False)
+import tensorflow as tf
+print(os.environ["TF_ENABLE_ONEDNN_OPTS"], tf.config.threading.get_intra_op_parallelism_threads(),
+      tf.config.threading.get_inter_op_parallelism_threads())
+"""
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    shutil.copytree(ROOT / "config", tmp_path / "config")
+    shutil.copy(ROOT / "params.yaml", tmp_path / "params.yaml")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("cores, workers, expected", [(8, "3", 2), (8, "1", 8), (2, "4", 1)])
+def test_auto_intra_op_splits_cores_between_workers(config_dir, monkeypatch, cores, workers, expected):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(cores)), raising=False)
+    monkeypatch.setenv("WEB_CONCURRENCY", workers)
+    config = ConfigurationManager().get_serving_config()
+    assert (config.intra_op_threads, config.inter_op_threads) == (expected, 1)
+
+
+def test_settings_apply_before_tensorflow_is_imported(tmp_path):
+    env    = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), str(ROOT)]), "TF_CPP_MIN_LOG_LEVEL": "3"}
+    env.pop("TF_ENABLE_ONEDNN_OPTS", None)
+    result = subprocess.run([sys.executable, "-c", PROBE], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1].split() == ["0", "3", "1"]      # Log lines come first
+
+
+def test_late_settings_are_logged_not_raised(monkeypatch, caplog):
+    import tensorflow as tf
+
+    tf.constant(1.0) + 1.0                                        # Runtime initialised by now
+    monkeypatch.setenv("TF_ENABLE_ONEDNN_OPTS", "1")
+    intra = tf.config.threading.get_intra_op_parallelism_threads()
+    with caplog.at_level(logging.WARNING):
+        configure_tf_threading(intra + 1, 0, onednn_opts=False)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("TF_ENABLE_ONEDNN_OPTS=0 before start-up" in message for message in messages)
+    assert any("thread settings left unchanged" in message for message in messages)
+    assert tf.config.threading.get_intra_op_parallelism_threads() == intra
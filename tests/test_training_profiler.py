@@ -0,0 +1,89 @@
+import json
+import time
+import numpy as np
+import tensorflow as tf
+
+from cnnClassifier.components.training_profiler import TrainingProfiler
+
+STEPS      = 6
+BATCH_SIZE = 4
+
+
+class Batches(tf.keras.utils.Sequence):
+    def __init__(self, delay_s=0.0):
+        self.delay_s = delay_s
+
+    def __len__(self):
+        return STEPS
+
+    def __getitem__(self, index):
+        time.sleep(self.delay_s)
+        rng = np.random.default_rng(index)
+        return rng.normal(size=(BATCH_SIZE, 4)).astype(np.float32), np.eye(2, dtype=np.float32)[rng.integers(0, 2, BATCH_SIZE)]
+
+
+def _model():
+    inputs = tf.keras.Input((4,))
+    model  = tf.keras.Model(inputs, tf.keras.layers.Dense(2, activation="softmax")(inputs))
+    model.compile(optimizer="sgd", loss="categorical_crossentropy")
+    return model
+
+
+def _dataset(delay_s=0.0):
+    def load(index):
+        time.sleep(delay_s)
+        return np.float32(index)
+    indices = tf.data.Dataset.range(STEPS * BATCH_SIZE)
+    images  = indices.map(lambda i: tf.fill([4], tf.py_function(load, [i], tf.float32)))
+    labels  = indices.map(lambda i: tf.one_hot(i % 2, 2))
+    return tf.data.Dataset.zip((images, labels)).batch(BATCH_SIZE)
+
+
+def test_phases_record_every_step_and_write_a_report(tmp_path):
+    profiler = TrainingProfiler(tmp_path / "profile.json", tmp_path / "trace")
+    for phase, epochs in (("head", 1), ("fine", 2)):
+        _model().fit(profiler.instrument(_dataset()).repeat(), steps_per_epoch=STEPS, epochs=epochs, verbose=0,
+                     callbacks=[profiler.callback(phase, BATCH_SIZE)])
+    profiler.write_report(pipeline="tf_data", batch_size=BATCH_SIZE)
+
+    report = json.loads((tmp_path / "profile.json").read_text())
+    assert report["context"] == {"pipeline": "tf_data", "batch_size": BATCH_SIZE}
+    assert report["trace"] is None
+    assert [report["phases"][phase]["steps"] for phase in ("head", "fine")] == [STEPS, 2 * STEPS]
+    assert [epoch["steps"] for epoch in report["phases"]["fine"]["epochs"]] == [STEPS, STEPS]
+    assert all(images == BATCH_SIZE for images in report["phases"]["fine"]["images"])
+    assert all(wait is not None for wait in report["phases"]["fine"]["data_wait_ms"])
+    assert {"head_step_ms_p50", "fine_images_per_sec", "fine_data_wait_fraction", "peak_rss_mb"} <= set(report["summary"])
+    assert report["summary"]["peak_rss_mb"] > 0
+
+
+def test_slow_input_shows_up_as_data_wait(tmp_path):
+    fractions = {}
+    for delay_s in (0.0, 0.02):
+        profiler = TrainingProfiler(tmp_path / "profile.json", tmp_path / "trace")
+        _model().fit(profiler.instrument(_dataset(delay_s)).repeat(), steps_per_epoch=STEPS, epochs=1, verbose=0,
+                     callbacks=[profiler.callback("head", BATCH_SIZE)])
+        fractions[delay_s] = profiler.summary()["head_data_wait_fraction"]
+
+    assert fractions[0.02] > 0.5                                  # 4 x 20 ms of loading per step dominates
+    assert fractions[0.0] < fractions[0.02]
+
+
+def test_sequences_are_read_through_the_probe(tmp_path):
+    profiler = TrainingProfiler(tmp_path / "profile.json", tmp_path / "trace")
+    _model().fit(profiler.instrument(Batches(delay_s=0.02)), steps_per_epoch=STEPS, epochs=1, verbose=0,
+                 callbacks=[profiler.callback("head", BATCH_SIZE)])
+
+    record = profiler.phases["head"]
+    assert len(record["step_ms"]) == STEPS and record["images"] == [BATCH_SIZE] * STEPS
+    assert all(wait is not None for wait in record["data_wait_ms"])
+
+
+def test_trace_window_is_captured_in_its_phase_only(tmp_path):
+    profiler = TrainingProfiler(tmp_path / "profile.json", tmp_path / "trace", trace_phase="fine", trace_steps=[2, 3])
+    for phase in ("head", "fine"):
+        _model().fit(profiler.instrument(_dataset()).repeat(), steps_per_epoch=STEPS, epochs=1, verbose=0,
+                     callbacks=[profiler.callback(phase, BATCH_SIZE)])
+        assert (tmp_path / "trace").exists() == (phase == "fine")
+
+    assert list((tmp_path / "trace").rglob("*.xplane.pb"))